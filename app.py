@@ -1,12 +1,117 @@
+import hashlib
 import json
 import io
 import os
 import streamlit as st
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from src.resume_ai.pipeline import ResumeProcessor
+from src.resume_ai.pipeline import MEDIA_TYPES, ResumeProcessor, render_resume_bytes
 from src.resume_ai.providers.openai_provider import OpenAIProvider
 from src.resume_ai.providers.groq_provider import GroqProvider
+from src.resume_ai.providers.resilient_provider import ResilientProvider
 from src.resume_ai.config import OpenAISettings
+from src.resume_ai.renderers.pdf_pool import get_pdf_pool
+from src.resume_ai.store import input_key
+
+
+# Builds (and their rendered exports) remembered per browser session
+MAX_SESSION_BUILDS = 10
+
+
+def key_hash(openai_key: str, groq_key: str) -> str:
+    """Cache key for a pair of API keys; the keys themselves never become cache keys."""
+    return hashlib.sha256(f"{openai_key}\0{groq_key}".encode("utf-8")).hexdigest()
+
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def get_llm(provider_name: str, keys: str, _openai_key: str, _groq_key: str) -> ResilientProvider:
+    """Provider chain, and its pooled HTTP clients, shared by every rerun and session using the same keys."""
+    # Underscored arguments are not hashed by Streamlit; ``keys`` stands in for them
+    chain = []
+    if _openai_key:
+        chain.append(OpenAIProvider(OpenAISettings(api_key=_openai_key), max_retries=0))
+    if _groq_key:
+        chain.append(GroqProvider(api_key=_groq_key, max_retries=0))
+    # The chosen provider first, the other as failover
+    if provider_name == "Groq":
+        chain.reverse()
+    return ResilientProvider(chain)
+
+
+@st.cache_resource(show_spinner=False, max_entries=64)
+def get_processor(provider_name: str, keys: str, fast_mode: bool, parallel_rewrite: bool, _llm: ResilientProvider) -> ResumeProcessor:
+    # Exports render through ``start_exports``; the PDF pool starts only when a PDF is first asked for
+    return ResumeProcessor(_llm, fused=fast_mode, section_rewrite=parallel_rewrite)
+
+
+@st.cache_resource(show_spinner=False)
+def get_render_executor() -> ThreadPoolExecutor:
+    # PDFs render in the warm process pool; these threads only wait on it (or build DOCX)
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="export")
+
+
+def start_exports(build_key: str, resume, template: str, formats: list[str]) -> dict[str, Future]:
+    """Render each export of a cached build once, in the background."""
+    exports = st.session_state.setdefault("exports", {})
+    futures = {}
+    for fmt in formats:
+        key = (build_key, template, fmt)
+        if key not in exports:
+            exports[key] = get_render_executor().submit(
+                render_resume_bytes, resume, fmt, template_name=template, pdf_pool=get_pdf_pool() if fmt == "pdf" else None
+            )
+        futures[fmt] = exports[key]
+    return futures
+
+
+def forget_export(build_key: str, template: str, fmt: str) -> None:
+    # A failed render is not cached, so the next rerun tries it again
+    st.session_state["exports"].pop((build_key, template, fmt), None)
+
+
+def forget_old_builds(builds: dict) -> None:
+    exports = st.session_state.setdefault("exports", {})
+    for stale in list(builds)[:-MAX_SESSION_BUILDS]:
+        del builds[stale]
+        for key in [k for k in exports if k[0] == stale]:
+            del exports[key]
+
+
+def show_results(build_key: str, template: str, formats: list[str]) -> None:
+    resume = st.session_state["builds"][build_key]
+    # Exports render while the JSON below is being drawn and reviewed
+    futures = start_exports(build_key, resume, template, formats)
+
+    st.success("✅ Resume generated successfully!")
+
+    # Show structured resume
+    with st.expander("📊 Structured Resume (JSON)", expanded=False):
+        st.json(resume.model_dump())
+
+    # Export section with both download buttons
+    st.subheader("⬇️ Download Your ATS-Friendly Resume")
+    if not futures:
+        st.info("Select PDF and/or DOCX under Export Options to download your resume.")
+        return
+    for column, fmt in zip(st.columns(len(futures)), futures):
+        with column:
+            try:
+                with st.spinner(f"Generating {fmt.upper()}..."):
+                    data = futures[fmt].result()
+                st.download_button(
+                    label=f"📥 {fmt.upper()}",
+                    data=data,
+                    file_name=f"resume.{fmt}",
+                    mime=MEDIA_TYPES[fmt],
+                    use_container_width=True,
+                    key=f"download-{fmt}",
+                )
+            except ImportError:
+                forget_export(build_key, template, fmt)
+                st.warning("⚠️ PDF support requires WeasyPrint. Install with: `pip install weasyprint`")
+            except Exception as e:
+                forget_export(build_key, template, fmt)
+                st.error(f"{fmt.upper()} Error: {str(e)}")
 
 
 def main():
@@ -58,6 +163,16 @@ def main():
             ["minimal", "corporate", "moderate"],
             help="Select a resume template style"
         )
+        fast_mode = st.checkbox(
+            "Fast mode (single AI call)",
+            value=False,
+            help="Extract and polish plain text in one request instead of two"
+        )
+        parallel_rewrite = st.checkbox(
+            "Parallel section rewrite",
+            value=False,
+            help="Polish the summary, each job and each project concurrently (faster for long resumes)"
+        )
         st.divider()
         if not api_key:
             st.warning("⚠️ Please provide an OpenAI or Gemini API key above.")
@@ -104,6 +219,12 @@ def main():
     
     # Generate button
     st.divider()
+    formats = [fmt for fmt, wanted in (("pdf", export_pdf), ("docx", export_docx)) if wanted]
+    # Results are memoized per input, API keys and pipeline options; the template only affects rendering
+    keys = key_hash(openai_key, groq_key)
+    build_key = f"{input_key(raw_input)}:{keys}:{provider_name}:{fast_mode}:{parallel_rewrite}"
+    builds = st.session_state.setdefault("builds", {})
+
     if st.button("✨ Generate Resume", type="primary", use_container_width=True):
         if not raw_input.strip():
             st.error("Please enter your resume data.")
@@ -113,92 +234,65 @@ def main():
             st.error("❌ Please provide an API key (OpenAI or Groq) in the sidebar.")
             return
         
-        try:
-            with st.spinner("🤖 Analyzing your resume with AI..."):
-                # Initialize provider based on which key was provided
-                if provider_name == "OpenAI":
-                    from src.resume_ai.config import OpenAISettings
-                    settings = OpenAISettings(api_key=openai_key)
-                    llm = OpenAIProvider(settings)
-                elif provider_name == "Groq":
-                    llm = GroqProvider(api_key=groq_key)
-                else:
-                    st.error("❌ No API key provided!")
-                    return
-                
-                # Process resume
-                processor = ResumeProcessor(llm, template_name=template)
-                resume = processor.build(raw_input)
-                
-            st.success("✅ Resume generated successfully!")
-            
-            # Show structured resume
-            with st.expander("📊 Structured Resume (JSON)", expanded=False):
-                st.json(resume.model_dump())
-            
-            # Export section with both download buttons
-            st.subheader("⬇️ Download Your ATS-Friendly Resume")
-            col_pdf, col_docx = st.columns(2)
-            
-            with col_pdf:
-                try:
-                    pdf_path = "/tmp/resume.pdf"
-                    with st.spinner("Generating PDF..."):
-                        processor.build(raw_input, output_pdf=pdf_path)
-                    with open(pdf_path, "rb") as f:
-                        pdf_data = f.read()
-                    st.download_button(
-                        label="📥 PDF",
-                        data=pdf_data,
-                        file_name="resume.pdf",
-                        mime="application/pdf",
-                        use_container_width=True
+        if build_key not in builds:
+            try:
+                with st.spinner("🤖 Analyzing your resume with AI..."):
+                    processor = get_processor(
+                        provider_name, keys, fast_mode, parallel_rewrite, get_llm(provider_name, keys, openai_key, groq_key)
                     )
-                except ImportError:
-                    st.warning("⚠️ PDF support requires WeasyPrint. Install with: `pip install weasyprint`")
-                except Exception as e:
-                    st.error(f"PDF Error: {str(e)}")
-            
-            with col_docx:
-                try:
-                    docx_path = "/tmp/resume.docx"
-                    with st.spinner("Generating DOCX..."):
-                        processor.build(raw_input, output_docx=docx_path)
-                    with open(docx_path, "rb") as f:
-                        docx_data = f.read()
-                    st.download_button(
-                        label="📥 DOCX",
-                        data=docx_data,
-                        file_name="resume.docx",
-                        mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-                        use_container_width=True
-                    )
-                except Exception as e:
-                    st.error(f"DOCX Error: {str(e)}")
-        
-        except ValueError as e:
-            st.error(f"❌ API Key Error: {str(e)}")
-            st.info("Ensure your API key is valid and has API credits available.")
-        except RuntimeError as e:
-            error_str = str(e)
-            st.error(f"❌ API Error: {error_str}")
-            if "404" in error_str or "Not Found" in error_str:
-                st.info("💡 Model not found. Please verify your API key is valid for the Gemini API.")
-            elif "rate limit" in error_str.lower():
-                st.info("💡 Rate limit exceeded. Try again later or use a different API key.")
-            else:
+                    status = st.empty()
+                    live_preview = st.empty()
+                    live_sections: dict = {}
+
+                    def show_section(event):
+                        if event.index is None:
+                            live_sections[event.section] = event.value
+                        else:
+                            # Rewrite items overwrite the extraction draft in place
+                            items = live_sections.setdefault(event.section, [])
+                            items[event.index:event.index + 1] = [event.value]
+                        label = "Extracting" if event.stage == "extract" else "Polishing"
+                        status.caption(f"✍️ {label}: {event.section}")
+                        live_preview.json(live_sections)
+
+                    # Process resume, filling in sections as they stream in
+                    builds[build_key] = processor.process_streaming(raw_input, on_section=show_section)
+                    forget_old_builds(builds)
+                    status.empty()
+                    live_preview.empty()
+
+            except ValueError as e:
+                st.error(f"❌ API Key Error: {str(e)}")
+                st.info("Ensure your API key is valid and has API credits available.")
+                return
+            except RuntimeError as e:
+                error_str = str(e)
+                st.error(f"❌ API Error: {error_str}")
+                if "404" in error_str or "Not Found" in error_str:
+                    st.info("💡 Model not found. Please verify your API key is valid for the Gemini API.")
+                elif "rate limit" in error_str.lower():
+                    st.info("💡 Rate limit exceeded after retries. Add a second provider key for automatic failover, or try again later.")
+                else:
+                    st.info("Please check your API key, internet connection, and try again.")
+                return
+            except json.JSONDecodeError as e:
+                st.error(f"❌ JSON Parse Error: {str(e)}")
+                st.info("The AI didn't return valid JSON. Try simplifying your input or try again.")
+                return
+            except Exception as e:
+                error_msg = str(e)
+                if "validation error" in error_msg.lower():
+                    st.error(f"❌ Data Validation Error:\n{error_msg[:500]}")
+                    st.info("Some fields don't match the expected format. Try with simpler data.")
+                else:
+                    st.error(f"❌ Error: {error_msg[:500]}")
                 st.info("Please check your API key, internet connection, and try again.")
-        except json.JSONDecodeError as e:
-            st.error(f"❌ JSON Parse Error: {str(e)}")
-            st.info("The AI didn't return valid JSON. Try simplifying your input or try again.")
-        except Exception as e:
-            error_msg = str(e)
-            if "validation error" in error_msg.lower():
-                st.error(f"❌ Data Validation Error:\n{error_msg[:500]}")
-                st.info("Some fields don't match the expected format. Try with simpler data.")
-            else:
-                st.error(f"❌ Error: {error_msg[:500]}")
-            st.info("Please check your API key, internet connection, and try again.")
+                return
+        st.session_state["shown_build"] = build_key
+
+    # Download clicks rerun the script; the last result stays on screen without rebuilding
+    if st.session_state.get("shown_build") in builds:
+        show_results(st.session_state["shown_build"], template, formats)
     
     st.divider()
     st.markdown(
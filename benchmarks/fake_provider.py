@@ -0,0 +1,90 @@
+"""Deterministic offline stand-in for a live LLM provider."""
+
+import asyncio
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import AsyncIterator, Iterator, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from resume_ai.json_extract import find_json_object
+from resume_ai.providers.base import LLMProvider
+
+SAMPLES_DIR = Path(__file__).resolve().parent.parent / "samples"
+INPUT_MARKER = "INPUT JSON:"
+
+
+def default_resume_json() -> str:
+    return (SAMPLES_DIR / "sample_structured.json").read_text(encoding="utf-8")
+
+
+class FakeProvider(LLMProvider):
+    """Canned completions with a fixed, configurable latency.
+
+    Rewrite-style prompts (anything carrying an ``INPUT JSON:`` block) get
+    their input echoed back unchanged; every other prompt gets the canned
+    resume. ``responses`` maps a system prompt to a recorded completion
+    and takes precedence over both.
+    """
+
+    name = "fake"
+
+    def __init__(
+        self,
+        *,
+        latency: float = 0.0,
+        resume_json: Optional[str] = None,
+        responses: Optional[dict[str, str]] = None,
+        chunk_size: int = 64,
+    ):
+        self.latency = latency
+        self.resume_json = resume_json or default_resume_json()
+        self.responses = dict(responses or {})
+        self.chunk_size = chunk_size
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_recording(cls, path: Path, **kwargs) -> "FakeProvider":
+        """Load ``{system_prompt: completion}`` pairs saved from a real run."""
+        return cls(responses=json.loads(Path(path).read_text(encoding="utf-8")), **kwargs)
+
+    @property
+    def model(self) -> str:
+        return "fake-1"
+
+    def _respond(self, system_prompt: str, user_prompt: str) -> str:
+        with self._lock:
+            self.calls += 1
+        if system_prompt in self.responses:
+            return self.responses[system_prompt]
+        marker = user_prompt.find(INPUT_MARKER)
+        if marker >= 0:
+            tail = user_prompt[marker + len(INPUT_MARKER):]
+            span = find_json_object(tail)
+            if span is not None and span[2]:
+                return tail[span[0]:span[1]]
+        return self.resume_json
+
+    def complete(self, *, system_prompt: str, user_prompt: str, temperature: float = 0.2, max_tokens: Optional[int] = None) -> str:
+        if self.latency:
+            time.sleep(self.latency)
+        return self._respond(system_prompt, user_prompt)
+
+    async def acomplete(self, *, system_prompt: str, user_prompt: str, temperature: float = 0.2, max_tokens: Optional[int] = None) -> str:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self._respond(system_prompt, user_prompt)
+
+    def stream(self, *, system_prompt: str, user_prompt: str, temperature: float = 0.2, max_tokens: Optional[int] = None) -> Iterator[str]:
+        text = self.complete(system_prompt=system_prompt, user_prompt=user_prompt)
+        for i in range(0, len(text), self.chunk_size):
+            yield text[i:i + self.chunk_size]
+
+    async def astream(self, *, system_prompt: str, user_prompt: str, temperature: float = 0.2, max_tokens: Optional[int] = None) -> AsyncIterator[str]:
+        text = await self.acomplete(system_prompt=system_prompt, user_prompt=user_prompt)
+        for i in range(0, len(text), self.chunk_size):
+            yield text[i:i + self.chunk_size]
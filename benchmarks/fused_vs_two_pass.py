@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""Compare fused (single-call) and two-pass plain-text processing against a live provider.
+
+Usage:
+    OPENAI_API_KEY=... python benchmarks/fused_vs_two_pass.py samples/sample_plain.txt --repeats 3
+
+Prints one JSON document with, per mode, wall-clock latency, LLM calls and
+estimated prompt/completion tokens, plus fidelity of the fused output
+measured against the two-pass output and against the raw input.
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from resume_ai.models import Resume
+from resume_ai.pipeline import ResumeProcessor
+from resume_ai.prompt_library import estimate_tokens
+from resume_ai.providers.base import LLMProvider
+
+
+class MeteredProvider(LLMProvider):
+    def __init__(self, provider: LLMProvider):
+        self.provider = provider
+        self.calls = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+
+    @property
+    def name(self) -> str:  # type: ignore[override]
+        return self.provider.name
+
+    @property
+    def model(self):
+        return self.provider.model
+
+    def complete(self, *, system_prompt, user_prompt, temperature=0.2, max_tokens=None):
+        result = self.provider.complete(
+            system_prompt=system_prompt, user_prompt=user_prompt, temperature=temperature, max_tokens=max_tokens
+        )
+        self.calls += 1
+        self.prompt_tokens += estimate_tokens(system_prompt) + estimate_tokens(user_prompt)
+        self.completion_tokens += estimate_tokens(result)
+        return result
+
+
+def _jaccard(a, b) -> float:
+    a = {x.strip().lower() for x in a if x}
+    b = {x.strip().lower() for x in b if x}
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def fidelity(candidate: Resume, reference: Resume, raw_text: str) -> dict:
+    """Structural agreement with the reference plus grounding in the raw input."""
+    contact_fields = ("full_name", "email", "phone", "location")
+    contact = sum(
+        (getattr(candidate.contact, f) or "").lower() == (getattr(reference.contact, f) or "").lower()
+        for f in contact_fields
+    ) / len(contact_fields)
+    raw_lower = raw_text.lower()
+    grounded_terms = [s for s in candidate.skills] + [e.company for e in candidate.experience if e.company]
+    grounded = sum(term.lower() in raw_lower for term in grounded_terms) / len(grounded_terms) if grounded_terms else 1.0
+    return {
+        "contact_match": round(contact, 3),
+        "experience_count_match": len(candidate.experience) == len(reference.experience),
+        "education_count_match": len(candidate.education) == len(reference.education),
+        "project_count_match": len(candidate.projects) == len(reference.projects),
+        "skills_jaccard": round(_jaccard(candidate.skills, reference.skills), 3),
+        "companies_jaccard": round(
+            _jaccard([e.company or "" for e in candidate.experience], [e.company or "" for e in reference.experience]), 3
+        ),
+        "grounded_in_input": round(grounded, 3),
+    }
+
+
+def run_mode(provider: LLMProvider, raw_text: str, *, fused: bool, repeats: int) -> tuple[dict, Resume]:
+    metered = MeteredProvider(provider)
+    # Local parsing would skip the extraction call and make both modes the same flow
+    processor = ResumeProcessor(metered, fused=fused, local_parse=False)
+    timings = []
+    resume = None
+    for _ in range(repeats):
+        started = time.perf_counter()
+        resume = processor.process(raw_text)
+        timings.append(time.perf_counter() - started)
+    stats = {
+        "latency_median_s": round(statistics.median(timings), 3),
+        "latency_min_s": round(min(timings), 3),
+        "llm_calls_per_resume": metered.calls / repeats,
+        "prompt_tokens_per_resume": metered.prompt_tokens // repeats,
+        "completion_tokens_per_resume": metered.completion_tokens // repeats,
+    }
+    return stats, resume
+
+
+def make_provider(name: str) -> LLMProvider:
+    if name == "groq":
+        from resume_ai.providers.groq_provider import GroqProvider
+
+        return GroqProvider()
+    from resume_ai.providers.openai_provider import OpenAIProvider
+
+    return OpenAIProvider()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("inputs", nargs="*", type=Path, default=[Path("samples/sample_plain.txt")])
+    parser.add_argument("--provider", choices=["openai", "groq"], default="openai")
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    provider = make_provider(args.provider)
+    report = {"provider": provider.name, "model": provider.model, "inputs": []}
+    for path in args.inputs:
+        raw_text = path.read_text(encoding="utf-8")
+        two_pass, reference = run_mode(provider, raw_text, fused=False, repeats=args.repeats)
+        fused, candidate = run_mode(provider, raw_text, fused=True, repeats=args.repeats)
+        if two_pass["llm_calls_per_resume"] <= fused["llm_calls_per_resume"]:
+            print(f"{path}: two-pass made no more LLM calls than fused; the modes are not being compared", file=sys.stderr)
+            return 1
+        report["inputs"].append(
+            {
+                "input": str(path),
+                "two_pass": two_pass,
+                "fused": fused,
+                "speedup": round(two_pass["latency_median_s"] / fused["latency_median_s"], 2),
+                "fused_fidelity": fidelity(candidate, reference, raw_text),
+                "two_pass_grounded_in_input": fidelity(reference, reference, raw_text)["grounded_in_input"],
+            }
+        )
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
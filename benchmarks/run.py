@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""Offline micro and end-to-end benchmarks for the resume pipeline.
+
+Usage:
+    python benchmarks/run.py --output bench.json
+    python benchmarks/run.py --baseline bench.json --tolerance 0.25
+    python benchmarks/run.py --only normalize_many --records ats_export.jsonl
+
+Every LLM call goes to FakeProvider, so runs need no API key and are
+repeatable. Prints (or writes) one JSON document with per-case median,
+p95 and min timings and estimated prompt tokens with and without
+compaction; with ``--baseline`` it exits 1 if any case's median
+regressed by more than ``--tolerance``.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from fake_provider import SAMPLES_DIR, FakeProvider, default_resume_json
+
+from resume_ai.models import Resume
+from resume_ai.normalize import normalize_many
+from resume_ai.pipeline import ResumeProcessor, render_resume_bytes
+from resume_ai.prompt_library import prompt_token_report
+from resume_ai.templating import get_registry
+from resume_ai.validation import validate_completion
+
+WARMUP = 1
+SYNTHETIC_RECORDS = 1000
+
+
+class Skip(Exception):
+    """Raised by a case whose optional dependency is missing."""
+
+
+def measure(fn: Callable[[], object], iterations: int, warmup: int = WARMUP) -> dict:
+    for _ in range(warmup):
+        fn()
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    timings.sort()
+    median = statistics.median(timings)
+    return {
+        "iterations": iterations,
+        "median_ms": round(median * 1000, 4),
+        "p95_ms": round(timings[min(len(timings) - 1, int(len(timings) * 0.95))] * 1000, 4),
+        "min_ms": round(timings[0] * 1000, 4),
+        "ops_per_s": round(1 / median, 2) if median else None,
+    }
+
+
+def load_records(path: Optional[Path]) -> list[dict]:
+    """Resume dicts from a JSON-lines export, or copies of the sample when no file is given."""
+    if path is None:
+        return [json.loads(default_resume_json()) for _ in range(SYNTHETIC_RECORDS)]
+    with path.open(encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def build_cases(
+    latency: float, tmp_dir: Path, template: str, records: Optional[Path] = None
+) -> dict[str, Callable[[], Callable[[], object]]]:
+    """Case name -> setup returning the callable to time (build cases also return their provider)."""
+    resume_json = default_resume_json()
+    resume_data = json.loads(resume_json)
+    plain_text = (SAMPLES_DIR / "sample_plain.txt").read_text(encoding="utf-8")
+    completion = f"Here is the resume:\n```json\n{resume_json}\n```\nLet me know if you need changes."
+
+    def processor(**kwargs) -> ResumeProcessor:
+        return ResumeProcessor(FakeProvider(latency=latency), template_name=template, **kwargs)
+
+    def normalize():
+        p = processor()
+        return lambda: p._normalize_resume_input(json.loads(resume_json))
+
+    def bulk_normalize():
+        rows = load_records(records)
+        return lambda: list(normalize_many(rows))
+
+    def extract_json():
+        p = processor()
+        return lambda: p._extract_json(completion)
+
+    def model_validate():
+        return lambda: Resume.model_validate(resume_data)
+
+    def completion_validate():
+        return lambda: validate_completion(completion)
+
+    def template_render():
+        resume = Resume.model_validate(resume_data)
+        tmpl = get_registry().get(template)
+        return lambda: tmpl.render(resume=resume)
+
+    def docx_render():
+        resume = Resume.model_validate(resume_data)
+        return lambda: render_resume_bytes(resume, "docx")
+
+    def pdf_render():
+        try:
+            import weasyprint  # noqa: F401
+        except ImportError:
+            raise Skip("weasyprint not installed") from None
+        resume = Resume.model_validate(resume_data)
+        return lambda: render_resume_bytes(resume, "pdf", template_name=template)
+
+    def build_plain_text():
+        p = processor()
+        return (lambda: p.build(plain_text, output_docx=str(tmp_dir / "plain.docx"))), p.llm
+
+    def build_plain_text_llm_only():
+        p = processor(local_parse=False)
+        return (lambda: p.build(plain_text, output_docx=str(tmp_dir / "plain_llm.docx"))), p.llm
+
+    def build_json():
+        p = processor()
+        return (lambda: p.build(resume_json, output_docx=str(tmp_dir / "json.docx"))), p.llm
+
+    return {
+        "normalize_resume_input": normalize,
+        "normalize_many": bulk_normalize,
+        "extract_json": extract_json,
+        "model_validate": model_validate,
+        "validate_completion": completion_validate,
+        "template_render": template_render,
+        "docx_render": docx_render,
+        "pdf_render": pdf_render,
+        "build_plain_text": build_plain_text,
+        "build_plain_text_llm_only": build_plain_text_llm_only,
+        "build_json": build_json,
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=Path(__file__).resolve().parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(
+    *,
+    iterations: int = 50,
+    latency: float = 0.0,
+    only: Optional[list[str]] = None,
+    template: str = "minimal",
+    records: Optional[Path] = None,
+) -> dict:
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "commit": _git_commit(),
+        "latency_s": latency,
+        "template": template,
+        "prompt_tokens": prompt_token_report(
+            json.loads(default_resume_json()), (SAMPLES_DIR / "sample_plain.txt").read_text(encoding="utf-8")
+        ),
+        "results": {},
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, setup in build_cases(latency, Path(tmp), template, records).items():
+            if only and name not in only:
+                continue
+            try:
+                fn = setup()
+            except Skip as e:
+                report["results"][name] = {"skipped": str(e)}
+                continue
+            provider = None
+            if isinstance(fn, tuple):
+                fn, provider = fn
+            result = measure(fn, iterations, warmup=WARMUP)
+            if provider is not None:
+                result["llm_calls_per_op"] = provider.calls / (iterations + WARMUP)
+            report["results"][name] = result
+    return report
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Names of cases whose median is more than ``tolerance`` slower than the baseline."""
+    regressions = []
+    for name, result in report["results"].items():
+        before = baseline.get("results", {}).get(name, {})
+        if "median_ms" not in result or "median_ms" not in before:
+            continue
+        if result["median_ms"] > before["median_ms"] * (1 + tolerance):
+            regressions.append(f"{name}: {before['median_ms']}ms -> {result['median_ms']}ms")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.0, help="Simulated seconds per LLM call")
+    parser.add_argument("--template", default="minimal")
+    parser.add_argument("--only", action="append", help="Run only this case (repeatable)")
+    parser.add_argument("--records", type=Path, help="JSON-lines resume export for the normalize_many case")
+    parser.add_argument("--output", type=Path, help="Write the report here instead of stdout")
+    parser.add_argument("--baseline", type=Path, help="Earlier report to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed median slowdown vs baseline")
+    args = parser.parse_args()
+
+    report = run(
+        iterations=args.iterations, latency=args.latency, only=args.only, template=args.template, records=args.records
+    )
+    if args.baseline:
+        report["regressions"] = compare(report, json.loads(args.baseline.read_text(encoding="utf-8")), args.tolerance)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    return 1 if report.get("regressions") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+"""Concurrent processing of many resume files."""
+import glob
+from contextlib import ExitStack
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Optional, Sequence
+
+from resume_ai.pipeline import ResumeProcessor, render_resume
+from resume_ai.renderers.pdf_pool import PDFRenderPool
+
+INPUT_SUFFIXES = (".txt", ".json", ".md")
+
+
+@dataclass
+class BatchItemResult:
+    input_path: Path
+    ok: bool = False
+    process_seconds: float = 0.0
+    render_seconds: float = 0.0
+    outputs: dict[str, Path] = field(default_factory=dict)
+    error: Optional[str] = None
+
+
+def collect_inputs(source: str) -> list[Path]:
+    """Resolve a directory or glob pattern into a sorted list of input files."""
+    path = Path(source)
+    if path.is_dir():
+        candidates: Iterable[Path] = path.iterdir()
+    else:
+        candidates = (Path(p) for p in glob.glob(source, recursive=True))
+    return sorted(p for p in candidates if p.is_file() and p.suffix.lower() in INPUT_SUFFIXES)
+
+
+def _render_job(resume_json: str, fmt: str, output_path: str, template_name: str) -> float:
+    started = time.perf_counter()
+    render_resume(resume_json, fmt, output_path, template_name=template_name)
+    return time.perf_counter() - started
+
+
+def _timed_pdf(pdf_pool: PDFRenderPool, resume_json: str, output_path: str, template_name: str) -> float:
+    # Runs on a driver thread; the work itself happens in a warm pool worker.
+    started = time.perf_counter()
+    pdf_pool.render(resume_json, template_name=template_name, output_path=output_path)
+    return time.perf_counter() - started
+
+
+def _process_job(processor: ResumeProcessor, input_path: Path, output_dir: Path) -> tuple[str, float]:
+    started = time.perf_counter()
+    raw_input = input_path.read_text(encoding="utf-8")
+    resume = processor.process(raw_input)
+    processor.persist(raw_input, resume)
+    resume_json = resume.model_dump_json(indent=2)
+    (output_dir / f"{input_path.stem}.json").write_text(resume_json, encoding="utf-8")
+    return resume_json, time.perf_counter() - started
+
+
+def run_batch(
+    processor: ResumeProcessor,
+    inputs: Sequence[Path],
+    *,
+    output_dir: Path,
+    formats: Sequence[str] = ("pdf", "docx"),
+    workers: int = 4,
+    render_workers: Optional[int] = None,
+    pdf_pool: Optional[PDFRenderPool] = None,
+) -> list[BatchItemResult]:
+    """Extract and rewrite ``inputs`` on a thread pool, then render the results.
+
+    PDFs go to a pool of pre-warmed WeasyPrint workers: ``pdf_pool``, the
+    processor's own pool, or one started for this batch only when PDFs are
+    requested. Other formats are cheap and render on threads.
+
+    Failures are recorded per file; one bad input never aborts the batch.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    results = {path: BatchItemResult(input_path=path) for path in inputs}
+    render_futures: dict[Future, tuple[Path, str, Path]] = {}
+
+    with ExitStack() as stack:
+        llm_pool = stack.enter_context(ThreadPoolExecutor(max_workers=max(1, workers)))
+        render_pool = stack.enter_context(ThreadPoolExecutor(max_workers=render_workers))
+        if "pdf" in formats:
+            if pdf_pool is None:
+                pdf_pool = processor.pdf_pool
+            if pdf_pool is None:
+                pdf_pool = stack.enter_context(PDFRenderPool(render_workers))
+            pdf_waiters = stack.enter_context(ThreadPoolExecutor(max_workers=pdf_pool.workers))
+        process_futures = {llm_pool.submit(_process_job, processor, path, output_dir): path for path in inputs}
+        for future in as_completed(process_futures):
+            path = process_futures[future]
+            result = results[path]
+            try:
+                resume_json, result.process_seconds = future.result()
+            except Exception as e:
+                result.error = f"process: {e}"
+                continue
+            result.ok = True
+            for fmt in formats:
+                target = output_dir / f"{path.stem}.{fmt}"
+                if fmt == "pdf":
+                    job = pdf_waiters.submit(_timed_pdf, pdf_pool, resume_json, str(target), processor.template_name)
+                else:
+                    job = render_pool.submit(_render_job, resume_json, fmt, str(target), processor.template_name)
+                render_futures[job] = (path, fmt, target)
+
+        for future in as_completed(render_futures):
+            path, fmt, target = render_futures[future]
+            result = results[path]
+            try:
+                result.render_seconds += future.result()
+                result.outputs[fmt] = target
+            except Exception as e:
+                result.ok = False
+                result.error = f"{result.error + '; ' if result.error else ''}render {fmt}: {e}"
+
+    return [results[path] for path in inputs]
@@ -0,0 +1,196 @@
+"""Completion caches keyed on the full request sent to an LLM provider."""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Union
+
+from resume_ai.config import CacheSettings
+
+
+def completion_key(
+    *,
+    provider: str,
+    model: Optional[str],
+    system_prompt: str,
+    user_prompt: str,
+    temperature: float,
+    max_tokens: Optional[int],
+) -> str:
+    """Content-addressed key for a single completion request."""
+    payload = json.dumps(
+        [provider, model, system_prompt, user_prompt, round(float(temperature), 4), max_tokens],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class CompletionCache(ABC):
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: str, value: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+
+class MemoryCompletionCache(CompletionCache):
+    """Thread-safe in-process LRU cache with optional TTL and size caps."""
+
+    def __init__(self, *, max_entries: int = 1024, max_bytes: Optional[int] = None, ttl: Optional[float] = None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple[str, float]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, created = entry
+            if self.ttl is not None and time.time() - created > self.ttl:
+                self._drop(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        size = len(value.encode("utf-8"))
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            if self.max_bytes is not None and size > self.max_bytes:
+                return
+            self._entries[key] = (value, time.time())
+            self._bytes += size
+            while len(self._entries) > self.max_entries or (self.max_bytes is not None and self._bytes > self.max_bytes):
+                self._drop(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _drop(self, key: str) -> None:
+        value, _ = self._entries.pop(key)
+        self._bytes -= len(value.encode("utf-8"))
+
+
+class SQLiteCompletionCache(CompletionCache):
+    """Persistent LRU cache stored in a single SQLite file.
+
+    Entries are evicted by last access time once ``max_entries`` or
+    ``max_bytes`` is exceeded, and lazily dropped when older than ``ttl``.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        *,
+        max_entries: int = 10_000,
+        max_bytes: Optional[int] = 256 * 1024 * 1024,
+        ttl: Optional[float] = None,
+    ):
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS completions ("
+            " key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL,"
+            " created REAL NOT NULL, accessed REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS completions_accessed ON completions(accessed)")
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT value, created FROM completions WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            value, created = row
+            if self.ttl is not None and now - created > self.ttl:
+                self._conn.execute("DELETE FROM completions WHERE key = ?", (key,))
+                return None
+            self._conn.execute("UPDATE completions SET accessed = ? WHERE key = ?", (now, key))
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        now = time.time()
+        size = len(value.encode("utf-8"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO completions (key, value, size, created, accessed) VALUES (?, ?, ?, ?, ?)",
+                (key, value, size, now, now),
+            )
+            self._evict(now)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM completions")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM completions").fetchone()[0]
+
+    def _evict(self, now: float) -> None:
+        if self.ttl is not None:
+            self._conn.execute("DELETE FROM completions WHERE created < ?", (now - self.ttl,))
+        count, total = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM completions").fetchone()
+        if count > self.max_entries:
+            self._conn.execute(
+                "DELETE FROM completions WHERE key IN (SELECT key FROM completions ORDER BY accessed LIMIT ?)",
+                (count - self.max_entries,),
+            )
+        if self.max_bytes is not None and total > self.max_bytes:
+            excess = total - self.max_bytes
+            victims = []
+            for key, size in self._conn.execute("SELECT key, size FROM completions ORDER BY accessed"):
+                victims.append((key,))
+                excess -= size
+                if excess <= 0:
+                    break
+            self._conn.executemany("DELETE FROM completions WHERE key = ?", victims)
+
+
+def cache_from_settings(settings: Optional[CacheSettings] = None) -> Optional[CompletionCache]:
+    """Build the configured cache backend, or ``None`` when caching is disabled."""
+    settings = settings or CacheSettings.from_env()
+    if not settings.enabled:
+        return None
+    if settings.backend == "memory":
+        return MemoryCompletionCache(max_entries=settings.max_entries, max_bytes=settings.max_bytes, ttl=settings.ttl_seconds)
+    if settings.backend == "sqlite":
+        return SQLiteCompletionCache(
+            settings.path, max_entries=settings.max_entries, max_bytes=settings.max_bytes, ttl=settings.ttl_seconds
+        )
+    raise ValueError(f"Unknown cache backend: {settings.backend}")
@@ -0,0 +1,158 @@
+"""Split long resumes on section boundaries and merge per-chunk extractions."""
+import re
+from typing import Any, Optional
+
+from resume_ai.local_parser import BULLET_RE, HEADER_LOOKUP, HEADER_RE
+from resume_ai.prompt_library import estimate_tokens
+
+_NORMALIZE_RE = re.compile(r"[^a-z0-9]+")
+LIST_SECTIONS = ("skills", "achievements", "extracurricular", "languages", "interests")
+# Section -> fields identifying the same entry when it shows up in two chunks
+ENTRY_KEYS = {
+    "experience": ("title", "company"),
+    "education": ("institution", "degree"),
+    "projects": ("name",),
+    "certifications": ("name",),
+}
+ENTRY_LIST_FIELDS = ("bullets", "technologies", "stack")
+
+
+def _tokens(lines: list[str]) -> int:
+    return estimate_tokens("\n".join(lines))
+
+
+def _segments(text: str) -> list[list[str]]:
+    """Lines grouped per section; every segment but the preamble starts with its header line."""
+    segments: list[list[str]] = [[]]
+    for line in text.splitlines():
+        header = HEADER_RE.match(line)
+        if header and HEADER_LOOKUP.get(header.group("title").strip().lower()):
+            segments.append([line])
+        else:
+            segments[-1].append(line)
+    return [s for s in segments if any(line.strip() for line in s)]
+
+
+def _entries(lines: list[str]) -> list[list[str]]:
+    """Blank lines, or a plain line after bullets, start a new entry (a job, a degree...)."""
+    entries: list[list[str]] = [[]]
+    previous_bullet = False
+    for line in lines:
+        if not line.strip():
+            if entries[-1]:
+                entries.append([])
+            previous_bullet = False
+            continue
+        is_bullet = bool(BULLET_RE.match(line))
+        if previous_bullet and not is_bullet and entries[-1]:
+            entries.append([])
+        entries[-1].append(line)
+        previous_bullet = is_bullet
+    return [e for e in entries if e]
+
+
+def _split_segment(segment: list[str], max_tokens: int) -> list[list[str]]:
+    if _tokens(segment) <= max_tokens:
+        return [segment]
+    header = [segment[0]] if HEADER_RE.match(segment[0]) else []
+    body = segment[len(header):]
+    pieces: list[list[str]] = []
+    current = list(header)
+    for entry in _entries(body):
+        # An entry bigger than the whole budget is cut by lines as a last resort
+        parts = [entry] if _tokens(entry) <= max_tokens else [[line] for line in entry]
+        for part in parts:
+            if len(current) > len(header) and _tokens(current + part) > max_tokens:
+                pieces.append(current)
+                # Repeat the header so every piece still says which section it belongs to
+                current = list(header)
+            current.extend(part)
+    if len(current) > len(header):
+        pieces.append(current)
+    return pieces
+
+
+def split_into_chunks(text: str, max_tokens: int) -> list[str]:
+    """Split ``text`` into pieces of at most ~``max_tokens``, cutting only between sections or entries.
+
+    Short inputs come back as a single chunk, unchanged.
+    """
+    if estimate_tokens(text) <= max_tokens:
+        return [text]
+    chunks: list[list[str]] = []
+    current: list[str] = []
+    for segment in _segments(text):
+        for piece in _split_segment(segment, max_tokens):
+            if current and _tokens(current + piece) > max_tokens:
+                chunks.append(current)
+                current = []
+            current.extend(piece)
+    if current:
+        chunks.append(current)
+    return ["\n".join(chunk).strip() for chunk in chunks]
+
+
+def _norm(value: Any) -> str:
+    return _NORMALIZE_RE.sub(" ", str(value or "").lower()).strip()
+
+
+def _dedupe_strings(items: list) -> list:
+    seen = set()
+    out = []
+    for item in items:
+        key = _norm(item) if isinstance(item, str) else repr(item)
+        if key and key not in seen:
+            seen.add(key)
+            out.append(item)
+    return out
+
+
+def _merge_entry(target: dict, extra: dict) -> None:
+    for key, value in extra.items():
+        if key in ENTRY_LIST_FIELDS and isinstance(value, list):
+            target[key] = _dedupe_strings(list(target.get(key) or []) + value)
+        elif target.get(key) in (None, "", [], False) and value not in (None, ""):
+            target[key] = value
+
+
+def _entry_key(section: str, entry: dict) -> Optional[tuple]:
+    key = tuple(_norm(entry.get(field)) for field in ENTRY_KEYS[section])
+    return key if any(key) else None
+
+
+def merge_extractions(parts: list[dict]) -> dict:
+    """Combine per-chunk extractions into one resume dict.
+
+    Contact fields and the summary come from the first chunk that has them;
+    entries describing the same job, degree, project or certificate (a job
+    split across two chunks, say) are merged; list sections are deduped.
+    """
+    merged: dict[str, Any] = {"contact": {}, "summary": None}
+    index: dict[str, dict[tuple, dict]] = {section: {} for section in ENTRY_KEYS}
+    for part in parts:
+        if not isinstance(part, dict):
+            continue
+        contact = part.get("contact") if isinstance(part.get("contact"), dict) else {}
+        for key, value in contact.items():
+            if key == "links" and isinstance(value, list):
+                merged["contact"]["links"] = _dedupe_strings(merged["contact"].get("links", []) + value)
+            elif not merged["contact"].get(key) and value:
+                merged["contact"][key] = value
+        if not merged["summary"] and isinstance(part.get("summary"), str) and part["summary"].strip():
+            merged["summary"] = part["summary"]
+        for section in ENTRY_KEYS:
+            for entry in part.get(section) or []:
+                if not isinstance(entry, dict):
+                    continue
+                key = _entry_key(section, entry)
+                if key is not None and key in index[section]:
+                    _merge_entry(index[section][key], entry)
+                    continue
+                entry = dict(entry)
+                merged.setdefault(section, []).append(entry)
+                if key is not None:
+                    index[section][key] = entry
+        for section in LIST_SECTIONS:
+            if isinstance(part.get(section), list):
+                merged[section] = _dedupe_strings(merged.get(section, []) + part[section])
+    return merged
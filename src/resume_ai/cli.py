@@ -1,12 +1,48 @@
+import functools
 import json
+import os
+import sys
+import time
+from contextlib import ExitStack
 from pathlib import Path
+from typing import Optional
 import typer
 
-from resume_ai.pipeline import ResumeProcessor
-from resume_ai.providers.openai_provider import OpenAIProvider
+from resume_ai.batch import collect_inputs, run_batch
+from resume_ai.cache import cache_from_settings
+from resume_ai.config import StoreSettings
+from resume_ai.instrumentation import PrometheusExporter, instrument, profiled
+from resume_ai.pipeline import ResumeProcessor, coerce_resume, render_resume
+from resume_ai.plugins import get_provider
+from resume_ai.providers.cached_provider import CachedProvider
+from resume_ai.providers.resilient_provider import ResilientProvider
+from resume_ai.store import ResumeStore, store_from_settings
 
 app = typer.Typer(add_completion=False)
 
+STORE_HELP = (
+    "Save built resumes to the searchable resume store at RESUME_AI_STORE_PATH "
+    f"(default {StoreSettings.path}). Off unless RESUME_AI_STORE=1 or --store is given"
+)
+
+
+def _make_provider(cache: bool):
+    # OpenAI first, Groq as failover when a key is configured; ResilientProvider
+    # owns retries, so the SDK clients must not retry underneath it
+    chain = [get_provider("openai", max_retries=0)]
+    if os.getenv("GROQ_API_KEY"):
+        chain.append(get_provider("groq", max_retries=0))
+    provider = ResilientProvider(chain)
+    completion_cache = cache_from_settings() if cache else None
+    if completion_cache is not None:
+        provider = CachedProvider(provider, completion_cache)
+    return provider
+
+
+def _make_processor(cache: bool, store: Optional[bool], **options) -> ResumeProcessor:
+    # Module level so queue worker processes can build their own; store=None follows RESUME_AI_STORE
+    return ResumeProcessor(_make_provider(cache), store=store_from_settings(enabled=store), **options)
+
 
 @app.command()
 def build(
@@ -14,14 +50,212 @@ def build(
     template: str = typer.Option("minimal", help="Template name"),
     pdf: Path = typer.Option(None, help="Optional PDF output path"),
     docx: Path = typer.Option(None, help="Optional DOCX output path"),
+    cache: bool = typer.Option(True, "--cache/--no-cache", help="Reuse cached LLM completions"),
+    store: Optional[bool] = typer.Option(None, "--store/--no-store", help=STORE_HELP, show_default=False),
+    fused: bool = typer.Option(False, help="Extract and rewrite plain text in a single LLM call"),
+    section_rewrite: bool = typer.Option(False, help="Rewrite summary, jobs and projects as parallel small calls"),
+    local_parse: bool = typer.Option(True, "--local-parse/--no-local-parse", help="Parse well-structured text without an LLM extraction call"),
+    profile: bool = typer.Option(False, help="Print the build report plus cProfile and tracemalloc summaries to stderr"),
+    profile_output: Path = typer.Option(None, help="With --profile, also save raw cProfile stats here"),
+    metrics_file: Path = typer.Option(None, help="Write Prometheus text-format metrics for this run here"),
 ):
     raw_text = input_path.read_text(encoding="utf-8")
-    provider = OpenAIProvider()
-    processor = ResumeProcessor(provider, template_name=template)
-    resume = processor.build(raw_text, output_pdf=str(pdf) if pdf else None, output_docx=str(docx) if docx else None)
+    processor = _make_processor(
+        cache, store, template_name=template, fused=fused, section_rewrite=section_rewrite, local_parse=local_parse,
+    )
+    exporter = PrometheusExporter() if metrics_file else None
+    with ExitStack() as stack:
+        if exporter is not None:
+            stack.enter_context(instrument(exporter))
+        if profile:
+            stack.enter_context(profiled(sys.stderr, output=str(profile_output) if profile_output else None))
+        resume, report = processor.build_with_report(
+            raw_text, output_pdf=str(pdf) if pdf else None, output_docx=str(docx) if docx else None
+        )
+    if profile:
+        typer.echo(json.dumps(report.to_dict(), indent=2), err=True)
+    if exporter is not None:
+        metrics_file.write_text(exporter.render(), encoding="utf-8")
     typer.echo(json.dumps(resume.model_dump(), indent=2))
 
 
+@app.command("build-batch")
+def build_batch(
+    source: str = typer.Argument(..., help="Directory of resumes or a glob such as 'intake/**/*.txt'"),
+    output_dir: Path = typer.Option(Path("out"), help="Directory for JSON, PDF and DOCX outputs"),
+    template: str = typer.Option("minimal", help="Template name"),
+    formats: list[str] = typer.Option(["pdf", "docx"], "--format", "-f", help="Output format (repeatable): pdf, docx"),
+    workers: int = typer.Option(4, help="Concurrent extraction/rewrite workers"),
+    render_workers: int = typer.Option(None, help="Render processes (defaults to CPU count)"),
+    cache: bool = typer.Option(True, "--cache/--no-cache", help="Reuse cached LLM completions"),
+    store: Optional[bool] = typer.Option(None, "--store/--no-store", help=STORE_HELP, show_default=False),
+    fused: bool = typer.Option(False, help="Extract and rewrite plain text in a single LLM call"),
+    section_rewrite: bool = typer.Option(False, help="Rewrite summary, jobs and projects as parallel small calls"),
+    local_parse: bool = typer.Option(True, "--local-parse/--no-local-parse", help="Parse well-structured text without an LLM extraction call"),
+    queue: Path = typer.Option(None, help="SQLite job queue; rerunning with the same file skips finished work"),
+    processes: int = typer.Option(4, help="With --queue, worker processes leasing jobs"),
+):
+    """Process every resume in SOURCE concurrently and print a summary."""
+    inputs = collect_inputs(source)
+    if not inputs:
+        typer.echo(f"No input files matched {source}", err=True)
+        raise typer.Exit(code=1)
+
+    options = dict(template_name=template, fused=fused, section_rewrite=section_rewrite, local_parse=local_parse)
+    if queue is not None:
+        _run_queued(queue, inputs, functools.partial(_make_processor, cache, store, **options), output_dir, formats, processes)
+        return
+
+    processor = _make_processor(cache, store, **options)
+    started = time.perf_counter()
+    results = run_batch(
+        processor,
+        inputs,
+        output_dir=output_dir,
+        formats=formats,
+        workers=workers,
+        render_workers=render_workers,
+    )
+    elapsed = time.perf_counter() - started
+
+    for result in results:
+        status = "ok" if result.ok else "FAILED"
+        line = f"{status:6} {result.input_path.name:40} process {result.process_seconds:6.2f}s  render {result.render_seconds:6.2f}s"
+        if result.error:
+            line += f"  {result.error}"
+        typer.echo(line)
+    failed = sum(1 for r in results if not r.ok)
+    typer.echo(f"{len(results) - failed}/{len(results)} succeeded in {elapsed:.2f}s")
+    if failed:
+        raise typer.Exit(code=1)
+
+
+def _run_queued(queue_path: Path, inputs: list[Path], make_processor, output_dir: Path, formats: list[str], processes: int):
+    from resume_ai.jobqueue import JobQueue, run_queue
+
+    job_queue = JobQueue(queue_path)
+    keys = job_queue.enqueue(inputs)
+    job_queue.close()
+    started = time.perf_counter()
+    run_queue(queue_path, make_processor, output_dir=output_dir, formats=formats, processes=processes)
+    elapsed = time.perf_counter() - started
+
+    job_queue = JobQueue(queue_path)
+    jobs = job_queue.jobs(keys)
+    job_queue.close()
+    for path, job in zip(inputs, jobs):
+        status = "ok" if job.state == "done" else "FAILED"
+        line = f"{status:6} {path.name:40} {job.stage:10} attempts {job.attempts}"
+        if job.error and job.state != "done":
+            line += f"  {job.error}"
+        typer.echo(line)
+    failed = sum(1 for job in jobs if job.state != "done")
+    typer.echo(f"{len(jobs) - failed}/{len(jobs)} succeeded in {elapsed:.2f}s")
+    if failed:
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def render(
+    resume_path: Path = typer.Argument(..., help="Path to a resume JSON file produced by `build`"),
+    formats: list[str] = typer.Option(["pdf"], "--format", "-f", help="Output format (repeatable): pdf, docx"),
+    output_dir: Path = typer.Option(Path("."), help="Directory for rendered files"),
+    template: str = typer.Option("minimal", help="Template name"),
+):
+    """Render an existing resume JSON without calling the LLM."""
+    resume = coerce_resume(resume_path.read_text(encoding="utf-8"))
+    for fmt in formats:
+        written = render_resume(resume, fmt, output_dir / f"{resume_path.stem}.{fmt}", template_name=template)
+        typer.echo(str(written))
+
+
+@app.command()
+def match(
+    resume_path: Path = typer.Argument(..., help="Path to a resume JSON file produced by `build`"),
+    job_paths: list[Path] = typer.Argument(..., help="Job description text files"),
+    keywords: int = typer.Option(25, help="ATS keywords taken from each job description"),
+):
+    """Score a resume against job descriptions locally, best match first, without calling the LLM."""
+    from resume_ai.matching import JobIndex, score
+
+    jobs = JobIndex({path.name: path.read_text(encoding="utf-8") for path in job_paths}, max_keywords=keywords)
+    matches = score(coerce_resume(resume_path.read_text(encoding="utf-8")), jobs)
+    typer.echo(json.dumps([
+        {
+            "job": m.job_id,
+            "score": m.score,
+            "coverage": m.coverage,
+            "matched": m.matched,
+            "missing": m.missing,
+            "bullet_order": [b.text for b in m.bullet_order],
+        }
+        for m in matches
+    ], indent=2))
+
+
+@app.command()
+def serve(
+    host: str = typer.Option("127.0.0.1", help="Interface to listen on"),
+    port: int = typer.Option(8000, help="Port to listen on"),
+    max_in_flight: int = typer.Option(16, help="LLM calls allowed in flight at once across all requests"),
+    template: str = typer.Option("minimal", help="Default template name"),
+    cache: bool = typer.Option(True, "--cache/--no-cache", help="Reuse cached LLM completions"),
+    store: Optional[bool] = typer.Option(None, "--store/--no-store", help=STORE_HELP, show_default=False),
+    section_rewrite: bool = typer.Option(False, help="Rewrite summary, jobs and projects as parallel small calls"),
+    local_parse: bool = typer.Option(True, "--local-parse/--no-local-parse", help="Parse well-structured text without an LLM extraction call"),
+):
+    """Serve build, render and job-status endpoints over HTTP."""
+    import asyncio
+    import logging
+
+    from resume_ai.providers.bounded_provider import BoundedProvider
+    from resume_ai.server import serve as serve_api
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    processor = ResumeProcessor(
+        BoundedProvider(_make_provider(cache), max_in_flight),
+        template_name=template,
+        section_rewrite=section_rewrite,
+        local_parse=local_parse,
+        store=store_from_settings(enabled=store),
+    )
+    try:
+        asyncio.run(serve_api(processor, host, port))
+    except KeyboardInterrupt:
+        pass
+
+
+@app.command()
+def search(
+    query: str = typer.Argument(None, help="Full-text query; every word must match, word* matches a prefix"),
+    skills: list[str] = typer.Option([], "--skill", "-s", help="Required skill (repeatable)"),
+    technologies: list[str] = typer.Option([], "--tech", "-t", help="Required technology (repeatable)"),
+    companies: list[str] = typer.Option([], "--company", "-c", help="Required employer (repeatable)"),
+    titles: list[str] = typer.Option([], "--title", help="Required job title (repeatable)"),
+    limit: int = typer.Option(20, help="Maximum number of results"),
+    store_path: Path = typer.Option(None, help=f"Resume store file (defaults to RESUME_AI_STORE_PATH, or {StoreSettings.path})"),
+    full: bool = typer.Option(False, help="Print each stored resume in full"),
+):
+    """Find previously built resumes without reprocessing them."""
+    path = Path(store_path or StoreSettings.from_env().path).expanduser()
+    if not path.exists():
+        typer.echo(f"No resume store at {path}; build with --store or RESUME_AI_STORE=1 to fill it", err=True)
+        raise typer.Exit(code=1)
+    store = ResumeStore(path)
+    hits = store.search(query, skills=skills, technologies=technologies, companies=companies, titles=titles, limit=limit)
+    store.close()
+    typer.echo(json.dumps([
+        {"key": hit.key, "resume": hit.resume.model_dump()} if full else {
+            "key": hit.key,
+            "name": hit.resume.contact.full_name,
+            "email": hit.resume.contact.email,
+            "experience": [f"{e.title or ''} @ {e.company or ''}".strip(" @") for e in hit.resume.experience],
+            "skills": hit.resume.skills,
+        }
+        for hit in hits
+    ], indent=2))
+
+
 def run():
     app()
 
@@ -10,6 +10,7 @@ class OpenAISettings:
     organization: Optional[str] = None
     temperature: float = 0.1
     max_tokens: int = 2000
+    max_connections: int = 20
 
     @classmethod
     def from_env(cls) -> "OpenAISettings":
@@ -19,6 +20,93 @@ class OpenAISettings:
             organization=os.getenv("OPENAI_ORG"),
             temperature=float(os.getenv("OPENAI_TEMPERATURE", "0.2")),
             max_tokens=int(os.getenv("OPENAI_MAX_TOKENS", "1200")),
+            max_connections=int(os.getenv("OPENAI_MAX_CONNECTIONS", "20")),
+        )
+
+
+@dataclass
+class CacheSettings:
+    enabled: bool = True
+    backend: str = "sqlite"
+    path: str = "~/.cache/resume-ai/completions.sqlite3"
+    max_entries: int = 10_000
+    max_bytes: Optional[int] = 256 * 1024 * 1024
+    ttl_seconds: Optional[float] = 30 * 24 * 3600
+
+    @classmethod
+    def from_env(cls) -> "CacheSettings":
+        ttl = os.getenv("RESUME_AI_CACHE_TTL")
+        max_bytes = os.getenv("RESUME_AI_CACHE_MAX_BYTES")
+        return cls(
+            enabled=os.getenv("RESUME_AI_CACHE", "1").lower() not in {"0", "false", "no", "off"},
+            backend=os.getenv("RESUME_AI_CACHE_BACKEND", "sqlite"),
+            path=os.getenv("RESUME_AI_CACHE_PATH", cls.path),
+            max_entries=int(os.getenv("RESUME_AI_CACHE_MAX_ENTRIES", "10000")),
+            max_bytes=int(max_bytes) if max_bytes else cls.max_bytes,
+            ttl_seconds=float(ttl) if ttl else cls.ttl_seconds,
+        )
+
+
+@dataclass
+class StoreSettings:
+    # Off unless asked for: stored resumes hold personal data
+    enabled: bool = False
+    path: str = "~/.local/share/resume-ai/resumes.sqlite3"
+
+    @classmethod
+    def from_env(cls) -> "StoreSettings":
+        return cls(
+            enabled=os.getenv("RESUME_AI_STORE", "0").lower() in {"1", "true", "yes", "on"},
+            path=os.getenv("RESUME_AI_STORE_PATH", cls.path),
+        )
+
+
+@dataclass
+class RateLimits:
+    requests_per_minute: Optional[float] = None
+    tokens_per_minute: Optional[float] = None
+
+    @classmethod
+    def from_env(cls, provider: str) -> "RateLimits":
+        prefix = provider.upper()
+        rpm = os.getenv(f"{prefix}_RPM")
+        tpm = os.getenv(f"{prefix}_TPM")
+        return cls(
+            requests_per_minute=float(rpm) if rpm else None,
+            tokens_per_minute=float(tpm) if tpm else None,
+        )
+
+
+@dataclass
+class TemplateSettings:
+    cache_dir: Optional[str] = "~/.cache/resume-ai/jinja"
+    auto_reload: bool = False
+
+    @classmethod
+    def from_env(cls) -> "TemplateSettings":
+        cache_dir = os.getenv("RESUME_AI_TEMPLATE_CACHE_DIR", cls.cache_dir)
+        return cls(
+            cache_dir=cache_dir if cache_dir and cache_dir.lower() not in {"0", "off", "none"} else None,
+            # Only development setups need Jinja to stat template files on every render
+            auto_reload=os.getenv("RESUME_AI_TEMPLATE_AUTO_RELOAD", "0").lower() in {"1", "true", "yes", "on"},
+        )
+
+
+@dataclass
+class RenderSettings:
+    pdf_workers: Optional[int] = None
+    pdf_queue_size: Optional[int] = None
+    pdf_timeout_seconds: Optional[float] = 60.0
+
+    @classmethod
+    def from_env(cls) -> "RenderSettings":
+        workers = os.getenv("RESUME_AI_PDF_WORKERS")
+        queue_size = os.getenv("RESUME_AI_PDF_QUEUE_SIZE")
+        timeout = os.getenv("RESUME_AI_PDF_TIMEOUT")
+        return cls(
+            pdf_workers=int(workers) if workers else None,
+            pdf_queue_size=int(queue_size) if queue_size else None,
+            pdf_timeout_seconds=float(timeout) if timeout else cls.pdf_timeout_seconds,
         )
 
 
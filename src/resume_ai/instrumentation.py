@@ -0,0 +1,482 @@
+"""Per-stage timings, per-call token usage and retry counts.
+
+Pipeline stages and provider calls report to whichever sinks are active:
+sinks added globally with ``add_sink`` (e.g. a process-wide Prometheus
+exporter) plus any installed for the current context with ``instrument``.
+With no sinks active, every hook returns almost immediately.
+
+Context is carried by ``contextvars``, so asyncio tasks and
+``asyncio.to_thread`` inherit it; plain thread pools need
+``contextvars.copy_context().run``.
+"""
+import asyncio
+import contextvars
+import functools
+import json
+import logging
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any, AsyncIterator, Callable, Iterator, Optional, TextIO
+
+from resume_ai.prompt_library import estimate_tokens
+from resume_ai.providers.base import LLMProvider
+
+logger = logging.getLogger("resume_ai.instrumentation")
+
+
+@dataclass
+class StageRecord:
+    name: str
+    seconds: float = 0.0
+    retries: int = 0
+    ok: bool = True
+
+
+@dataclass
+class CallRecord:
+    provider: str
+    model: Optional[str]
+    stage: Optional[str] = None
+    seconds: float = 0.0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    # True when the provider did not report usage and tokens were estimated from text length
+    estimated_tokens: bool = True
+    retries: int = 0
+    streamed: bool = False
+    cached: bool = False
+    ok: bool = True
+
+
+@dataclass
+class BuildReport:
+    """Everything recorded while building one resume. Stages may nest, so their times can overlap."""
+
+    stages: list[StageRecord] = field(default_factory=list)
+    calls: list[CallRecord] = field(default_factory=list)
+
+    @property
+    def llm_seconds(self) -> float:
+        return sum(c.seconds for c in self.calls)
+
+    @property
+    def prompt_tokens(self) -> int:
+        return sum(c.prompt_tokens for c in self.calls)
+
+    @property
+    def completion_tokens(self) -> int:
+        return sum(c.completion_tokens for c in self.calls)
+
+    @property
+    def retries(self) -> int:
+        return sum(c.retries for c in self.calls) + sum(s.retries for s in self.stages)
+
+    def stage_seconds(self) -> dict[str, float]:
+        totals: dict[str, float] = {}
+        for s in self.stages:
+            totals[s.name] = totals.get(s.name, 0.0) + s.seconds
+        return totals
+
+    def to_dict(self) -> dict:
+        return {
+            "stage_seconds": {k: round(v, 6) for k, v in self.stage_seconds().items()},
+            "llm_calls": len(self.calls),
+            "llm_seconds": round(self.llm_seconds, 6),
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "retries": self.retries,
+            "stages": [asdict(s) for s in self.stages],
+            "calls": [asdict(c) for c in self.calls],
+        }
+
+
+class Instrumentation:
+    """Sink interface; override the hooks you care about."""
+
+    def on_stage(self, record: StageRecord) -> None:
+        pass
+
+    def on_call(self, record: CallRecord) -> None:
+        pass
+
+
+class BuildRecorder(Instrumentation):
+    def __init__(self):
+        self.report = BuildReport()
+        self._lock = threading.Lock()
+
+    def on_stage(self, record: StageRecord) -> None:
+        with self._lock:
+            self.report.stages.append(record)
+
+    def on_call(self, record: CallRecord) -> None:
+        with self._lock:
+            self.report.calls.append(record)
+
+
+class LoggingSink(Instrumentation):
+    """One structured (JSON) log line per stage and per provider call."""
+
+    def __init__(self, log: Optional[logging.Logger] = None, level: int = logging.INFO):
+        self.log = log or logger
+        self.level = level
+
+    def on_stage(self, record: StageRecord) -> None:
+        self.log.log(self.level, json.dumps({"event": "stage", **asdict(record)}))
+
+    def on_call(self, record: CallRecord) -> None:
+        self.log.log(self.level, json.dumps({"event": "llm_call", **asdict(record)}))
+
+
+class PrometheusExporter(Instrumentation):
+    """Accumulates counters and renders them in the Prometheus text exposition format."""
+
+    def __init__(self, namespace: str = "resume_ai"):
+        self.namespace = namespace
+        self._lock = threading.Lock()
+        self._stage_seconds: dict[str, float] = {}
+        self._stage_count: dict[str, int] = {}
+        self._stage_retries: dict[str, int] = {}
+        self._calls: dict[tuple[str, str], int] = {}
+        self._call_seconds: dict[tuple[str, str], float] = {}
+        self._tokens: dict[tuple[str, str, str], int] = {}
+        self._call_retries: dict[tuple[str, str], int] = {}
+        self._call_errors: dict[tuple[str, str], int] = {}
+        self._cache_hits: dict[tuple[str, str], int] = {}
+
+    def on_stage(self, record: StageRecord) -> None:
+        with self._lock:
+            self._stage_seconds[record.name] = self._stage_seconds.get(record.name, 0.0) + record.seconds
+            self._stage_count[record.name] = self._stage_count.get(record.name, 0) + 1
+            self._stage_retries[record.name] = self._stage_retries.get(record.name, 0) + record.retries
+
+    def on_call(self, record: CallRecord) -> None:
+        key = (record.provider, record.model or "")
+        with self._lock:
+            self._calls[key] = self._calls.get(key, 0) + 1
+            self._call_seconds[key] = self._call_seconds.get(key, 0.0) + record.seconds
+            self._call_retries[key] = self._call_retries.get(key, 0) + record.retries
+            if not record.ok:
+                self._call_errors[key] = self._call_errors.get(key, 0) + 1
+            if record.cached:
+                self._cache_hits[key] = self._cache_hits.get(key, 0) + 1
+            for kind, count in (("prompt", record.prompt_tokens), ("completion", record.completion_tokens)):
+                tkey = (*key, kind)
+                self._tokens[tkey] = self._tokens.get(tkey, 0) + count
+
+    @staticmethod
+    def _labels(**labels: str) -> str:
+        def escape(value: str) -> str:
+            return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+        return "{" + ",".join(f'{k}="{escape(str(v))}"' for k, v in labels.items()) + "}"
+
+    def render(self) -> str:
+        ns = self.namespace
+        lines: list[str] = []
+
+        def metric(name: str, kind: str, help_text: str, samples: list[tuple[str, Any]]) -> None:
+            lines.append(f"# HELP {ns}_{name} {help_text}")
+            lines.append(f"# TYPE {ns}_{name} {kind}")
+            lines.extend(f"{ns}_{name}{labels} {value}" for labels, value in samples)
+
+        with self._lock:
+            metric("stage_seconds_total", "counter", "Wall time spent in each pipeline stage.",
+                   [(self._labels(stage=k), round(v, 6)) for k, v in sorted(self._stage_seconds.items())])
+            metric("stage_runs_total", "counter", "Pipeline stage executions.",
+                   [(self._labels(stage=k), v) for k, v in sorted(self._stage_count.items())])
+            metric("stage_retries_total", "counter", "Retries inside pipeline stages (e.g. validation).",
+                   [(self._labels(stage=k), v) for k, v in sorted(self._stage_retries.items())])
+            metric("llm_calls_total", "counter", "LLM provider calls.",
+                   [(self._labels(provider=p, model=m), v) for (p, m), v in sorted(self._calls.items())])
+            metric("llm_call_errors_total", "counter", "LLM provider calls that raised.",
+                   [(self._labels(provider=p, model=m), v) for (p, m), v in sorted(self._call_errors.items())])
+            metric("llm_cache_hits_total", "counter", "LLM calls served from the completion cache.",
+                   [(self._labels(provider=p, model=m), v) for (p, m), v in sorted(self._cache_hits.items())])
+            metric("llm_call_seconds_total", "counter", "Wall time spent waiting on LLM providers.",
+                   [(self._labels(provider=p, model=m), round(v, 6)) for (p, m), v in sorted(self._call_seconds.items())])
+            metric("llm_retries_total", "counter", "Provider retries after rate limits or transient errors.",
+                   [(self._labels(provider=p, model=m), v) for (p, m), v in sorted(self._call_retries.items())])
+            metric("llm_tokens_total", "counter", "Prompt and completion tokens.",
+                   [(self._labels(provider=p, model=m, kind=k), v) for (p, m, k), v in sorted(self._tokens.items())])
+        return "\n".join(lines) + "\n"
+
+
+_global_sinks: tuple[Instrumentation, ...] = ()
+_global_lock = threading.Lock()
+_context_sinks: contextvars.ContextVar[tuple[Instrumentation, ...]] = contextvars.ContextVar("resume_ai_sinks", default=())
+_stage_stack: contextvars.ContextVar[tuple[StageRecord, ...]] = contextvars.ContextVar("resume_ai_stages", default=())
+_active_call: contextvars.ContextVar[Optional[CallRecord]] = contextvars.ContextVar("resume_ai_call", default=None)
+
+
+def add_sink(sink: Instrumentation) -> None:
+    global _global_sinks
+    with _global_lock:
+        _global_sinks = (*_global_sinks, sink)
+
+
+def remove_sink(sink: Instrumentation) -> None:
+    global _global_sinks
+    with _global_lock:
+        _global_sinks = tuple(s for s in _global_sinks if s is not sink)
+
+
+def _sinks() -> tuple[Instrumentation, ...]:
+    return _global_sinks + _context_sinks.get()
+
+
+@contextmanager
+def instrument(*sinks: Instrumentation) -> Iterator[None]:
+    """Send everything recorded inside the block (in this context) to ``sinks``."""
+    token = _context_sinks.set(_context_sinks.get() + sinks)
+    try:
+        yield
+    finally:
+        _context_sinks.reset(token)
+
+
+def _emit(hook: str, record: Any) -> None:
+    for sink in _sinks():
+        try:
+            getattr(sink, hook)(record)
+        except Exception:
+            logger.exception("instrumentation sink %r failed", sink)
+
+
+@contextmanager
+def stage(name: str) -> Iterator[Optional[StageRecord]]:
+    """Time a pipeline stage; stages may nest."""
+    if not _sinks():
+        yield None
+        return
+    record = StageRecord(name)
+    token = _stage_stack.set(_stage_stack.get() + (record,))
+    started = time.perf_counter()
+    try:
+        yield record
+    except BaseException:
+        record.ok = False
+        raise
+    finally:
+        record.seconds = time.perf_counter() - started
+        _stage_stack.reset(token)
+        _emit("on_stage", record)
+
+
+def timed_stage(name: str) -> Callable:
+    """Decorator form of ``stage`` for plain and ``async`` functions."""
+
+    def decorate(fn: Callable) -> Callable:
+        if asyncio.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                with stage(name):
+                    return await fn(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with stage(name):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def note_retry() -> None:
+    """Count a retry against the provider call in flight, or else the innermost stage."""
+    call = _active_call.get()
+    if call is not None:
+        call.retries += 1
+        return
+    stages = _stage_stack.get()
+    if stages:
+        stages[-1].retries += 1
+
+
+def record_usage(usage: Any) -> None:
+    """Store provider-reported token usage (an OpenAI-style ``usage`` object) on the call in flight."""
+    call = _active_call.get()
+    if call is None or usage is None:
+        return
+    prompt = getattr(usage, "prompt_tokens", None)
+    completion = getattr(usage, "completion_tokens", None)
+    if prompt is None and completion is None:
+        return
+    call.prompt_tokens = prompt or 0
+    call.completion_tokens = completion or 0
+    call.estimated_tokens = False
+
+
+def record_cache_hit() -> None:
+    """Mark the call in flight as served from the completion cache (no tokens spent)."""
+    call = _active_call.get()
+    if call is not None:
+        call.cached = True
+        call.prompt_tokens = call.completion_tokens = 0
+        call.estimated_tokens = False
+
+
+class InstrumentedProvider(LLMProvider):
+    """Times each call to ``provider`` and reports it with tokens and retries.
+
+    Attributes not defined here are forwarded to the wrapped provider.
+    """
+
+    def __init__(self, provider: LLMProvider):
+        self.provider = provider
+
+    def __getattr__(self, item: str) -> Any:
+        return getattr(self.provider, item)
+
+    @property
+    def name(self) -> str:  # type: ignore[override]
+        return self.provider.name
+
+    @property
+    def model(self) -> Optional[str]:
+        return self.provider.model
+
+    @property
+    def max_tokens(self) -> Optional[int]:
+        return self.provider.max_tokens
+
+    async def aclose(self) -> None:
+        await self.provider.aclose()
+
+    def _start(self, streamed: bool = False) -> CallRecord:
+        stages = _stage_stack.get()
+        return CallRecord(
+            provider=self.provider.name,
+            model=self.provider.model,
+            stage=stages[-1].name if stages else None,
+            streamed=streamed,
+        )
+
+    @staticmethod
+    def _finish(record: CallRecord, started: float, system_prompt: str, user_prompt: str, text: str) -> None:
+        record.seconds = time.perf_counter() - started
+        if record.estimated_tokens:
+            record.prompt_tokens = estimate_tokens(system_prompt) + estimate_tokens(user_prompt)
+            record.completion_tokens = estimate_tokens(text)
+        _emit("on_call", record)
+
+    def complete(self, *, system_prompt: str, user_prompt: str, temperature: float = 0.2, max_tokens: Optional[int] = None) -> str:
+        if not _sinks():
+            return self.provider.complete(system_prompt=system_prompt, user_prompt=user_prompt, temperature=temperature, max_tokens=max_tokens)
+        record = self._start()
+        token = _active_call.set(record)
+        started = time.perf_counter()
+        text = ""
+        try:
+            text = self.provider.complete(system_prompt=system_prompt, user_prompt=user_prompt, temperature=temperature, max_tokens=max_tokens)
+            return text
+        except BaseException:
+            record.ok = False
+            raise
+        finally:
+            _active_call.reset(token)
+            self._finish(record, started, system_prompt, user_prompt, text)
+
+    async def acomplete(self, *, system_prompt: str, user_prompt: str, temperature: float = 0.2, max_tokens: Optional[int] = None) -> str:
+        if not _sinks():
+            return await self.provider.acomplete(system_prompt=system_prompt, user_prompt=user_prompt, temperature=temperature, max_tokens=max_tokens)
+        record = self._start()
+        token = _active_call.set(record)
+        started = time.perf_counter()
+        text = ""
+        try:
+            text = await self.provider.acomplete(system_prompt=system_prompt, user_prompt=user_prompt, temperature=temperature, max_tokens=max_tokens)
+            return text
+        except BaseException:
+            record.ok = False
+            raise
+        finally:
+            _active_call.reset(token)
+            self._finish(record, started, system_prompt, user_prompt, text)
+
+    def stream(self, *, system_prompt: str, user_prompt: str, temperature: float = 0.2, max_tokens: Optional[int] = None) -> Iterator[str]:
+        if not _sinks():
+            yield from self.provider.stream(system_prompt=system_prompt, user_prompt=user_prompt, temperature=temperature, max_tokens=max_tokens)
+            return
+        record = self._start(streamed=True)
+        started = time.perf_counter()
+        chunks: list[str] = []
+        try:
+            inner = self.provider.stream(system_prompt=system_prompt, user_prompt=user_prompt, temperature=temperature, max_tokens=max_tokens)
+            while True:
+                # The active call is only set while the provider runs, never across our own yield
+                token = _active_call.set(record)
+                try:
+                    chunk = next(inner)
+                except StopIteration:
+                    break
+                finally:
+                    _active_call.reset(token)
+                chunks.append(chunk)
+                yield chunk
+        except BaseException:
+            record.ok = False
+            raise
+        finally:
+            self._finish(record, started, system_prompt, user_prompt, "".join(chunks))
+
+    async def astream(self, *, system_prompt: str, user_prompt: str, temperature: float = 0.2, max_tokens: Optional[int] = None) -> AsyncIterator[str]:
+        if not _sinks():
+            async for chunk in self.provider.astream(system_prompt=system_prompt, user_prompt=user_prompt, temperature=temperature, max_tokens=max_tokens):
+                yield chunk
+            return
+        record = self._start(streamed=True)
+        started = time.perf_counter()
+        chunks: list[str] = []
+        try:
+            inner = self.provider.astream(system_prompt=system_prompt, user_prompt=user_prompt, temperature=temperature, max_tokens=max_tokens)
+            while True:
+                token = _active_call.set(record)
+                try:
+                    chunk = await inner.__anext__()
+                except StopAsyncIteration:
+                    break
+                finally:
+                    _active_call.reset(token)
+                chunks.append(chunk)
+                yield chunk
+        except BaseException:
+            record.ok = False
+            raise
+        finally:
+            self._finish(record, started, system_prompt, user_prompt, "".join(chunks))
+
+
+@contextmanager
+def profiled(stream: TextIO = sys.stderr, *, top: int = 25, output: Optional[str] = None) -> Iterator[None]:
+    """Run the block under cProfile and tracemalloc and print the hottest functions and allocations.
+
+    ``output`` additionally saves the raw profile for ``snakeviz``/``pstats``.
+    """
+    import cProfile
+    import pstats
+    import tracemalloc
+
+    profiler = cProfile.Profile()
+    tracemalloc.start()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        if output:
+            profiler.dump_stats(output)
+        stream.write(f"\n== cProfile: top {top} by cumulative time ==\n")
+        pstats.Stats(profiler, stream=stream).sort_stats("cumulative").print_stats(top)
+        stream.write(f"== tracemalloc: current {current / 1024:.1f} KiB, peak {peak / 1024:.1f} KiB; top {top} allocation sites ==\n")
+        for stat in snapshot.statistics("lineno")[:top]:
+            stream.write(f"{stat}\n")
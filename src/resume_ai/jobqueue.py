@@ -0,0 +1,380 @@
+"""Durable, resumable batch processing on a SQLite job queue.
+
+Each input becomes a job keyed by the hash of its content, so enqueueing
+the same file twice (or from a rerun) never creates a second job. A job
+moves through three stages and stores the result of each as it goes:
+
+- ``extracted``: schema-shaped data from ``ResumeProcessor.extract``;
+- ``rewritten``: the validated ``Resume`` JSON;
+- ``rendered``: the resume JSON and every requested format written; the job is done.
+
+Workers, usually one per process, lease one job at a time. A background
+heartbeat keeps the lease alive while the job runs. A crashed or killed
+worker stops renewing its lease, so the job is leased again once the
+lease expires. The new worker resumes from the last saved stage, and an
+LLM stage that already finished is never paid for twice. A job that
+failed waits out an exponential backoff before its next attempt, so a
+rate-limited provider is not hammered by immediate retries.
+
+Fused extract+rewrite is not used here, because stages must be saved
+separately.
+"""
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional, Sequence, Union
+
+from resume_ai.models import Resume
+from resume_ai.pipeline import ResumeProcessor
+from resume_ai.store import input_key
+
+logger = logging.getLogger("resume_ai.jobqueue")
+
+STAGES = ("queued", "extracted", "rewritten", "rendered")
+# What a job at each stage is working on next, for error messages
+NEXT_STEP = {"queued": "extract", "extracted": "rewrite", "rewritten": "render"}
+STATES = ("pending", "leased", "done", "failed")
+
+_COLUMNS = "key, source, input, stage, state, extracted, resume, outputs, attempts, error, worker"
+
+
+class LeaseLost(Exception):
+    """The job was reclaimed by another worker after this worker's lease expired."""
+
+
+@dataclass
+class Job:
+    key: str
+    source: str
+    input: str
+    stage: str = "queued"
+    state: str = "pending"
+    extracted: Optional[dict] = None
+    resume: Optional[str] = None
+    outputs: dict[str, str] = field(default_factory=dict)
+    attempts: int = 0
+    error: Optional[str] = None
+    worker: Optional[str] = None
+
+    @property
+    def name(self) -> str:
+        return Path(self.source).stem
+
+
+def _job(row: tuple) -> Job:
+    key, source, text, stage, state, extracted, resume, outputs, attempts, error, worker = row
+    return Job(
+        key, source, text, stage, state, json.loads(extracted) if extracted else None, resume,
+        json.loads(outputs) if outputs else {}, attempts, error, worker,
+    )
+
+
+class JobQueue:
+    """Jobs, their saved stage results and their leases, in one SQLite file.
+
+    Every process opens its own ``JobQueue`` on the same path; leasing
+    runs in an immediate transaction, so no two workers ever hold the
+    same job. For a pending job, ``lease_expires`` holds the earliest time
+    it may be retried.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        *,
+        lease_seconds: float = 120.0,
+        max_attempts: int = 3,
+        retry_backoff: float = 5.0,
+    ):
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        # Delay before the second attempt; it doubles with every further attempt
+        self.retry_backoff = retry_backoff
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None, timeout=30.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " key TEXT PRIMARY KEY, source TEXT NOT NULL, input TEXT NOT NULL,"
+            " stage TEXT NOT NULL DEFAULT 'queued', state TEXT NOT NULL DEFAULT 'pending',"
+            " extracted TEXT, resume TEXT, outputs TEXT, attempts INTEGER NOT NULL DEFAULT 0, error TEXT,"
+            " worker TEXT, lease_expires REAL, created REAL NOT NULL, updated REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_state ON jobs(state, lease_expires)")
+
+    def enqueue(self, inputs: Iterable[Union[Path, tuple[str, str]]]) -> list[str]:
+        """Add input files (or ``(source, text)`` pairs) and return their job keys.
+
+        Inputs already in the queue keep their progress; failed jobs are
+        given a fresh set of attempts.
+        """
+        now = time.time()
+        rows = []
+        for item in inputs:
+            source, text = (str(item), item.read_text(encoding="utf-8")) if isinstance(item, Path) else item
+            rows.append((input_key(text), source, text, now, now))
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._conn.executemany(
+                "INSERT INTO jobs (key, source, input, created, updated) VALUES (?, ?, ?, ?, ?)"
+                " ON CONFLICT(key) DO UPDATE SET state = 'pending', attempts = 0, error = NULL, lease_expires = NULL,"
+                " updated = excluded.updated"
+                " WHERE jobs.state = 'failed'",
+                rows,
+            )
+            self._conn.execute("COMMIT")
+        return [row[0] for row in rows]
+
+    def lease(self, worker: str) -> Optional[Job]:
+        """Claim the oldest pending job that is due, or one whose lease has expired."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                # A job that keeps killing its workers is given up on instead of leased forever
+                self._conn.execute(
+                    "UPDATE jobs SET state = 'failed', error = 'lease expired ' || attempts || ' times', worker = NULL,"
+                    " updated = ? WHERE state = 'leased' AND lease_expires < ? AND attempts >= ?",
+                    (now, now, self.max_attempts),
+                )
+                row = self._conn.execute(
+                    f"SELECT {_COLUMNS} FROM jobs WHERE (state = 'pending' AND (lease_expires IS NULL OR lease_expires <= ?))"
+                    " OR (state = 'leased' AND lease_expires < ?) ORDER BY created, key LIMIT 1",
+                    (now, now),
+                ).fetchone()
+                if row is not None:
+                    self._conn.execute(
+                        "UPDATE jobs SET state = 'leased', worker = ?, lease_expires = ?, attempts = attempts + 1,"
+                        " updated = ? WHERE key = ?",
+                        (worker, now + self.lease_seconds, now, row[0]),
+                    )
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+        if row is None:
+            return None
+        job = _job(row)
+        job.state, job.worker, job.attempts = "leased", worker, job.attempts + 1
+        return job
+
+    def _update(self, key: str, worker: str, assignments: str, params: Sequence[Any]) -> bool:
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                f"UPDATE jobs SET {assignments}, updated = ? WHERE key = ? AND worker = ? AND state = 'leased'",
+                (*params, now, key, worker),
+            )
+        return cursor.rowcount == 1
+
+    def heartbeat(self, key: str, worker: str) -> bool:
+        """Extend ``worker``'s lease on ``key``; ``False`` when the lease was lost."""
+        return self._update(key, worker, "lease_expires = ?", (time.time() + self.lease_seconds,))
+
+    def save_extracted(self, key: str, worker: str, data: dict) -> None:
+        self._save(key, worker, "stage = 'extracted', extracted = ?", (json.dumps(data),))
+
+    def save_resume(self, key: str, worker: str, resume: Resume) -> None:
+        self._save(key, worker, "stage = 'rewritten', resume = ?", (resume.model_dump_json(),))
+
+    def save_outputs(self, key: str, worker: str, outputs: dict[str, str]) -> None:
+        self._save(key, worker, "outputs = ?", (json.dumps(outputs),))
+
+    def complete(self, key: str, worker: str) -> None:
+        self._save(key, worker, "stage = 'rendered', state = 'done', error = NULL, lease_expires = NULL", ())
+
+    def _save(self, key: str, worker: str, assignments: str, params: Sequence[Any]) -> None:
+        if not self._update(key, worker, assignments, params):
+            raise LeaseLost(key)
+
+    def fail(self, key: str, worker: str, error: str) -> bool:
+        """Record an error and release the job; ``True`` when it will be retried after a backoff."""
+        with self._lock:
+            attempts = self._conn.execute("SELECT attempts FROM jobs WHERE key = ?", (key,)).fetchone()
+        retry = attempts is not None and attempts[0] < self.max_attempts
+        retry_at = time.time() + self.retry_backoff * 2 ** (attempts[0] - 1) if retry else None
+        self._update(
+            key, worker, "state = ?, error = ?, worker = NULL, lease_expires = ?", ("pending" if retry else "failed", error, retry_at)
+        )
+        return retry
+
+    def next_retry(self) -> Optional[float]:
+        """When the earliest pending job becomes due, or ``None`` when nothing is pending."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COUNT(*), MIN(COALESCE(lease_expires, 0)) FROM jobs WHERE state = 'pending'"
+            ).fetchone()
+        return row[1] if row[0] else None
+
+    def get(self, key: str) -> Optional[Job]:
+        with self._lock:
+            row = self._conn.execute(f"SELECT {_COLUMNS} FROM jobs WHERE key = ?", (key,)).fetchone()
+        return _job(row) if row else None
+
+    def jobs(self, keys: Optional[Iterable[str]] = None) -> list[Job]:
+        """Jobs in enqueue order, or only those with the given keys."""
+        with self._lock:
+            rows = self._conn.execute(f"SELECT {_COLUMNS} FROM jobs ORDER BY created, key").fetchall()
+        jobs = [_job(row) for row in rows]
+        if keys is None:
+            return jobs
+        by_key = {job.key: job for job in jobs}
+        return [by_key[key] for key in keys if key in by_key]
+
+    def counts(self) -> dict[str, int]:
+        """Number of jobs in each state."""
+        with self._lock:
+            rows = dict(self._conn.execute("SELECT state, COUNT(*) FROM jobs GROUP BY state").fetchall())
+        return {state: rows.get(state, 0) for state in STATES}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class _Heartbeat:
+    """Renews a lease on a background thread while a job runs."""
+
+    def __init__(self, queue: JobQueue, job: Job, interval: float):
+        self.queue, self.job, self.interval = queue, job, interval
+        self.lost = False
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"heartbeat-{job.key[:8]}", daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                renewed = self.queue.heartbeat(self.job.key, self.job.worker)
+            except sqlite3.OperationalError as e:
+                # A lease that cannot be renewed may expire; treat it as lost rather than die silently
+                logger.warning("Could not renew the lease on %s: %s", self.job.source, e)
+                renewed = False
+            if not renewed:
+                self.lost = True
+                return
+
+    def __enter__(self) -> "_Heartbeat":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._thread.join()
+
+
+def _run_job(queue: JobQueue, processor: ResumeProcessor, job: Job, output_dir: Path, formats: Sequence[str]) -> None:
+    """Run whatever stages of ``job`` are not finished yet, saving each one."""
+    key, worker = job.key, job.worker
+    if job.resume is None:
+        if job.extracted is None:
+            job.extracted = processor.extract(job.input)
+            queue.save_extracted(key, worker, job.extracted)
+            job.stage = "extracted"
+        resume = processor.rewrite_resume(job.extracted)
+        processor.persist(job.input, resume)
+        queue.save_resume(key, worker, resume)
+        job.stage = "rewritten"
+    else:
+        resume = Resume.model_validate_json(job.resume)
+    # The resume JSON is written next to the rendered files, as in ``run_batch``
+    for fmt in ("json", *formats):
+        if fmt in job.outputs and Path(job.outputs[fmt]).exists():
+            continue
+        path = output_dir / f"{job.name}.{fmt}"
+        if fmt == "json":
+            path.write_text(resume.model_dump_json(indent=2), encoding="utf-8")
+        else:
+            processor.render_file(resume, fmt, path)
+        job.outputs[fmt] = str(path)
+        queue.save_outputs(key, worker, job.outputs)
+    queue.complete(key, worker)
+
+
+def run_worker(
+    queue_path: Union[str, Path],
+    make_processor: Callable[[], ResumeProcessor],
+    *,
+    output_dir: Union[str, Path],
+    formats: Sequence[str] = ("pdf", "docx"),
+    lease_seconds: float = 120.0,
+    max_attempts: int = 3,
+    retry_backoff: float = 5.0,
+    worker_id: Optional[str] = None,
+) -> int:
+    """Lease and run jobs until none are left; returns how many this worker finished.
+
+    Jobs waiting out a retry backoff are waited for, so a worker only
+    stops once nothing is left pending.
+
+    ``make_processor`` is called once, in the worker's own process, so
+    provider clients are never shared across processes.
+    """
+    worker = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    queue = JobQueue(queue_path, lease_seconds=lease_seconds, max_attempts=max_attempts, retry_backoff=retry_backoff)
+    processor = make_processor()
+    finished = 0
+    try:
+        while True:
+            job = queue.lease(worker)
+            if job is None:
+                retry_at = queue.next_retry()
+                if retry_at is None:
+                    break
+                time.sleep(max(0.0, retry_at - time.time()))
+                continue
+            with _Heartbeat(queue, job, lease_seconds / 3) as heartbeat:
+                try:
+                    _run_job(queue, processor, job, output_dir, formats)
+                    finished += 1
+                except LeaseLost:
+                    logger.warning("Lost the lease on %s; another worker took it over", job.source)
+                except Exception as e:
+                    if heartbeat.lost:
+                        continue
+                    retry = queue.fail(job.key, worker, f"{NEXT_STEP.get(job.stage, job.stage)}: {e}")
+                    logger.warning("%s failed (%s)%s", job.source, e, "; will retry" if retry else "")
+    finally:
+        queue.close()
+    return finished
+
+
+def run_queue(
+    queue_path: Union[str, Path],
+    make_processor: Callable[[], ResumeProcessor],
+    *,
+    output_dir: Union[str, Path],
+    formats: Sequence[str] = ("pdf", "docx"),
+    processes: int = 4,
+    lease_seconds: float = 120.0,
+    max_attempts: int = 3,
+    retry_backoff: float = 5.0,
+) -> dict[str, int]:
+    """Drain the queue with ``processes`` worker processes and return the final job counts.
+
+    ``make_processor`` must be picklable, e.g. a module-level function or
+    a ``functools.partial`` of one.
+    """
+    options = dict(
+        output_dir=output_dir, formats=formats, lease_seconds=lease_seconds, max_attempts=max_attempts, retry_backoff=retry_backoff
+    )
+    with ProcessPoolExecutor(max_workers=max(1, processes)) as pool:
+        futures = [pool.submit(run_worker, queue_path, make_processor, **options) for _ in range(max(1, processes))]
+        for future in futures:
+            future.result()
+    queue = JobQueue(queue_path, lease_seconds=lease_seconds, max_attempts=max_attempts)
+    try:
+        return queue.counts()
+    finally:
+        queue.close()
@@ -0,0 +1,244 @@
+"""Locate, repair and parse the JSON object in an LLM completion.
+
+Everything here is a single left-to-right scan: no backtracking regexes,
+so a long completion with stray braces in trailing prose costs linear
+time. Repairs cover what models commonly get wrong: trailing commas,
+smart quotes used as delimiters, raw newlines inside strings, Python
+literals, and output cut off mid-value by ``max_tokens``.
+"""
+import json
+import logging
+from typing import Any, Optional
+
+OPENERS = {"{": "}", "[": "]"}
+SMART_QUOTES = "“”„‟"
+PYTHON_LITERALS = {"True": "true", "False": "false", "None": "null"}
+
+logger = logging.getLogger("resume_ai.json_extract")
+
+
+class JSONExtractionError(json.JSONDecodeError):
+    """Raised when no usable JSON object can be recovered.
+
+    ``partial`` holds the top-level members that did parse and ``broken``
+    maps each member that did not to its raw text, so callers can re-ask
+    for just those sections.
+    """
+
+    def __init__(self, msg: str, doc: str, pos: int = 0, *, partial: Optional[dict] = None, broken: Optional[dict] = None):
+        super().__init__(msg, doc, pos)
+        self.partial = partial or {}
+        self.broken = broken or {}
+
+
+def find_json_object(text: str) -> Optional[tuple[int, int, bool]]:
+    """Span of the first JSON object in ``text`` as ``(start, end, complete)``.
+
+    ``complete`` is False when the text ends before the object closes.
+    """
+    start = text.find("{")
+    if start < 0:
+        return None
+    depth = 0
+    in_string = False
+    escape = False
+    quote = '"'
+    for i in range(start, len(text)):
+        c = text[i]
+        if in_string:
+            if escape:
+                escape = False
+            elif c == "\\":
+                escape = True
+            elif c == quote or (quote in SMART_QUOTES and c in SMART_QUOTES):
+                in_string = False
+            continue
+        if c == '"' or c in SMART_QUOTES:
+            in_string = True
+            quote = c
+        elif c in "{[":
+            depth += 1
+        elif c in "}]":
+            depth -= 1
+            if depth == 0:
+                return start, i + 1, True
+    return start, len(text), False
+
+
+def repair_json(fragment: str) -> str:
+    """Best-effort local repair of a (possibly truncated) JSON object."""
+    out: list[str] = []
+    stack: list[str] = []
+    # (output length, open containers) at each point where a value just ended
+    cut_points: list[tuple[int, tuple[str, ...]]] = []
+    in_string = False
+    escape = False
+    smart = False
+    i = 0
+    n = len(fragment)
+    while i < n:
+        c = fragment[i]
+        if in_string:
+            if escape:
+                escape = False
+                out.append(c)
+            elif c == "\\":
+                escape = True
+                out.append(c)
+            elif (c == '"' and not smart) or (smart and c in SMART_QUOTES):
+                in_string = False
+                out.append('"')
+            elif c == '"':
+                out.append('\\"')
+            elif c == "\n":
+                out.append("\\n")
+            elif c == "\r":
+                out.append("\\r")
+            elif c == "\t":
+                out.append("\\t")
+            else:
+                out.append(c)
+            i += 1
+            continue
+        if c == '"' or c in SMART_QUOTES:
+            in_string = True
+            smart = c != '"'
+            out.append('"')
+        elif c in OPENERS:
+            stack.append(OPENERS[c])
+            out.append(c)
+        elif c in "}]":
+            _strip_trailing_comma(out)
+            if stack:
+                stack.pop()
+            out.append(c)
+            if not stack:
+                break
+        elif c == ",":
+            cut_points.append((len(out), tuple(stack)))
+            out.append(c)
+        elif c.isalpha():
+            j = i
+            while j < n and fragment[j].isalpha():
+                j += 1
+            word = fragment[i:j]
+            out.append(PYTHON_LITERALS.get(word, word))
+            i = j
+            continue
+        else:
+            out.append(c)
+        i += 1
+
+    if not in_string and not stack:
+        return "".join(out)
+
+    # Truncated output: close what is open, dropping a dangling partial member if needed
+    if in_string:
+        out.append('"')
+    attempts = [(len(out), tuple(stack))] + list(reversed(cut_points[-50:]))
+    for length, open_stack in attempts:
+        candidate = "".join(out[:length]).rstrip()
+        candidate = candidate.rstrip(",")
+        if candidate.endswith(":"):
+            candidate += " null"
+        candidate += "".join(reversed(open_stack))
+        try:
+            json.loads(candidate)
+            return candidate
+        except ValueError:
+            continue
+    return "".join(out) + "".join(reversed(stack))
+
+
+def _strip_trailing_comma(out: list[str]) -> None:
+    j = len(out) - 1
+    while j >= 0 and out[j].isspace():
+        j -= 1
+    if j >= 0 and out[j] == ",":
+        del out[j]
+
+
+def split_members(obj_text: str) -> dict[str, str]:
+    """Raw text of each top-level member of an object, keyed by member name."""
+    members: dict[str, str] = {}
+    depth = 0
+    in_string = False
+    escape = False
+    key: Optional[str] = None
+    key_start = value_start = 0
+    for i, c in enumerate(obj_text):
+        if in_string:
+            if escape:
+                escape = False
+            elif c == "\\":
+                escape = True
+            elif c == '"':
+                in_string = False
+                if depth == 1 and key is None:
+                    try:
+                        key = json.loads(obj_text[key_start:i + 1])
+                    except ValueError:
+                        key = obj_text[key_start + 1:i]
+            continue
+        if c == '"':
+            in_string = True
+            if depth == 1 and key is None:
+                key_start = i
+        elif c == ":" and depth == 1 and key is not None:
+            value_start = i + 1
+        elif c in "{[":
+            depth += 1
+        elif c in "}]" or (c == "," and depth == 1):
+            if c != ",":
+                depth -= 1
+            if depth == 1 and c == "," or depth == 0:
+                if key is not None:
+                    members[key] = obj_text[value_start:i].strip()
+                key = None
+    if key is not None and key not in members:
+        members[key] = obj_text[value_start:].strip()
+    return members
+
+
+def parse_json_object(text: str) -> Any:
+    """Parse the JSON object in an LLM response, handling markdown code blocks and extra text.
+
+    Tries the object as-is, then a locally repaired version. If that still
+    fails, raises ``JSONExtractionError`` carrying whichever top-level
+    members could be parsed on their own.
+    """
+    text = text.strip()
+    span = find_json_object(text)
+    if span is None:
+        # No object at all; let json report the error (or parse a bare value)
+        return json.loads(text)
+    start, end, complete = span
+    candidate = text[start:end]
+    if complete:
+        try:
+            return json.loads(candidate)
+        except ValueError:
+            pass
+    repaired = repair_json(candidate)
+    try:
+        data = json.loads(repaired)
+    except ValueError as e:
+        error = e
+    else:
+        if not complete:
+            # Closing the open containers keeps what arrived, but the rest is lost
+            logger.warning(
+                "Completion was cut off after %d characters; closed the truncated JSON, later fields are missing "
+                "(raise max_tokens or send smaller inputs)",
+                len(text),
+            )
+        return data
+
+    partial: dict[str, Any] = {}
+    broken: dict[str, str] = {}
+    for key, raw in split_members(candidate).items():
+        try:
+            partial[key] = json.loads(repair_json(raw) if raw[:1] in OPENERS else raw)
+        except ValueError:
+            broken[key] = raw
+    raise JSONExtractionError(f"Could not repair JSON: {error}", text, start, partial=partial, broken=broken)
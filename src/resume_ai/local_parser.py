@@ -0,0 +1,325 @@
+"""Rule-based extraction for well-structured plain-text resumes.
+
+Inputs with clear section headers, contact details, date ranges and
+bullets can be turned into schema-shaped data without an LLM call. Each
+section gets a confidence score so callers can send only the sections
+the rules could not handle to the LLM extractor.
+"""
+import re
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+EMAIL_RE = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+PHONE_RE = re.compile(r"(?<!\w)(?:\+?\d{1,3}[\s.-]?)?(?:\(\d{2,4}\)|\d{2,4})[\s.-]?\d{3,4}[\s.-]?\d{3,4}(?!\w)")
+URL_RE = re.compile(r"(?:https?://|www\.)\S+|(?:linkedin\.com|github\.com|gitlab\.com)/\S+", re.IGNORECASE)
+BULLET_RE = re.compile(r"^\s*(?:[-*•·▪–>]|\d+[.)])\s+")
+MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "sept": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+_MONTH = r"(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?"
+_DATE = rf"(?:{_MONTH}\s+\d{{4}}|\d{{1,2}}/\d{{4}}|\d{{4}}-\d{{2}}(?:-\d{{2}})?|\d{{4}})"
+_PRESENT = r"(?:present|current|now|today|ongoing)"
+DATE_RANGE_RE = re.compile(
+    rf"\(?\s*(?P<start>{_DATE})\s*(?:-|–|—|to|until)\s*(?P<end>{_DATE}|{_PRESENT})\s*\)?",
+    re.IGNORECASE,
+)
+SINGLE_DATE_RE = re.compile(rf"\(?\s*(?P<date>{_DATE})\s*\)?", re.IGNORECASE)
+DEGREE_RE = re.compile(
+    r"\b(?:B\.?\s?S\.?c?|B\.?\s?A\.?|B\.?\s?Tech|B\.?\s?E\.?|M\.?\s?S\.?c?|M\.?\s?A\.?|M\.?\s?Tech|MBA|Ph\.?\s?D\.?|"
+    r"Bachelor(?:'s)?|Master(?:'s)?|Doctorate|Associate(?:'s)?|Diploma|High School)\b",
+    re.IGNORECASE,
+)
+INSTITUTION_RE = re.compile(r"\b(?:University|College|Institute|School|Academy|Polytechnic)\b", re.IGNORECASE)
+
+SECTION_ALIASES = {
+    "summary": ("summary", "professional summary", "profile", "objective", "about", "about me", "career objective"),
+    "experience": (
+        "experience", "work experience", "professional experience", "employment", "employment history",
+        "work history", "career history",
+    ),
+    "education": ("education", "academic background", "education and training", "qualifications"),
+    "projects": ("projects", "personal projects", "academic projects", "key projects"),
+    "skills": ("skills", "technical skills", "core skills", "key skills", "core competencies", "technologies"),
+    "certifications": ("certifications", "certificates", "licenses", "licenses and certifications"),
+    "achievements": ("achievements", "awards", "honors", "honours", "accomplishments", "awards and honors"),
+    "extracurricular": ("extracurricular", "extracurricular activities", "volunteering", "volunteer experience", "activities", "leadership"),
+    "languages": ("languages",),
+    "interests": ("interests", "hobbies", "hobbies and interests"),
+}
+HEADER_LOOKUP = {alias: section for section, aliases in SECTION_ALIASES.items() for alias in aliases}
+HEADER_RE = re.compile(r"^\s*#*\s*(?P<title>[A-Za-z][A-Za-z &/]{1,40}?)\s*:?\s*$")
+LIST_SPLIT_RE = re.compile(r"\s*[,;|•]\s*")
+ENTRY_SPLIT_RE = re.compile(r"\s+(?:at|@)\s+|\s*,\s*|\s+[|–—-]\s+")
+
+
+def _empty_resume() -> dict:
+    return {
+        "contact": {"full_name": None, "email": None, "phone": None, "location": None, "links": []},
+        "summary": None,
+        "experience": [],
+        "projects": [],
+        "education": [],
+        "skills": [],
+        "certifications": [],
+        "achievements": [],
+        "extracurricular": [],
+        "languages": [],
+        "interests": [],
+    }
+
+
+def normalize_date(value: str) -> Optional[str]:
+    """``Jun 2024`` -> ``2024-06-01``, ``06/2024`` -> ``2024-06-01``; bare years stay as ``YYYY``."""
+    value = value.strip().rstrip(".").lower()
+    if re.fullmatch(_PRESENT, value):
+        return None
+    match = re.fullmatch(rf"({_MONTH})\s+(\d{{4}})", value)
+    if match:
+        month = MONTHS.get(match.group(1).rstrip(".")[:4]) or MONTHS.get(match.group(1)[:3])
+        return f"{match.group(2)}-{month:02d}-01"
+    match = re.fullmatch(r"(\d{1,2})/(\d{4})", value)
+    if match:
+        return f"{match.group(2)}-{int(match.group(1)):02d}-01"
+    match = re.fullmatch(r"(\d{4})-(\d{2})", value)
+    if match:
+        return f"{value}-01"
+    return value
+
+
+@dataclass
+class LocalExtraction:
+    data: dict[str, Any]
+    confidence: dict[str, float] = field(default_factory=dict)
+    section_text: dict[str, str] = field(default_factory=dict)
+    headers: list[str] = field(default_factory=list)
+
+    @property
+    def structured(self) -> bool:
+        """True when the input had recognizable section headers."""
+        return bool(self.headers)
+
+    @property
+    def overall(self) -> float:
+        return min(self.confidence.values()) if self.confidence else 0.0
+
+    def low_confidence(self, threshold: float) -> list[str]:
+        return [section for section, score in self.confidence.items() if score < threshold]
+
+    def text_for(self, sections: list[str]) -> str:
+        """Original text of ``sections`` (with headers) for a targeted LLM fallback."""
+        parts = []
+        for section in sections:
+            text = self.section_text.get(section, "")
+            parts.append(text if section == "contact" else f"{section.title()}\n{text}")
+        return "\n\n".join(parts)
+
+    def merge(self, llm_data: dict, sections: list[str]) -> dict:
+        """Replace ``sections`` with the LLM's extraction of them."""
+        merged = dict(self.data)
+        for section in sections:
+            if section in llm_data:
+                merged[section] = llm_data[section]
+        return merged
+
+
+class LocalExtractor:
+    def extract(self, text: str) -> LocalExtraction:
+        blocks = self._split_sections(text)
+        headers = [section for section in blocks if section != "contact"]
+        data = _empty_resume()
+        confidence: dict[str, float] = {}
+
+        contact_lines = blocks.pop("contact", [])
+        contact, summary_lines, confidence["contact"] = self._parse_contact(contact_lines)
+        data["contact"] = contact
+        if summary_lines and "summary" not in blocks:
+            blocks["summary"] = summary_lines
+
+        for section, lines in blocks.items():
+            parser = getattr(self, f"_parse_{section}", self._parse_list)
+            data[section], confidence[section] = parser(lines)
+
+        section_text = {"contact": "\n".join(contact_lines)}
+        section_text.update({section: "\n".join(lines) for section, lines in blocks.items()})
+        return LocalExtraction(data=data, confidence=confidence, section_text=section_text, headers=headers)
+
+    def _split_sections(self, text: str) -> dict[str, list[str]]:
+        blocks: dict[str, list[str]] = {"contact": []}
+        current = "contact"
+        for raw_line in text.splitlines():
+            line = raw_line.rstrip()
+            if not line.strip():
+                continue
+            header = HEADER_RE.match(line)
+            section = HEADER_LOOKUP.get(header.group("title").strip().lower()) if header else None
+            if section:
+                current = section
+                blocks.setdefault(current, [])
+                continue
+            blocks[current].append(line.strip())
+        return {k: v for k, v in blocks.items() if v or k == "contact"}
+
+    def _parse_contact(self, lines: list[str]) -> tuple[dict, list[str], float]:
+        contact = {"full_name": None, "email": None, "phone": None, "location": None, "links": []}
+        leftovers = []
+        for line in lines:
+            email = EMAIL_RE.search(line)
+            phone = PHONE_RE.search(line)
+            links = URL_RE.findall(line)
+            if not (email or phone or links):
+                if contact["full_name"] is None and len(line.split()) <= 5 and not any(ch.isdigit() for ch in line):
+                    contact["full_name"] = line
+                else:
+                    leftovers.append(line)
+                continue
+            if email and not contact["email"]:
+                contact["email"] = email.group(0)
+            if phone and not contact["phone"]:
+                contact["phone"] = phone.group(0).strip()
+            contact["links"].extend(link.rstrip(".,;") for link in links if link not in contact["links"])
+            for part in re.split(r"\s*[|•·]\s*", line):
+                part = part.strip()
+                if part and not (EMAIL_RE.search(part) or PHONE_RE.search(part) or URL_RE.search(part)):
+                    contact["location"] = contact["location"] or part
+        score = 0.0
+        if contact["full_name"]:
+            score += 0.5
+        if contact["email"] or contact["phone"]:
+            score += 0.5
+        return contact, leftovers, score
+
+    def _parse_summary(self, lines: list[str]) -> tuple[Optional[str], float]:
+        text = " ".join(BULLET_RE.sub("", line) for line in lines).strip()
+        return (text or None), (1.0 if text else 0.0)
+
+    def _split_entries(self, lines: list[str]) -> list[tuple[str, list[str]]]:
+        entries: list[tuple[str, list[str]]] = []
+        for line in lines:
+            if BULLET_RE.match(line) and entries:
+                entries[-1][1].append(BULLET_RE.sub("", line).strip())
+            else:
+                entries.append((BULLET_RE.sub("", line).strip(), []))
+        return entries
+
+    def _parse_experience(self, lines: list[str]) -> tuple[list[dict], float]:
+        items, scores = [], []
+        for header, bullets in self._split_entries(lines):
+            dates = DATE_RANGE_RE.search(header)
+            start = end = None
+            current = False
+            if dates:
+                start = normalize_date(dates.group("start"))
+                end = normalize_date(dates.group("end"))
+                current = end is None
+                header = (header[:dates.start()] + header[dates.end():]).strip(" ,:-|")
+            parts = [p.strip() for p in ENTRY_SPLIT_RE.split(header, maxsplit=1) if p.strip()]
+            title = parts[0] if parts else None
+            company = parts[1] if len(parts) > 1 else None
+            items.append({
+                "title": title,
+                "company": company,
+                "location": None,
+                "start_date": start,
+                "end_date": end,
+                "current": current,
+                "bullets": bullets,
+                "technologies": [],
+                "employment_type": None,
+            })
+            # A header holding a whole sentence is prose the rules cannot split reliably
+            prose = len(header.split()) > 12 or ":" in header
+            scores.append(0.0 if prose else (0.4 * bool(title) + 0.3 * bool(company) + 0.3 * bool(dates)))
+        return items, (min(scores) if scores else 0.0)
+
+    def _parse_projects(self, lines: list[str]) -> tuple[list[dict], float]:
+        items, scores = [], []
+        for header, bullets in self._split_entries(lines):
+            name, _, role = header.partition(" - ")
+            items.append({
+                "name": name.strip() or None,
+                "role": role.strip() or None,
+                "bullets": bullets,
+                "stack": [],
+                "link": (URL_RE.search(header).group(0) if URL_RE.search(header) else None),
+                "outcome": None,
+            })
+            scores.append(1.0 if name.strip() and len(header.split()) <= 12 else 0.3)
+        return items, (min(scores) if scores else 0.0)
+
+    def _parse_education(self, lines: list[str]) -> tuple[list[dict], float]:
+        items, scores = [], []
+        for header, details in self._split_entries(lines):
+            dates = DATE_RANGE_RE.search(header)
+            start = end = None
+            if dates:
+                start, end = normalize_date(dates.group("start")), normalize_date(dates.group("end"))
+                header = (header[:dates.start()] + header[dates.end():]).strip(" ,:-|")
+            else:
+                single = None
+                for single in SINGLE_DATE_RE.finditer(header):
+                    pass
+                if single:
+                    end = normalize_date(single.group("date"))
+                    header = (header[:single.start()] + header[single.end():]).strip(" ,:-|")
+            parts = [p.strip() for p in re.split(r"\s*[,|–—]\s*|\s+-\s+", header) if p.strip()]
+            degree = next((p for p in parts if DEGREE_RE.search(p)), None)
+            institution = next((p for p in parts if INSTITUTION_RE.search(p)), None)
+            field_name = None
+            if degree:
+                match = re.search(r"\b(?:in|of)\s+(.+)$", degree)
+                rest = DEGREE_RE.sub("", degree).strip(" .,")
+                field_name = match.group(1).strip() if match else (rest or None)
+            gpa = next((m.group(1) for d in details for m in [re.search(r"GPA[:\s]+([\d.]+)", d, re.IGNORECASE)] if m), None)
+            items.append({
+                "institution": institution,
+                "degree": degree,
+                "field": field_name,
+                "start_date": start,
+                "end_date": end,
+                "gpa": gpa,
+            })
+            scores.append(0.5 * bool(institution) + 0.5 * bool(degree))
+        return items, (min(scores) if scores else 0.0)
+
+    def _parse_skills(self, lines: list[str]) -> tuple[list[str], float]:
+        skills: list[str] = []
+        for line in lines:
+            line = BULLET_RE.sub("", line)
+            # "Languages: Python, Go" -> keep the items, drop the category label
+            if ":" in line:
+                line = line.split(":", 1)[1]
+            for item in LIST_SPLIT_RE.split(line):
+                item = item.strip(" .")
+                if item and item.lower() not in {s.lower() for s in skills}:
+                    skills.append(item)
+        long_items = sum(1 for s in skills if len(s.split()) > 4)
+        return skills, (0.0 if not skills else 1.0 - long_items / len(skills))
+
+    def _parse_certifications(self, lines: list[str]) -> tuple[list[dict], float]:
+        items = []
+        for line in lines:
+            name = BULLET_RE.sub("", line).strip()
+            date = SINGLE_DATE_RE.search(name)
+            items.append({
+                "name": name,
+                "issuer": None,
+                "date_obtained": normalize_date(date.group("date")) if date else None,
+                "credential_id": None,
+            })
+        # Issuers can't be told apart from names without context
+        return items, (0.7 if items else 0.0)
+
+    def _parse_list(self, lines: list[str]) -> tuple[list[str], float]:
+        items: list[str] = []
+        for line in lines:
+            if BULLET_RE.match(line):
+                items.append(BULLET_RE.sub("", line).strip())
+            else:
+                items.extend(i.strip() for i in LIST_SPLIT_RE.split(line) if i.strip())
+        return items, (1.0 if items else 0.0)
+
+    _parse_languages = _parse_list
+    _parse_interests = _parse_list
+    _parse_achievements = _parse_list
+    _parse_extracurricular = _parse_list
@@ -0,0 +1,230 @@
+"""Score resumes against job descriptions locally, without spending tokens.
+
+Each job description becomes a TF-IDF vector, with IDF taken over the
+batch of postings being screened, and its heaviest terms serve as the
+ATS keywords. A resume is indexed once from its skills, technologies,
+stack and bullets. Against every posting it gets:
+
+- a cosine similarity;
+- the share of keyword weight it covers, with matched and missing keywords;
+- a BM25 ranking of its bullets, most relevant first.
+
+With NumPy installed (``pip install '.[match]'``) a whole batch of
+resume x posting pairs is scored with a few matrix products. Without
+it, the same weights are combined with sparse dict products, giving
+identical scores, only slower.
+"""
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Mapping, Optional, Sequence, Union
+
+from resume_ai.models import Resume
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:
+    np = None
+
+# Keeps tech spellings whole: c++, c#, node.js, asp.net
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#.]*[a-z0-9+#]|[a-z0-9]")
+STOPWORDS = frozenset(
+    """
+    a about above across after all also an and any are as at be been being both but by can could
+    did do does doing for from had has have having how i if in into is it its our ours out over
+    per should so some such than that the their them then there these they this those through to
+    under up us very was we were what when where which while who will with within would you your
+    ability able candidate candidates degree etc experience experienced familiarity good great
+    ideal including job knowledge looking must nice plus preferred proficiency proficient
+    qualifications required requirements responsibilities role skills strong team understanding
+    using work working years year
+    """.split()
+)
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+
+def tokenize(text: str) -> list[str]:
+    return TOKEN_RE.findall(text.lower())
+
+
+def extract_terms(text: str) -> list[str]:
+    """Non-stopword unigrams plus bigrams of adjacent non-stopwords ("machine learning")."""
+    tokens = tokenize(text)
+    terms = [t for t in tokens if t not in STOPWORDS and not t.isdigit()]
+    for first, second in zip(tokens, tokens[1:]):
+        if first not in STOPWORDS and second not in STOPWORDS and not (first.isdigit() or second.isdigit()):
+            terms.append(f"{first} {second}")
+    return terms
+
+
+@dataclass(frozen=True)
+class Bullet:
+    section: str
+    entry: int
+    index: int
+    text: str
+
+
+class ResumeIndex:
+    """Term statistics of one resume, computed once and reused for every posting."""
+
+    def __init__(self, resume: Resume):
+        self.resume = resume
+        self.bullets = [
+            Bullet(section, i, j, text)
+            for section, entries in (("experience", resume.experience), ("projects", resume.projects))
+            for i, entry in enumerate(entries)
+            for j, text in enumerate(entry.bullets)
+        ]
+        keywords = list(resume.skills)
+        keywords += [t for exp in resume.experience for t in exp.technologies]
+        keywords += [t for proj in resume.projects for t in proj.stack]
+        self.skill_terms = Counter(term for keyword in keywords for term in extract_terms(keyword))
+        self.bullet_terms = [Counter(extract_terms(b.text)) for b in self.bullets]
+        self.term_counts = Counter(self.skill_terms)
+        for counts in self.bullet_terms:
+            self.term_counts.update(counts)
+        self.bm25_weights = self._bm25_weights()
+
+    def _bm25_weights(self) -> list[dict[str, float]]:
+        """Query-independent BM25 contribution of each term to each bullet."""
+        n = len(self.bullet_terms)
+        if not n:
+            return []
+        lengths = [sum(c.values()) for c in self.bullet_terms]
+        avg_length = (sum(lengths) / n) or 1.0
+        df = Counter(term for counts in self.bullet_terms for term in counts)
+        idf = {term: math.log(1 + (n - d + 0.5) / (d + 0.5)) for term, d in df.items()}
+        weights = []
+        for counts, length in zip(self.bullet_terms, lengths):
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * length / avg_length)
+            weights.append({t: idf[t] * tf * (BM25_K1 + 1) / (tf + norm) for t, tf in counts.items()})
+        return weights
+
+
+class JobIndex:
+    """TF-IDF vectors and ranked keywords for a batch of job descriptions."""
+
+    def __init__(self, descriptions: Union[Sequence[str], Mapping[str, str]], *, max_keywords: int = 25):
+        items = list(descriptions.items()) if isinstance(descriptions, Mapping) else list(enumerate(descriptions))
+        self.ids = [job_id for job_id, _ in items]
+        counts = [Counter(extract_terms(text)) for _, text in items]
+        n = len(counts)
+        df = Counter(term for c in counts for term in c)
+        # Smoothed IDF; terms outside every posting get the ceiling
+        self.idf = {term: math.log((n + 1) / (d + 1)) + 1 for term, d in df.items()}
+        self.max_idf = math.log(n + 1) + 1
+        self.vectors = [_normalize({t: (1 + math.log(tf)) * self.idf[t] for t, tf in c.items()}) for c in counts]
+        self.keywords = [
+            sorted(vector.items(), key=lambda kv: (-kv[1], kv[0]))[:max_keywords] for vector in self.vectors
+        ]
+        self.vocabulary = {term: i for i, term in enumerate(df)}
+
+    def resume_vector(self, index: ResumeIndex) -> dict[str, float]:
+        return _normalize(
+            {t: (1 + math.log(tf)) * self.idf.get(t, self.max_idf) for t, tf in index.term_counts.items()}
+        )
+
+
+@dataclass
+class JobMatch:
+    job_id: Union[int, str]
+    score: float
+    coverage: float
+    matched: list[str] = field(default_factory=list)
+    missing: list[str] = field(default_factory=list)
+    bullet_order: list[Bullet] = field(default_factory=list)
+
+
+def _normalize(vector: dict[str, float]) -> dict[str, float]:
+    norm = math.sqrt(sum(v * v for v in vector.values()))
+    return {t: v / norm for t, v in vector.items()} if norm else vector
+
+
+def _dot(a: dict[str, float], b: dict[str, float]) -> float:
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(v * b.get(t, 0.0) for t, v in a.items())
+
+
+def _score_python(indexes: list[ResumeIndex], jobs: JobIndex):
+    similarity, coverage, bullets = [], [], []
+    for index in indexes:
+        vector = jobs.resume_vector(index)
+        similarity.append([_dot(vector, job) for job in jobs.vectors])
+        coverage.append([
+            sum(w for t, w in keywords if t in index.term_counts) / (sum(w for _, w in keywords) or 1.0)
+            for keywords in jobs.keywords
+        ])
+        bullets.append([[_dot(weights, job) for weights in index.bm25_weights] for job in jobs.vectors])
+    return similarity, coverage, bullets
+
+
+def _score_numpy(indexes: list[ResumeIndex], jobs: JobIndex):
+    vocab = jobs.vocabulary
+    n_jobs, n_terms = len(jobs.vectors), len(vocab)
+
+    def matrix(rows: list[dict[str, float]]):
+        out = np.zeros((len(rows), n_terms))
+        cells = [(i, vocab[t], v) for i, row in enumerate(rows) for t, v in row.items() if t in vocab]
+        if cells:
+            r, c, v = zip(*cells)
+            out[list(r), list(c)] = v
+        return out
+
+    job_matrix = matrix(jobs.vectors)  # J x V
+    keyword_matrix = matrix([dict(k) for k in jobs.keywords])
+    # Every resume and every bullet of every resume in one product each
+    similarity = matrix([jobs.resume_vector(index) for index in indexes]) @ job_matrix.T
+    present = matrix([dict.fromkeys(index.term_counts, 1.0) for index in indexes])
+    totals = keyword_matrix.sum(axis=1)
+    coverage = (present @ keyword_matrix.T) / np.where(totals > 0, totals, 1.0)
+    all_bullets = [weights for index in indexes for weights in index.bm25_weights]
+    bullet_scores = matrix(all_bullets) @ job_matrix.T if all_bullets else np.zeros((0, n_jobs))
+    bullets, start = [], 0
+    for index in indexes:
+        block = bullet_scores[start:start + len(index.bm25_weights)]
+        bullets.append(block.T.tolist())
+        start += len(index.bm25_weights)
+    return similarity.tolist(), coverage.tolist(), bullets
+
+
+def score_many(
+    resumes: Sequence[Union[Resume, ResumeIndex]],
+    jobs: Union[JobIndex, Sequence[str], Mapping[str, str]],
+    *,
+    use_numpy: Optional[bool] = None,
+) -> list[list[JobMatch]]:
+    """Score every resume against every job description; one list of matches per resume, in job order."""
+    indexes = [r if isinstance(r, ResumeIndex) else ResumeIndex(r) for r in resumes]
+    job_index = jobs if isinstance(jobs, JobIndex) else JobIndex(jobs)
+    if use_numpy is None:
+        use_numpy = np is not None
+    if use_numpy and np is None:
+        raise ImportError("numpy is required for batched scoring; install with `pip install '.[match]'`")
+    similarity, coverage, bullets = (_score_numpy if use_numpy else _score_python)(indexes, job_index)
+
+    results = []
+    for n, index in enumerate(indexes):
+        matches = []
+        for j, job_id in enumerate(job_index.ids):
+            keywords = [t for t, _ in job_index.keywords[j]]
+            scores = bullets[n][j]
+            order = sorted(range(len(scores)), key=lambda b: -scores[b])
+            matches.append(JobMatch(
+                job_id=job_id,
+                score=round(similarity[n][j], 6),
+                coverage=round(coverage[n][j], 6),
+                matched=[t for t in keywords if t in index.term_counts],
+                missing=[t for t in keywords if t not in index.term_counts],
+                bullet_order=[index.bullets[b] for b in order],
+            ))
+        results.append(matches)
+    return results
+
+
+def score(resume: Union[Resume, ResumeIndex], jobs: Union[JobIndex, Sequence[str], Mapping[str, str]], **kwargs) -> list[JobMatch]:
+    """Score one resume against job descriptions, best match first."""
+    return sorted(score_many([resume], jobs, **kwargs)[0], key=lambda m: -m.score)
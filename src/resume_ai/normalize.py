@@ -0,0 +1,208 @@
+"""Normalize user-supplied resume JSON into the internal schema.
+
+The accepted shape (field aliases and coercions) is described by the
+tables below and compiled once, at import, into a single generated
+function, so normalizing a record runs no per-field dispatch or calls.
+The output matches what ``ResumeProcessor`` has always produced, quirks
+included: ``summary`` is not carried over, bullets are only kept next to
+a ``description``, and education entries are not type-checked.
+"""
+import re
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator, Union
+
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+")
+
+
+@dataclass(frozen=True)
+class Field:
+    """One output field; ``aliases`` are tried in order when ``name`` is falsy.
+
+    ``coerce`` is one of ``raw``, ``str`` (stringify unless None), ``flag``
+    (only a literal ``True`` counts), ``strings`` (non-blank strings only),
+    ``bullets`` (explicit bullets or the sentences of ``description``) and
+    ``links`` (contact links as strings).
+    """
+
+    name: str
+    aliases: tuple[str, ...] = ()
+    coerce: str = "raw"
+
+
+@dataclass(frozen=True)
+class Record:
+    """A single object of ``fields``."""
+
+    fields: tuple[Field, ...]
+
+
+@dataclass(frozen=True)
+class Entries:
+    """A list of objects of ``fields``; ``strict`` drops a non-list section and non-dict entries."""
+
+    fields: tuple[Field, ...]
+    strict: bool = True
+
+
+@dataclass(frozen=True)
+class Items:
+    """A flat list of ``kind`` items; ``fallback`` keys are read when nothing usable is found."""
+
+    kind: type = str
+    fallback: tuple[str, ...] = ()
+
+
+Section = Union[Record, Entries, Items, None]
+
+# Output key order follows the Resume model; None means "always null"
+SCHEMA: dict[str, Section] = {
+    "contact": Record((
+        Field("full_name", aliases=("name",)),
+        Field("email"),
+        Field("phone"),
+        Field("location"),
+        Field("links", coerce="links"),
+    )),
+    "summary": None,
+    "experience": Entries((
+        Field("title", aliases=("job_title",)),
+        Field("company"),
+        Field("location"),
+        Field("start_date", coerce="str"),
+        Field("end_date", coerce="str"),
+        Field("current", coerce="flag"),
+        Field("bullets", coerce="bullets"),
+        Field("technologies", coerce="strings"),
+        Field("employment_type"),
+    )),
+    "projects": Entries((
+        Field("name"),
+        Field("role"),
+        Field("bullets", coerce="bullets"),
+        Field("stack", coerce="strings"),
+        Field("link"),
+        Field("outcome"),
+    )),
+    "education": Entries((
+        Field("institution"),
+        Field("degree"),
+        Field("field"),
+        Field("start_date", coerce="str"),
+        Field("end_date", aliases=("graduation_year",), coerce="str"),
+        Field("gpa"),
+    ), strict=False),
+    "skills": Items(),
+    "certifications": Items(dict),
+    "achievements": Items(),
+    "extracurricular": Items(fallback=("volunteering", "volunteer")),
+    "languages": Items(),
+    "interests": Items(),
+}
+
+
+def _sentence_bullets(text: str) -> list[str]:
+    return [p.strip() for p in _SENTENCE_END_RE.split(text.strip()) if p.strip()]
+
+
+def _links(links: Any) -> list[str]:
+    if isinstance(links, dict):
+        links = list(links.values())
+    elif not isinstance(links, list):
+        return []
+    out = []
+    for link in links:
+        if isinstance(link, dict):
+            value = link.get("value") or link.get("url") or link.get("link") or link.get("href")
+            if value:
+                out.append(str(value))
+        elif isinstance(link, str):
+            if link.strip():
+                out.append(link.strip())
+        else:
+            out.append(str(link))
+    return out
+
+
+def _keep(kind: type, var: str) -> str:
+    if kind is str:
+        return f"isinstance({var}, str) and {var}.strip()"
+    return f"isinstance({var}, {kind.__name__})"
+
+
+def _field_expr(field: Field) -> str:
+    value = " or ".join(f"e.get({key!r})" for key in (field.name, *field.aliases))
+    if field.coerce == "raw":
+        return value
+    if field.coerce == "str":
+        return f"(None if (_v := {value}) is None else str(_v))"
+    if field.coerce == "flag":
+        return f"e.get({field.name!r}, False) is True"
+    if field.coerce == "strings":
+        return f"[x for x in (e.get({field.name!r}, []) or []) if {_keep(str, 'x')}]"
+    if field.coerce == "bullets":
+        source = f"((e.get({field.name!r}) or _sentence_bullets(_d)) if _d else [])"
+        return f"[x for x in {source} if {_keep(str, 'x')}]"
+    if field.coerce == "links":
+        return f"_links(e.get({field.name!r}, []) or [])"
+    raise ValueError(f"Unknown coercion: {field.coerce}")
+
+
+_DESCRIPTION = "(e.get('description') or '')"
+
+
+def _uses_description(fields: tuple[Field, ...]) -> bool:
+    return any(f.coerce == "bullets" for f in fields)
+
+
+def _record_expr(fields: tuple[Field, ...], indent: str) -> str:
+    items = "".join(f"{indent}    {f.name!r}: {_field_expr(f)},\n" for f in fields)
+    return "{\n" + items + indent + "}"
+
+
+def _compile(schema: dict[str, Section]) -> str:
+    # A single function with every entry inlined: no per-entry or per-field calls
+    body = ["def normalize_resume(data):", "    if not isinstance(data, dict):", "        data = {}"]
+    for name, section in schema.items():
+        if section is None:
+            body.append(f"    {name} = None")
+        elif isinstance(section, Record):
+            body.append(f"    e = data.get({name!r}, {{}})")
+            if _uses_description(section.fields):
+                body.append(f"    _d = {_DESCRIPTION}")
+            body.append(f"    {name} = {_record_expr(section.fields, '    ')}")
+        elif isinstance(section, Entries):
+            entry = _record_expr(section.fields, "        ")
+            # Binds the entry's description for its bullets without a helper call
+            loop = "for e in items" + (f" for _d in ({_DESCRIPTION},)" if _uses_description(section.fields) else "")
+            body.append(f"    items = data.get({name!r}, [])")
+            if section.strict:
+                loop = loop.replace("for e in items", "for e in items if isinstance(e, dict)", 1)
+                body.append(f"    {name} = [{entry} {loop}] if isinstance(items, list) else []")
+            else:
+                body.append(f"    {name} = [{entry} {loop}]")
+        else:
+            keep = _keep(section.kind, "x")
+            body.append(f"    {name} = [x for x in data.get({name!r}, []) if {keep}]")
+            if section.fallback:
+                alt = " or ".join(f"data.get({key!r})" for key in section.fallback)
+                body.append(f"    if not {name}:")
+                body.append(f"        alt = {alt} or []")
+                body.append("        if isinstance(alt, list):")
+                body.append(f"            {name} = [x for x in alt if {keep}]")
+    body.append("    return {")
+    body += [f"        {name!r}: {name}," for name in schema]
+    body.append("    }")
+    return "\n".join(body) + "\n"
+
+
+_SOURCE = _compile(SCHEMA)
+_namespace: dict[str, Any] = {"_sentence_bullets": _sentence_bullets, "_links": _links}
+exec(compile(_SOURCE, "<resume_ai.normalize>", "exec"), _namespace)
+
+normalize_resume = _namespace["normalize_resume"]
+normalize_resume.__doc__ = "Normalize one user resume dict to the internal schema, filling every default."
+
+
+def normalize_many(records: Iterable[Any]) -> Iterator[dict]:
+    """Lazily normalize a list or stream of resume dicts (e.g. rows of an ATS export)."""
+    return map(normalize_resume, records)
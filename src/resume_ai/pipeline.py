@@ -1,252 +1,590 @@
+import asyncio
+import contextvars
+import io
 import json
-import re
-from typing import Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Iterable, Optional, Union
 
+from resume_ai import instrumentation
+from resume_ai.chunking import merge_extractions, split_into_chunks
+from resume_ai.instrumentation import BuildRecorder, BuildReport, InstrumentedProvider
+from resume_ai.json_extract import JSONExtractionError, parse_json_object
+from resume_ai.local_parser import LocalExtraction, LocalExtractor
 from resume_ai.models import Resume
-from resume_ai.prompt_library import extraction_prompt, rewrite_prompt
+from resume_ai.normalize import normalize_resume
+from resume_ai.plugins import get_renderer
+from resume_ai.prompt_library import (
+    compact_json,
+    estimate_tokens,
+    extract_and_rewrite_prompt,
+    extraction_prompt,
+    restore_defaults,
+    rewrite_prompt,
+    section_repair_prompt,
+)
 from resume_ai.providers.base import LLMProvider
-from resume_ai.renderers.pdf_renderer import PDFRenderer
-from resume_ai.renderers.docx_renderer import DocxRenderer
-from resume_ai.templating.templates import get_template_env
+from resume_ai.rewrite import SectionRewriter
+from resume_ai.store import input_key
+from resume_ai.streaming import SectionEvent, SectionStreamParser
+from resume_ai.validation import validate_completion, validate_resume
 
+EXTRACTION_SYSTEM_PROMPT = "You extract resume data to JSON only. Return ONLY valid JSON, no markdown or extra text."
+REWRITE_SYSTEM_PROMPT = "You improve resume text without fabrication. Return ONLY valid JSON, no markdown or extra text."
+FUSED_SYSTEM_PROMPT = "You extract resume data to JSON and improve its wording without fabrication. Return ONLY valid JSON, no markdown or extra text."
+REPAIR_SYSTEM_PROMPT = "You fix malformed JSON without changing its content. Return ONLY valid JSON, no markdown or extra text."
+# Extracted or rewritten JSON runs longer than its input, so one input chunk
+# gets at most this share of the provider's completion cap
+CHUNK_SHARE_OF_MAX_TOKENS = 1 / 3
+MEDIA_TYPES = {
+    "pdf": "application/pdf",
+    "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+}
+
+_local_extractor = LocalExtractor()
 
 class ResumeProcessor:
-    def __init__(self, llm: LLMProvider, template_name: str = "minimal"):
-        self.llm = llm
+    def __init__(
+        self,
+        llm: LLMProvider,
+        template_name: str = "minimal",
+        *,
+        fused: bool = False,
+        section_rewrite: bool = False,
+        max_workers: int = 8,
+        local_parse: bool = True,
+        local_confidence_threshold: float = 0.8,
+        pdf_pool: Any = None,
+        compact_prompts: bool = True,
+        chunk_tokens: Optional[int] = 2000,
+        store: Any = None,
+    ):
+        # Every call is timed and reported when instrumentation sinks are active
+        self.llm = llm if isinstance(llm, InstrumentedProvider) else InstrumentedProvider(llm)
         self.template_name = template_name
-        self.env = get_template_env()
+        # Plain text: one combined extract+rewrite call instead of two serial calls
+        self.fused = fused
+        # Rewrite summary/jobs/projects as concurrent small calls instead of one large one
+        self.section_rewriter = (
+            SectionRewriter(self.llm, max_workers=max_workers, compact=compact_prompts) if section_rewrite else None
+        )
+        # Parse well-structured plain text locally; only weak sections go to the LLM
+        self.local_parse = local_parse
+        self.local_confidence_threshold = local_confidence_threshold
+        # Minified prompts without null/empty fields; dropped defaults are restored after parsing
+        self.compact_prompts = compact_prompts
+        # Plain text longer than this (estimated tokens) is extracted in concurrent chunks; None disables.
+        # Capped by the provider's max_tokens so no chunk's completion is cut off
+        limit = self.llm.max_tokens
+        if chunk_tokens and limit:
+            chunk_tokens = min(chunk_tokens, max(1, int(limit * CHUNK_SHARE_OF_MAX_TOKENS)))
+        self.chunk_tokens = chunk_tokens
+        self.max_workers = max_workers
+        self._long_rewriter: Optional[SectionRewriter] = None
+        self._env = None
+        # Optional PDFRenderPool; PDFs render in-thread when absent
+        self.pdf_pool = pdf_pool
+        # Optional ResumeStore; every built resume is saved under its input hash
+        self.store = store
+
+    @property
+    def env(self) -> Any:
+        # Jinja and the bundled templates load on the first render, not at construction
+        if self._env is None:
+            from resume_ai.templating.templates import get_template_env
+
+            self._env = get_template_env()
+        return self._env
 
     def parse_input(self, raw_input: str) -> str:
         return raw_input.strip()
 
+    @instrumentation.timed_stage("normalize")
     def _normalize_resume_input(self, data: dict) -> dict:
         """Normalize user JSON to internal schema and add sensible defaults."""
-        defaults = {
-            "contact": {"full_name": None, "email": None, "phone": None, "location": None, "links": []},
-            "summary": None,
-            "experience": [],
-            "projects": [],
-            "education": [],
-            "skills": [],
-            "certifications": [],
-            "achievements": [],
-            "extracurricular": [],
-            "languages": [],
-            "interests": [],
-        }
-
-        def sentence_bullets(text: str) -> list[str]:
-            # Split by sentence-ish boundaries and remove empties
-            parts = re.split(r"(?<=[.!?])\s+", text.strip())
-            return [p.strip() for p in parts if p.strip()]
-
-        normalized = defaults.copy()
-
-        # Contact
-        contact = data.get("contact", {}) if isinstance(data, dict) else {}
-        contact_links = contact.get("links", []) or []
-        
-        # Handle links as dict (convert to list of values) or list
-        if isinstance(contact_links, dict):
-            contact_links = list(contact_links.values())
-        elif not isinstance(contact_links, list):
-            contact_links = []
-
-        normalized_links = []
-        for link in contact_links:
-            if isinstance(link, dict):
-                val = link.get("value") or link.get("url") or link.get("link") or link.get("href")
-                if val:
-                    normalized_links.append(str(val))
-            elif isinstance(link, str):
-                if link.strip():
-                    normalized_links.append(link.strip())
-            else:
-                # fallback to string cast
-                normalized_links.append(str(link))
-        contact_links = normalized_links
-        
-        normalized["contact"] = {
-            "full_name": contact.get("full_name") or contact.get("name"),
-            "email": contact.get("email"),
-            "phone": contact.get("phone"),
-            "location": contact.get("location"),
-            "links": contact_links,
-        }
-
-        def as_str(val: Any) -> Optional[str]:
-            if val is None:
-                return None
-            return str(val)
-
-        # Experience
-        exp_list = []
-        experiences = data.get("experience", []) if isinstance(data, dict) else []
-        if not isinstance(experiences, list):
-            experiences = []
-        
-        for exp in experiences:
-            if not isinstance(exp, dict):
-                continue
-            description = exp.get("description") or ""
-            bullets = exp.get("bullets") or sentence_bullets(description) if description else []
-            bullets = [b for b in bullets if isinstance(b, str) and b.strip()]
-            
-            exp_list.append({
-                "title": exp.get("title") or exp.get("job_title"),
-                "company": exp.get("company"),
-                "location": exp.get("location"),
-                "start_date": as_str(exp.get("start_date")),
-                "end_date": as_str(exp.get("end_date")),
-                "current": exp.get("current", False) is True,
-                "bullets": bullets,
-                "technologies": [t for t in (exp.get("technologies", []) or []) if isinstance(t, str) and t.strip()],
-                "employment_type": exp.get("employment_type"),
-            })
-        normalized["experience"] = exp_list
-
-        # Education
-        edu_list = []
-        for edu in data.get("education", []) if isinstance(data, dict) else []:
-            end_date = edu.get("end_date") or edu.get("graduation_year")
-            end_date = as_str(end_date)
-            edu_list.append({
-                "institution": edu.get("institution"),
-                "degree": edu.get("degree"),
-                "field": edu.get("field"),
-                "start_date": as_str(edu.get("start_date")),
-                "end_date": end_date,
-                "gpa": edu.get("gpa"),
-            })
-        normalized["education"] = edu_list
-
-        # Projects
-        proj_list = []
-        projects = data.get("projects", []) if isinstance(data, dict) else []
-        if not isinstance(projects, list):
-            projects = []
-        
-        for proj in projects:
-            if not isinstance(proj, dict):
-                continue
-            description = proj.get("description") or ""
-            bullets = proj.get("bullets") or sentence_bullets(description) if description else []
-            bullets = [b for b in bullets if isinstance(b, str) and b.strip()]
-            
-            proj_list.append({
-                "name": proj.get("name"),
-                "role": proj.get("role"),
-                "bullets": bullets,
-                "stack": [s for s in (proj.get("stack", []) or []) if isinstance(s, str) and s.strip()],
-                "link": proj.get("link"),
-                "outcome": proj.get("outcome"),
-            })
-        normalized["projects"] = proj_list
-
-        normalized["skills"] = [s for s in (data.get("skills", []) if isinstance(data, dict) else []) if isinstance(s, str) and s.strip()]
-        normalized["certifications"] = [c for c in (data.get("certifications", []) if isinstance(data, dict) else []) if isinstance(c, dict)]
-        normalized["achievements"] = [a for a in (data.get("achievements", []) if isinstance(data, dict) else []) if isinstance(a, str) and a.strip()]
-        normalized["extracurricular"] = [e for e in (data.get("extracurricular", []) if isinstance(data, dict) else []) if isinstance(e, str) and e.strip()]
-        if not normalized["extracurricular"] and isinstance(data, dict):
-            alt_vol = data.get("volunteering") or data.get("volunteer") or []
-            if isinstance(alt_vol, list):
-                normalized["extracurricular"] = [v for v in alt_vol if isinstance(v, str) and v.strip()]
-        normalized["languages"] = [l for l in (data.get("languages", []) if isinstance(data, dict) else []) if isinstance(l, str) and l.strip()]
-        normalized["interests"] = [i for i in (data.get("interests", []) if isinstance(data, dict) else []) if isinstance(i, str) and i.strip()]
-
-        return normalized
+        return normalize_resume(data)
 
     def _extract_json(self, text: str) -> dict:
-        """Extract JSON from LLM response, handling markdown code blocks and extra text."""
-        text = text.strip()
-        
-        # Remove markdown code blocks
-        match = re.search(r'```(?:json)?\s*({.*?})\s*```', text, re.DOTALL)
-        if match:
-            text = match.group(1)
-        
-        # Find JSON object if wrapped in text
-        match = re.search(r'\{.*\}', text, re.DOTALL)
-        if match:
-            text = match.group(0)
-        
-        # Clean up common issues
-        text = text.strip()
-        
-        # Parse JSON
-        data = json.loads(text)
-        
-        # Ensure all required keys exist with defaults
-        defaults = {
-            "contact": {"full_name": None, "email": None, "phone": None, "location": None, "links": []},
-            "summary": None,
-            "experience": [],
-            "projects": [],
-            "education": [],
-            "skills": [],
-            "certifications": [],
-            "achievements": [],
-            "extracurricular": [],
-            "languages": [],
-            "interests": [],
-        }
-        
-        # Merge with defaults
-        for key, default_value in defaults.items():
-            if key not in data:
-                data[key] = default_value
-        
-        return data
+        """Extract JSON from LLM response, re-asking only for sections that cannot be repaired."""
+        try:
+            data = parse_json_object(text)
+        except JSONExtractionError as e:
+            if not e.partial and not e.broken:
+                raise
+            data = e.partial
+            with instrumentation.stage("repair"):
+                for section, fragment in e.broken.items():
+                    data[section] = self._reparse_section(section, self.llm.complete(**self._repair_request(section, fragment)), e)
+        return self._with_defaults(data)
 
-    def build(self, raw_input: str, *, output_pdf: Optional[str] = None, output_docx: Optional[str] = None) -> Resume:
-        parsed = self.parse_input(raw_input)
+    async def _aextract_json(self, text: str) -> dict:
+        try:
+            data = parse_json_object(text)
+        except JSONExtractionError as e:
+            if not e.partial and not e.broken:
+                raise
+            data = e.partial
+            sections = list(e.broken)
+            with instrumentation.stage("repair"):
+                completions = await asyncio.gather(
+                    *(self.llm.acomplete(**self._repair_request(section, e.broken[section])) for section in sections)
+                )
+            for section, completion in zip(sections, completions):
+                data[section] = self._reparse_section(section, completion, e)
+        return self._with_defaults(data)
 
-        # If user provided JSON, normalize and only run rewrite
-        resume_data: dict[str, Any]
+    @staticmethod
+    def _repair_request(section: str, fragment: str) -> dict:
+        return dict(system_prompt=REPAIR_SYSTEM_PROMPT, user_prompt=section_repair_prompt(section, fragment), temperature=0.0)
+
+    @staticmethod
+    def _reparse_section(section: str, completion: str, original: JSONExtractionError) -> Any:
+        try:
+            repaired = parse_json_object(completion)
+        except ValueError:
+            raise original
+        if not isinstance(repaired, dict) or section not in repaired:
+            raise original
+        return repaired[section]
+
+    @staticmethod
+    def _with_defaults(data: Any) -> dict:
+        # Ensure all keys exist with defaults, including ones a compact prompt left out
+        return restore_defaults(data)
+
+    def _serialize(self, resume_data: dict) -> str:
+        return compact_json(resume_data) if self.compact_prompts else json.dumps(resume_data)
+
+    def _parse_user_json(self, parsed: str) -> Optional[dict]:
+        """Return the user's JSON object, or ``None`` when the input is plain text."""
         try:
             user_json = json.loads(parsed)
-            if isinstance(user_json, dict):
-                resume_data = self._normalize_resume_input(user_json)
-                rewritten = self.llm.complete(
-                    system_prompt="You improve resume text without fabrication. Return ONLY valid JSON, no markdown or extra text.",
-                    user_prompt=rewrite_prompt(json.dumps(resume_data)),
+        except ValueError:
+            return None
+        return user_json if isinstance(user_json, dict) else None
+
+    def extract(self, raw_input: str) -> dict:
+        """Stage 1: turn raw input into schema-shaped resume data.
+
+        JSON input is normalized locally; plain text goes through the LLM.
+        """
+        parsed = self.parse_input(raw_input)
+        user_json = self._parse_user_json(parsed)
+        if user_json is not None:
+            return self._normalize_resume_input(user_json)
+        return self._extract_plain_text(parsed, self._local_extraction(parsed))
+
+    @instrumentation.timed_stage("local_parse")
+    def _local_extraction(self, parsed: str) -> Optional[LocalExtraction]:
+        """Rule-based extraction, or ``None`` when disabled or the text has no recognizable sections."""
+        if not self.local_parse:
+            return None
+        local = _local_extractor.extract(parsed)
+        return local if local.structured else None
+
+    def _weak_sections(self, local: Optional[LocalExtraction]) -> Optional[list[str]]:
+        return None if local is None else local.low_confidence(self.local_confidence_threshold)
+
+    def _extract_plain_text(self, parsed: str, local: Optional[LocalExtraction]) -> dict:
+        weak = self._weak_sections(local)
+        if weak is None:
+            return self._extract_with_llm(parsed)
+        if not weak:
+            return local.data
+        # Only re-extract the sections the rules were unsure about
+        return local.merge(self._extract_with_llm(local.text_for(weak)), weak)
+
+    async def _aextract_plain_text(self, parsed: str, local: Optional[LocalExtraction]) -> dict:
+        weak = self._weak_sections(local)
+        if weak is None:
+            return await self._aextract_with_llm(parsed)
+        if not weak:
+            return local.data
+        return local.merge(await self._aextract_with_llm(local.text_for(weak)), weak)
+
+    def _is_long(self, text: str) -> bool:
+        return bool(self.chunk_tokens) and estimate_tokens(text) > self.chunk_tokens
+
+    def _extraction_request(self, text: str) -> dict:
+        return dict(
+            system_prompt=EXTRACTION_SYSTEM_PROMPT,
+            user_prompt=extraction_prompt(text, compact=self.compact_prompts),
+            temperature=0.1,
+        )
+
+    def _extract_chunk(self, chunk: str) -> dict:
+        return self._extract_json(self.llm.complete(**self._extraction_request(chunk)))
+
+    @instrumentation.timed_stage("extract")
+    def _extract_with_llm(self, parsed: str) -> dict:
+        chunks = split_into_chunks(parsed, self.chunk_tokens) if self._is_long(parsed) else [parsed]
+        if len(chunks) == 1:
+            return self._extract_chunk(parsed)
+        # Map: extract chunks concurrently; reduce: merge duplicate entries into one resume
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(chunks))) as pool:
+            parts = list(pool.map(lambda chunk: contextvars.copy_context().run(self._extract_chunk, chunk), chunks))
+        return self._with_defaults(merge_extractions(parts))
+
+    def _process_plain_text(self, parsed: str) -> Resume:
+        local = self._local_extraction(parsed)
+        # A confident local parse leaves only the rewrite call, which beats fusing;
+        # long inputs would overflow a single fused completion
+        if self.fused and self._weak_sections(local) != [] and not self._is_long(parsed):
+            with instrumentation.stage("fused"):
+                completion = self.llm.complete(
+                    system_prompt=FUSED_SYSTEM_PROMPT,
+                    user_prompt=extract_and_rewrite_prompt(parsed, compact=self.compact_prompts),
                     temperature=0.1,
                 )
-                resume_data = self._extract_json(rewritten)
-            else:
-                raise ValueError
-        except Exception:
-            # Fall back to extraction flow for plain text
-            extraction = self.llm.complete(
-                system_prompt="You extract resume data to JSON only. Return ONLY valid JSON, no markdown or extra text.",
-                user_prompt=extraction_prompt(parsed),
-                temperature=0.1,
-            )
-            resume_data = self._extract_json(extraction)
-            rewritten = self.llm.complete(
-                system_prompt="You improve resume text without fabrication. Return ONLY valid JSON, no markdown or extra text.",
-                user_prompt=rewrite_prompt(json.dumps(resume_data)),
-                temperature=0.1,
-            )
-            resume_data = self._extract_json(rewritten)
+            return self._validate_completion(completion)
+        return self.rewrite_resume(self._extract_plain_text(parsed, local))
+
+    async def _aprocess_plain_text(self, parsed: str) -> Resume:
+        local = self._local_extraction(parsed)
+        if self.fused and self._weak_sections(local) != [] and not self._is_long(parsed):
+            with instrumentation.stage("fused"):
+                completion = await self.llm.acomplete(
+                    system_prompt=FUSED_SYSTEM_PROMPT,
+                    user_prompt=extract_and_rewrite_prompt(parsed, compact=self.compact_prompts),
+                    temperature=0.1,
+                )
+            return await self._avalidate_completion(completion)
+        return await self.arewrite_resume(await self._aextract_plain_text(parsed, local))
+
+    async def _aextract_chunk(self, chunk: str) -> dict:
+        return await self._aextract_json(await self.llm.acomplete(**self._extraction_request(chunk)))
+
+    @instrumentation.timed_stage("extract")
+    async def _aextract_with_llm(self, parsed: str) -> dict:
+        chunks = split_into_chunks(parsed, self.chunk_tokens) if self._is_long(parsed) else [parsed]
+        if len(chunks) == 1:
+            return await self._aextract_chunk(parsed)
+        parts = await asyncio.gather(*(self._aextract_chunk(chunk) for chunk in chunks))
+        return self._with_defaults(merge_extractions(list(parts)))
+
+    async def aextract(self, raw_input: str) -> dict:
+        parsed = self.parse_input(raw_input)
+        user_json = self._parse_user_json(parsed)
+        if user_json is not None:
+            return self._normalize_resume_input(user_json)
+        return await self._aextract_plain_text(parsed, self._local_extraction(parsed))
+
+    def _rewriter_for(self, resume_data: dict) -> Optional[SectionRewriter]:
+        """Per-section rewriting when enabled, or when one rewrite completion would be too long."""
+        if self.section_rewriter is not None:
+            return self.section_rewriter
+        if not self._is_long(self._serialize(resume_data)):
+            return None
+        if self._long_rewriter is None:
+            self._long_rewriter = SectionRewriter(self.llm, max_workers=self.max_workers, compact=self.compact_prompts)
+        return self._long_rewriter
+
+    def _rewrite_request(self, resume_data: dict) -> dict:
+        return dict(system_prompt=REWRITE_SYSTEM_PROMPT, user_prompt=rewrite_prompt(self._serialize(resume_data)), temperature=0.1)
+
+    @instrumentation.timed_stage("rewrite")
+    def rewrite(self, resume_data: dict) -> dict:
+        """Stage 2: polish the wording of already structured resume data."""
+        rewriter = self._rewriter_for(resume_data)
+        if rewriter is not None:
+            return rewriter.rewrite(resume_data)
+        return self._extract_json(self.llm.complete(**self._rewrite_request(resume_data)))
+
+    @instrumentation.timed_stage("rewrite")
+    async def arewrite(self, resume_data: dict) -> dict:
+        rewriter = self._rewriter_for(resume_data)
+        if rewriter is not None:
+            return await rewriter.arewrite(resume_data)
+        return await self._aextract_json(await self.llm.acomplete(**self._rewrite_request(resume_data)))
+
+    def rewrite_resume(self, resume_data: dict) -> Resume:
+        """Stage 2 through to a ``Resume``: rewrite ``resume_data`` and validate the result.
+
+        A single rewrite completion is validated straight from its text.
+        """
+        if self._rewriter_for(resume_data) is not None:
+            return self.validate(self.rewrite(resume_data))
+        with instrumentation.stage("rewrite"):
+            completion = self.llm.complete(**self._rewrite_request(resume_data))
+        return self._validate_completion(completion)
+
+    async def arewrite_resume(self, resume_data: dict) -> Resume:
+        if self._rewriter_for(resume_data) is not None:
+            return self.validate(await self.arewrite(resume_data))
+        with instrumentation.stage("rewrite"):
+            completion = await self.llm.acomplete(**self._rewrite_request(resume_data))
+        return await self._avalidate_completion(completion)
+
+    @instrumentation.timed_stage("validate")
+    def validate(self, resume_data: dict) -> Resume:
+        """Validate in one pass; fields that do not fit fall back to their defaults (and are logged)."""
+        return validate_resume(resume_data)[0]
+
+    @instrumentation.timed_stage("validate")
+    def _validate_completion(self, completion: str) -> Resume:
+        try:
+            return validate_completion(completion)[0]
+        except JSONExtractionError:
+            # Beyond local repair: re-ask for the broken sections
+            return validate_resume(self._extract_json(completion))[0]
 
-        # Validate and create Resume object
+    @instrumentation.timed_stage("validate")
+    async def _avalidate_completion(self, completion: str) -> Resume:
         try:
-            resume = Resume.model_validate(resume_data)
-        except Exception as e:
-            # Try to clean up and retry
-            if resume_data.get("certifications"):
-                resume_data["certifications"] = [c for c in resume_data["certifications"] if isinstance(c, dict) and c.get("name")]
-            if resume_data.get("skills"):
-                resume_data["skills"] = [s for s in resume_data["skills"] if isinstance(s, str) and s.strip()]
-            resume = Resume.model_validate(resume_data)
+            return validate_completion(completion)[0]
+        except JSONExtractionError:
+            return validate_resume(await self._aextract_json(completion))[0]
+
+    def process(self, raw_input: str) -> Resume:
+        """Run extraction and rewrite and return a validated ``Resume``."""
+        parsed = self.parse_input(raw_input)
+
+        # If user provided JSON, normalize and only run rewrite
+        user_json = self._parse_user_json(parsed)
+        if user_json is not None:
+            try:
+                return self.rewrite_resume(self._normalize_resume_input(user_json))
+            except Exception:
+                pass
+
+        # Fall back to extraction flow for plain text
+        return self._process_plain_text(parsed)
+
+    async def aprocess(self, raw_input: str) -> Resume:
+        """Async ``process``; many resumes can be in flight on one event loop."""
+        parsed = self.parse_input(raw_input)
+
+        user_json = self._parse_user_json(parsed)
+        if user_json is not None:
+            try:
+                return await self.arewrite_resume(self._normalize_resume_input(user_json))
+            except Exception:
+                pass
+
+        return await self._aprocess_plain_text(parsed)
+
+    def _stream_json(
+        self,
+        *,
+        system_prompt: str,
+        user_prompt: str,
+        stage: str,
+        on_section: Optional[Callable[[SectionEvent], None]],
+    ) -> dict:
+        parser = SectionStreamParser(stage)
+        chunks = []
+        with instrumentation.stage(stage):
+            for chunk in self.llm.stream(system_prompt=system_prompt, user_prompt=user_prompt, temperature=0.1):
+                chunks.append(chunk)
+                if on_section is not None:
+                    for event in parser.feed(chunk):
+                        on_section(event)
+            return self._extract_json("".join(chunks))
+
+    def _stream_rewrite(self, resume_data: dict, on_section: Optional[Callable[[SectionEvent], None]]) -> dict:
+        rewriter = self._rewriter_for(resume_data)
+        if rewriter is not None:
+            return rewriter.rewrite(resume_data, on_section)
+        return self._stream_json(
+            system_prompt=REWRITE_SYSTEM_PROMPT,
+            user_prompt=rewrite_prompt(self._serialize(resume_data)),
+            stage="rewrite",
+            on_section=on_section,
+        )
+
+    def process_streaming(self, raw_input: str, on_section: Optional[Callable[[SectionEvent], None]] = None) -> Resume:
+        """Like ``process`` but streams completions, calling ``on_section`` as each section closes.
+
+        Plain-text input first emits draft sections from the extraction
+        stream (``stage="extract"``), then polished ones from the rewrite
+        stream (``stage="rewrite"``).
+        """
+        parsed = self.parse_input(raw_input)
+
+        resume_data: Optional[dict[str, Any]] = None
+        user_json = self._parse_user_json(parsed)
+        if user_json is not None:
+            try:
+                resume_data = self._stream_rewrite(self._normalize_resume_input(user_json), on_section)
+            except Exception:
+                resume_data = None
+
+        local = self._local_extraction(parsed) if resume_data is None else None
+        weak = self._weak_sections(local)
+        long_input = self._is_long(parsed)
+        if resume_data is None and self.fused and weak != [] and not long_input:
+            resume_data = self._stream_json(
+                system_prompt=FUSED_SYSTEM_PROMPT,
+                user_prompt=extract_and_rewrite_prompt(parsed, compact=self.compact_prompts),
+                stage="rewrite",
+                on_section=on_section,
+            )
+        elif resume_data is None:
+            if long_input and weak != []:
+                # Chunked extraction has no single stream to follow; emit the merged draft
+                extracted = self._extract_plain_text(parsed, local)
+                if on_section is not None:
+                    for section, value in extracted.items():
+                        on_section(SectionEvent(section, value, stage="extract"))
+            elif weak is None:
+                extracted = self._stream_json(
+                    system_prompt=EXTRACTION_SYSTEM_PROMPT,
+                    user_prompt=extraction_prompt(parsed, compact=self.compact_prompts),
+                    stage="extract",
+                    on_section=on_section,
+                )
+            else:
+                if on_section is not None:
+                    for section, value in local.data.items():
+                        if section not in weak:
+                            on_section(SectionEvent(section, value, stage="extract"))
+                extracted = local.data
+                if weak:
+                    partial = self._stream_json(
+                        system_prompt=EXTRACTION_SYSTEM_PROMPT,
+                        user_prompt=extraction_prompt(local.text_for(weak), compact=self.compact_prompts),
+                        stage="extract",
+                        on_section=on_section,
+                    )
+                    extracted = local.merge(partial, weak)
+            resume_data = self._stream_rewrite(extracted, on_section)
+
+        return self.validate(resume_data)
+
+    def render(
+        self,
+        resume: Union[Resume, dict, str],
+        formats: Iterable[str] = ("pdf",),
+        *,
+        output_dir: Union[str, Path] = ".",
+        stem: str = "resume",
+        template_name: Optional[str] = None,
+    ) -> dict[str, Path]:
+        """Stage 3: write ``resume`` in each of ``formats`` without calling the LLM.
+
+        ``resume`` may be a ``Resume``, a dict or a JSON string. Returns the
+        written path for each format.
+        """
+        resume = coerce_resume(resume)
+        written: dict[str, Path] = {}
+        for fmt in formats:
+            output_path = Path(output_dir) / f"{stem}.{fmt}"
+            written[fmt] = self.render_file(resume, fmt, output_path, template_name=template_name)
+        return written
 
+    def render_file(
+        self,
+        resume: Union[Resume, dict, str],
+        fmt: str,
+        output_path: Union[str, Path],
+        *,
+        template_name: Optional[str] = None,
+    ) -> Path:
+        return render_resume(
+            resume, fmt, output_path, template_name=template_name or self.template_name, env=self.env, pdf_pool=self.pdf_pool
+        )
+
+    def render_bytes(self, resume: Union[Resume, dict, str], fmt: str, *, template_name: Optional[str] = None) -> bytes:
+        """Render one format in memory, e.g. for a download button or an HTTP response."""
+        return render_resume_bytes(
+            resume, fmt, template_name=template_name or self.template_name, env=self.env, pdf_pool=self.pdf_pool
+        )
+
+    @instrumentation.timed_stage("store")
+    def persist(self, raw_input: str, resume: Resume) -> None:
+        """Save ``resume`` to the store, if any, keyed by the hash of ``raw_input``."""
+        if self.store is not None:
+            self.store.put(input_key(raw_input), resume)
+
+    @instrumentation.timed_stage("build")
+    def build(self, raw_input: str, *, output_pdf: Optional[str] = None, output_docx: Optional[str] = None) -> Resume:
+        resume = self.process(raw_input)
+        self.persist(raw_input, resume)
+
+        if output_pdf:
+            self.render_file(resume, "pdf", output_pdf)
+
+        if output_docx:
+            self.render_file(resume, "docx", output_docx)
+
+        return resume
+
+    @instrumentation.timed_stage("build")
+    async def abuild(self, raw_input: str, *, output_pdf: Optional[str] = None, output_docx: Optional[str] = None) -> Resume:
+        resume = await self.aprocess(raw_input)
+        if self.store is not None:
+            await asyncio.to_thread(self.persist, raw_input, resume)
+
+        # Rendering is CPU-bound; keep it off the event loop
         if output_pdf:
-            pdf_renderer = PDFRenderer(self.env)
-            pdf_renderer.render(resume, template_name=self.template_name, output_path=output_pdf)
+            await asyncio.to_thread(self.render_file, resume, "pdf", output_pdf)
 
         if output_docx:
-            docx_renderer = DocxRenderer()
-            docx_renderer.render(resume, output_path=output_docx)
+            await asyncio.to_thread(self.render_file, resume, "docx", output_docx)
 
         return resume
+
+
+    def build_with_report(
+        self, raw_input: str, *, output_pdf: Optional[str] = None, output_docx: Optional[str] = None
+    ) -> tuple[Resume, BuildReport]:
+        """``build`` plus a report of stage timings, LLM calls, tokens and retries."""
+        recorder = BuildRecorder()
+        with instrumentation.instrument(recorder):
+            resume = self.build(raw_input, output_pdf=output_pdf, output_docx=output_docx)
+        return resume, recorder.report
+
+    async def abuild_with_report(
+        self, raw_input: str, *, output_pdf: Optional[str] = None, output_docx: Optional[str] = None
+    ) -> tuple[Resume, BuildReport]:
+        recorder = BuildRecorder()
+        with instrumentation.instrument(recorder):
+            resume = await self.abuild(raw_input, output_pdf=output_pdf, output_docx=output_docx)
+        return resume, recorder.report
+
+    async def aclose(self) -> None:
+        """Close the provider clients opened on the running loop; await it before the loop shuts down."""
+        await self.llm.aclose()
+
+def coerce_resume(resume: Union[Resume, dict, str]) -> Resume:
+    """Accept a validated ``Resume``, its dict form, or its JSON."""
+    if isinstance(resume, Resume):
+        return resume
+    if isinstance(resume, str):
+        return Resume.model_validate_json(resume)
+    return Resume.model_validate(resume)
+
+
+def render_resume(
+    resume: Union[Resume, dict, str],
+    fmt: str,
+    output_path: Union[str, Path, BinaryIO],
+    *,
+    template_name: str = "minimal",
+    env: Any = None,
+    pdf_pool: Any = None,
+) -> Union[Path, BinaryIO]:
+    """Render one output format; never touches an LLM provider.
+
+    ``output_path`` may be a filesystem path or a binary file-like object.
+    """
+    resume = coerce_resume(resume)
+    with instrumentation.stage(f"render.{fmt}"):
+        if fmt == "pdf" and pdf_pool is not None:
+            pdf_pool.render(resume, template_name=template_name, output_path=output_path)
+        else:
+            get_renderer(fmt, jinja_env=env).render(resume, template_name=template_name, output_path=output_path)
+    return Path(output_path) if isinstance(output_path, str) else output_path
+
+
+def render_resume_bytes(
+    resume: Union[Resume, dict, str],
+    fmt: str,
+    *,
+    template_name: str = "minimal",
+    env: Any = None,
+    pdf_pool: Any = None,
+) -> bytes:
+    buffer = io.BytesIO()
+    render_resume(resume, fmt, buffer, template_name=template_name, env=env, pdf_pool=pdf_pool)
+    return buffer.getvalue()
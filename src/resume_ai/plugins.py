@@ -0,0 +1,91 @@
+"""Name-keyed registries for LLM providers and output renderers.
+
+Entries are ``"module:attribute"`` strings that are imported on first
+use, so naming a provider or format never pulls in openai, WeasyPrint or
+python-docx until something actually needs them. Third-party packages
+can add entries through the ``resume_ai.providers`` and
+``resume_ai.renderers`` entry-point groups.
+"""
+import threading
+from importlib import import_module
+from importlib.metadata import entry_points
+from typing import Any, Optional, Union
+
+PROVIDER_GROUP = "resume_ai.providers"
+RENDERER_GROUP = "resume_ai.renderers"
+
+BUILTIN_PROVIDERS = {
+    "openai": "resume_ai.providers.openai_provider:OpenAIProvider",
+    "groq": "resume_ai.providers.groq_provider:GroqProvider",
+}
+BUILTIN_RENDERERS = {
+    "pdf": "resume_ai.renderers.pdf_renderer:PDFRenderer",
+    "docx": "resume_ai.renderers.docx_renderer:DocxRenderer",
+}
+
+
+def _import_target(target: str) -> Any:
+    module_name, _, attr = target.partition(":")
+    obj = import_module(module_name)
+    for part in attr.split(".") if attr else ():
+        obj = getattr(obj, part)
+    return obj
+
+
+class PluginRegistry:
+    def __init__(self, group: str, builtins: Optional[dict[str, str]] = None):
+        self.group = group
+        self._targets: dict[str, Union[str, Any]] = dict(builtins or {})
+        self._loaded: dict[str, Any] = {}
+        self._discovered = False
+        self._lock = threading.Lock()
+
+    def register(self, name: str, target: Union[str, Any]) -> None:
+        """Register a ``"module:attribute"`` string or an already imported object."""
+        with self._lock:
+            self._targets[name] = target
+            self._loaded.pop(name, None)
+
+    def _discover(self) -> None:
+        # Scanning installed distributions is not free; only do it when asked for something unknown
+        if self._discovered:
+            return
+        self._discovered = True
+        for ep in entry_points(group=self.group):
+            self._targets.setdefault(ep.name, ep.value)
+
+    def names(self) -> list[str]:
+        with self._lock:
+            self._discover()
+            return sorted(self._targets)
+
+    def load(self, name: str) -> Any:
+        with self._lock:
+            if name in self._loaded:
+                return self._loaded[name]
+            if name not in self._targets:
+                self._discover()
+            if name not in self._targets:
+                raise KeyError(f"No {self.group} plugin named {name!r}")
+            target = self._targets[name]
+            obj = _import_target(target) if isinstance(target, str) else target
+            self._loaded[name] = obj
+            return obj
+
+
+providers = PluginRegistry(PROVIDER_GROUP, BUILTIN_PROVIDERS)
+renderers = PluginRegistry(RENDERER_GROUP, BUILTIN_RENDERERS)
+
+
+def get_provider(name: str, **kwargs: Any):
+    """Instantiate the provider registered as ``name``."""
+    return providers.load(name)(**kwargs)
+
+
+def get_renderer(fmt: str, **kwargs: Any):
+    """Instantiate the renderer registered for output format ``fmt``."""
+    try:
+        renderer_cls = renderers.load(fmt)
+    except KeyError:
+        raise ValueError(f"Unsupported output format: {fmt}") from None
+    return renderer_cls(**kwargs)
@@ -1,38 +1,196 @@
+import json
+import re
 from textwrap import dedent
+from typing import Any
 
+from resume_ai.models import Certification, Contact, Education, Experience, Project, Resume
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (~4 characters per token) for budgeting."""
+    return max(1, len(text) // 4)
+
+
+RESUME_SCHEMA = dedent(
+    """
+    {
+        "contact": {"full_name": "string or null", "email": "string or null", "phone": "string or null", "location": "string or null", "links": []},
+        "summary": "string or null",
+        "experience": [{"title": "string or null", "company": "string or null", "location": "string or null", "start_date": "YYYY-MM-DD or null", "end_date": "YYYY-MM-DD or null", "current": false, "bullets": [], "technologies": [], "employment_type": "string or null"}],
+        "projects": [{"name": "string or null", "role": "string or null", "bullets": [], "stack": [], "link": "string or null", "outcome": "string or null"}],
+        "education": [{"institution": "string or null", "degree": "string or null", "field": "string or null", "start_date": "YYYY-MM-DD or null", "end_date": "YYYY-MM-DD or null", "gpa": "string or null"}],
+        "skills": ["string"],
+        "certifications": [{"name": "string or null", "issuer": "string or null", "date_obtained": "YYYY-MM-DD or null", "credential_id": "string or null"}],
+        "achievements": ["string"],
+        "extracurricular": ["string"],
+        "languages": ["string"],
+        "interests": ["string"]
+    }
+    """
+).strip()
+
+EXTRACTION_RULES = dedent(
+    """
+    - Extract only what exists in the input. Use null or empty arrays for missing data.
+    - NEVER invent employers, dates, certifications, or experience.
+    - Return ONLY valid JSON. No markdown, code blocks, or explanations.
+    - Dates must be YYYY-MM-DD format or null.
+    - Arrays like "bullets", "skills", "languages" must always be arrays (can be empty).
+    - Keep all field names exactly as shown above.
+    """
+).strip()
+
+
+# Same structure on one line; missing values are omitted rather than null
+COMPACT_RESUME_SCHEMA = json.dumps(json.loads(RESUME_SCHEMA), separators=(",", ":")).replace(" or null", "")
+
+COMPACT_EXTRACTION_RULES = dedent(
+    """
+    - Extract only what exists in the input. Omit keys whose value would be null, empty or false.
+    - NEVER invent employers, dates, certifications, or experience.
+    - Return ONLY minified valid JSON. No markdown, code blocks, or explanations.
+    - Dates must be YYYY-MM-DD format.
+    - Arrays like "bullets", "skills", "languages" must be arrays when present.
+    - Keep all field names exactly as shown above.
+    """
+).strip()
+
+# String lists where repeats carry no information
+DEDUPLICATED_LISTS = {"skills", "technologies", "stack", "languages", "interests", "links"}
+SECTION_MODELS = {"experience": Experience, "projects": Project, "education": Education, "certifications": Certification}
+_BLANK_RUN_RE = re.compile(r"[ \t]+")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+
+def _schema_and_rules(compact: bool) -> tuple[str, str]:
+    return (COMPACT_RESUME_SCHEMA, COMPACT_EXTRACTION_RULES) if compact else (RESUME_SCHEMA, EXTRACTION_RULES)
+
+
+def compact_text(raw_text: str) -> str:
+    """Collapse runs of spaces and blank lines; line structure is kept for the model."""
+    lines = (_BLANK_RUN_RE.sub(" ", line).strip() for line in raw_text.strip().splitlines())
+    return _BLANK_LINES_RE.sub("\n\n", "\n".join(lines))
+
+
+def _dedupe(items: list) -> list:
+    seen = set()
+    out = []
+    for item in items:
+        key = item.strip().lower() if isinstance(item, str) else json.dumps(item, sort_keys=True)
+        if key not in seen:
+            seen.add(key)
+            out.append(item)
+    return out
+
+
+def compact_value(value: Any, key: str = "") -> Any:
+    """Drop nulls, empty strings/lists/objects and ``False`` recursively; dedupe string lists.
+
+    Everything dropped is a ``Resume`` default, so ``restore_defaults`` (or
+    model validation) brings it back.
+    """
+    if isinstance(value, dict):
+        out = {}
+        for k, v in value.items():
+            v = compact_value(v, k)
+            if v is None or v is False or v == "" or v == [] or v == {}:
+                continue
+            out[k] = v
+        return out
+    if isinstance(value, list):
+        items = [compact_value(v) for v in value]
+        items = [v for v in items if not (v is None or v == "" or v == {})]
+        return _dedupe(items) if key in DEDUPLICATED_LISTS else items
+    if isinstance(value, str):
+        return value.strip()
+    return value
+
+
+def compact_json(data: Any) -> str:
+    return json.dumps(compact_value(data), separators=(",", ":"), ensure_ascii=False)
+
+
+def _default(field: Any) -> Any:
+    # Not field.get_default(call_default_factory=True): it inspects the factory's signature on every call
+    return field.default_factory() if field.default_factory is not None else field.default
+
+
+def _fill(item: dict, model: Any) -> dict:
+    for name, field in model.model_fields.items():
+        if name not in item:
+            item[name] = _default(field)
+    return item
+
+
+def restore_defaults(data: dict) -> dict:
+    """Put back every key ``compact_value`` (or a terse model) left out, using the ``Resume`` defaults."""
+    for name, field in Resume.model_fields.items():
+        if name not in data:
+            data[name] = Contact().model_dump() if name == "contact" else _default(field)
+    if isinstance(data.get("contact"), dict):
+        _fill(data["contact"], Contact)
+    for section, model in SECTION_MODELS.items():
+        if isinstance(data.get(section), list):
+            for item in data[section]:
+                if isinstance(item, dict):
+                    _fill(item, model)
+    return data
 
-def extraction_prompt(raw_text: str) -> str:
-        return dedent(
-            """
-                You are a resume JSON extractor. Convert the user's input to this exact JSON structure:
-                {{
-                    "contact": {{"full_name": "string or null", "email": "string or null", "phone": "string or null", "location": "string or null", "links": []}},
-                    "summary": "string or null",
-                    "experience": [{{"title": "string or null", "company": "string or null", "location": "string or null", "start_date": "YYYY-MM-DD or null", "end_date": "YYYY-MM-DD or null", "current": false, "bullets": [], "technologies": [], "employment_type": "string or null"}}],
-                    "projects": [{{"name": "string or null", "role": "string or null", "bullets": [], "stack": [], "link": "string or null", "outcome": "string or null"}}],
-                    "education": [{{"institution": "string or null", "degree": "string or null", "field": "string or null", "start_date": "YYYY-MM-DD or null", "end_date": "YYYY-MM-DD or null", "gpa": "string or null"}}],
-                    "skills": ["string"],
-                    "certifications": [{{"name": "string or null", "issuer": "string or null", "date_obtained": "YYYY-MM-DD or null", "credential_id": "string or null"}}],
-                    "achievements": ["string"],
-                    "extracurricular": ["string"],
-                    "languages": ["string"],
-                    "interests": ["string"]
-                }}
-
-                RULES (CRITICAL):
-                - Extract only what exists in the input. Use null or empty arrays for missing data.
-                - NEVER invent employers, dates, certifications, or experience.
-                - Return ONLY valid JSON. No markdown, code blocks, or explanations.
-                - Dates must be YYYY-MM-DD format or null.
-                - Arrays like "bullets", "skills", "languages" must always be arrays (can be empty).
-                - Keep all field names exactly as shown above.
-
-                USER INPUT:
-                {raw_text}
-        
-                Return ONLY the JSON object, nothing else:
-                """
-            ).format(raw_text=raw_text).strip()
+
+def prompt_token_report(resume_data: dict, raw_text: str = "") -> dict:
+    """Estimated prompt tokens with and without compaction."""
+    report = {
+        "rewrite_verbose": estimate_tokens(rewrite_prompt(json.dumps(resume_data))),
+        "rewrite_compact": estimate_tokens(rewrite_prompt(compact_json(resume_data))),
+    }
+    if raw_text:
+        report["extraction_verbose"] = estimate_tokens(extraction_prompt(raw_text, compact=False))
+        report["extraction_compact"] = estimate_tokens(extraction_prompt(raw_text))
+    return report
+
+
+def extraction_prompt(raw_text: str, *, compact: bool = True) -> str:
+    schema, rules = _schema_and_rules(compact)
+    return "\n".join(
+        [
+            "You are a resume JSON extractor. Convert the user's input to this exact JSON structure:",
+            schema,
+            "",
+            "RULES (CRITICAL):",
+            rules,
+            "",
+            "USER INPUT:",
+            compact_text(raw_text) if compact else raw_text,
+            "",
+            "Return ONLY the JSON object, nothing else:",
+        ]
+    )
+
+
+def extract_and_rewrite_prompt(raw_text: str, *, compact: bool = True) -> str:
+    """Single-call prompt that extracts and polishes in one completion."""
+    schema, rules = _schema_and_rules(compact)
+    return "\n".join(
+        [
+            "You are a resume JSON extractor and editor. Convert the user's input to this exact JSON structure,",
+            "improving the wording of summaries and bullets as you go:",
+            schema,
+            "",
+            "EXTRACTION RULES (CRITICAL):",
+            rules,
+            "",
+            "REWRITE RULES (CRITICAL):",
+            "- Do NOT add new employers, dates, certifications, or skills.",
+            "- Only improve wording of existing summary and bullets; keep every fact accurate.",
+            "- Use action verbs.",
+            "- Tense: current roles (present), past roles (past).",
+            "",
+            "USER INPUT:",
+            compact_text(raw_text) if compact else raw_text,
+            "",
+            "Return ONLY the improved JSON object, nothing else:",
+        ]
+    )
 
 
 def rewrite_prompt(structured_json: str) -> str:
@@ -54,3 +212,46 @@ def rewrite_prompt(structured_json: str) -> str:
         Return ONLY the improved JSON object, nothing else:
         """
     ).strip()
+
+
+SECTION_REWRITE_FOCUS = {
+    "summary": "Rewrite the professional summary to be concise and specific.",
+    "experience": "Rewrite the bullets of this single job entry.",
+    "project": "Rewrite the bullets and outcome of this single project entry.",
+}
+
+
+def section_rewrite_prompt(kind: str, section_json: str) -> str:
+    """Small prompt for rewriting one resume unit (the summary, one job, one project)."""
+    return dedent(
+        f"""
+        You improve one section of a resume for clarity and impact without adding false information.
+        {SECTION_REWRITE_FOCUS[kind]}
+
+        RULES (CRITICAL):
+        - Do NOT add new employers, dates, certifications, skills, metrics, or technologies.
+        - Only improve wording; keep facts accurate.
+        - Use action verbs. Tense: current roles (present), past roles (past).
+        - Return ONLY valid JSON with the same keys as the input. No markdown or explanations.
+
+        INPUT JSON:
+        {section_json}
+
+        Return ONLY the improved JSON object, nothing else:
+        """
+    ).strip()
+
+
+def section_repair_prompt(section: str, fragment: str) -> str:
+    """Ask again for one top-level section whose JSON could not be repaired locally."""
+    return dedent(
+        f"""
+        The value of the "{section}" field in a resume JSON document is malformed or cut off.
+        Reproduce it as valid JSON, keeping the same content. Do NOT add information.
+
+        MALFORMED VALUE:
+        {fragment}
+
+        Return ONLY a JSON object of the form {{"{section}": <value>}}, nothing else:
+        """
+    ).strip()
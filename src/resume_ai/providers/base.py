@@ -1,8 +1,74 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import AsyncIterator, Iterator, Optional
 
 
 class LLMProvider(ABC):
+    name: str = "llm"
+
+    @property
+    def model(self) -> Optional[str]:
+        """Model identifier used for cache keys and reporting."""
+        return None
+
+    @property
+    def max_tokens(self) -> Optional[int]:
+        """Completion cap applied when a call passes no ``max_tokens``; ``None`` when unknown."""
+        return None
+
+    async def aclose(self) -> None:
+        """Release async resources opened on the running event loop; call before the loop shuts down."""
+
     @abstractmethod
     def complete(self, *, system_prompt: str, user_prompt: str, temperature: float = 0.2, max_tokens: Optional[int] = None) -> str:
         raise NotImplementedError
+
+    async def acomplete(self, *, system_prompt: str, user_prompt: str, temperature: float = 0.2, max_tokens: Optional[int] = None) -> str:
+        """Async completion; sync-only providers run ``complete`` on a worker thread."""
+        return await asyncio.to_thread(
+            self.complete,
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+
+    def stream(self, *, system_prompt: str, user_prompt: str, temperature: float = 0.2, max_tokens: Optional[int] = None) -> Iterator[str]:
+        """Yield the completion in chunks; non-streaming providers yield it whole."""
+        yield self.complete(
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+
+    async def astream(self, *, system_prompt: str, user_prompt: str, temperature: float = 0.2, max_tokens: Optional[int] = None) -> AsyncIterator[str]:
+        yield await self.acomplete(
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+
+
+class AsyncLLMProvider(LLMProvider):
+    """Provider with a native ``acomplete``; ``complete`` is a blocking wrapper around it."""
+
+    @abstractmethod
+    async def acomplete(self, *, system_prompt: str, user_prompt: str, temperature: float = 0.2, max_tokens: Optional[int] = None) -> str:
+        raise NotImplementedError
+
+    def complete(self, *, system_prompt: str, user_prompt: str, temperature: float = 0.2, max_tokens: Optional[int] = None) -> str:
+        async def run() -> str:
+            # The loop ends with this call, so its clients are closed before it does
+            try:
+                return await self.acomplete(
+                    system_prompt=system_prompt,
+                    user_prompt=user_prompt,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                )
+            finally:
+                await self.aclose()
+
+        return asyncio.run(run())
@@ -0,0 +1,101 @@
+"""Provider wrapper that caps the number of completions in flight."""
+import asyncio
+import threading
+import weakref
+from typing import AsyncIterator, Iterator, Optional
+
+from resume_ai.providers.base import LLMProvider
+
+
+class BoundedProvider(LLMProvider):
+    """Let at most ``max_in_flight`` calls reach ``provider`` at once; the rest wait their turn.
+
+    Sync callers share one thread semaphore. Async callers share one
+    asyncio semaphore per event loop, since asyncio primitives are bound
+    to a single loop.
+    """
+
+    def __init__(self, provider: LLMProvider, max_in_flight: int = 16):
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        self.provider = provider
+        self.max_in_flight = max_in_flight
+        self._slots = threading.BoundedSemaphore(max_in_flight)
+        self._async_slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+        self.in_flight = 0
+
+    @property
+    def name(self) -> str:  # type: ignore[override]
+        return self.provider.name
+
+    @property
+    def model(self) -> Optional[str]:
+        return self.provider.model
+
+    @property
+    def max_tokens(self) -> Optional[int]:
+        return self.provider.max_tokens
+
+    async def aclose(self) -> None:
+        await self.provider.aclose()
+
+    def _loop_slots(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            slots = self._async_slots.get(loop)
+            if slots is None:
+                slots = self._async_slots[loop] = asyncio.Semaphore(self.max_in_flight)
+            return slots
+
+    def _enter(self) -> None:
+        with self._lock:
+            self.in_flight += 1
+
+    def _exit(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+    def complete(self, *, system_prompt: str, user_prompt: str, temperature: float = 0.2, max_tokens: Optional[int] = None) -> str:
+        with self._slots:
+            self._enter()
+            try:
+                return self.provider.complete(
+                    system_prompt=system_prompt, user_prompt=user_prompt, temperature=temperature, max_tokens=max_tokens
+                )
+            finally:
+                self._exit()
+
+    async def acomplete(self, *, system_prompt: str, user_prompt: str, temperature: float = 0.2, max_tokens: Optional[int] = None) -> str:
+        async with self._loop_slots():
+            self._enter()
+            try:
+                return await self.provider.acomplete(
+                    system_prompt=system_prompt, user_prompt=user_prompt, temperature=temperature, max_tokens=max_tokens
+                )
+            finally:
+                self._exit()
+
+    def stream(self, *, system_prompt: str, user_prompt: str, temperature: float = 0.2, max_tokens: Optional[int] = None) -> Iterator[str]:
+        # The slot is held until the stream is exhausted or closed
+        with self._slots:
+            self._enter()
+            try:
+                yield from self.provider.stream(
+                    system_prompt=system_prompt, user_prompt=user_prompt, temperature=temperature, max_tokens=max_tokens
+                )
+            finally:
+                self._exit()
+
+    async def astream(self, *, system_prompt: str, user_prompt: str, temperature: float = 0.2, max_tokens: Optional[int] = None) -> AsyncIterator[str]:
+        async with self._loop_slots():
+            self._enter()
+            try:
+                async for chunk in self.provider.astream(
+                    system_prompt=system_prompt, user_prompt=user_prompt, temperature=temperature, max_tokens=max_tokens
+                ):
+                    yield chunk
+            finally:
+                self._exit()
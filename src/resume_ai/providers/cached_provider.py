@@ -0,0 +1,118 @@
+"""Provider wrapper that serves repeated completions from a cache."""
+from typing import AsyncIterator, Iterator, Optional
+
+from resume_ai.cache import CompletionCache, MemoryCompletionCache, completion_key
+from resume_ai.instrumentation import record_cache_hit
+from resume_ai.providers.base import LLMProvider
+
+
+class CachedProvider(LLMProvider):
+    """Wrap any provider so identical requests are answered from ``cache``."""
+
+    def __init__(self, provider: LLMProvider, cache: Optional[CompletionCache] = None):
+        self.provider = provider
+        self.cache = cache if cache is not None else MemoryCompletionCache()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def name(self) -> str:  # type: ignore[override]
+        return self.provider.name
+
+    @property
+    def model(self) -> Optional[str]:
+        return self.provider.model
+
+    @property
+    def max_tokens(self) -> Optional[int]:
+        return self.provider.max_tokens
+
+    async def aclose(self) -> None:
+        await self.provider.aclose()
+
+    def cache_key(self, *, system_prompt: str, user_prompt: str, temperature: float, max_tokens: Optional[int]) -> str:
+        # Key on the cap the provider actually applies, so changing its default max_tokens
+        # never serves a completion truncated under the old one
+        return completion_key(
+            provider=self.provider.name,
+            model=self.provider.model,
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            temperature=temperature,
+            max_tokens=max_tokens or self.provider.max_tokens,
+        )
+
+    def complete(self, *, system_prompt: str, user_prompt: str, temperature: float = 0.2, max_tokens: Optional[int] = None) -> str:
+        key = self.cache_key(system_prompt=system_prompt, user_prompt=user_prompt, temperature=temperature, max_tokens=max_tokens)
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.hits += 1
+            record_cache_hit()
+            return cached
+        self.misses += 1
+        result = self.provider.complete(
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+        self.cache.set(key, result)
+        return result
+
+    async def acomplete(self, *, system_prompt: str, user_prompt: str, temperature: float = 0.2, max_tokens: Optional[int] = None) -> str:
+        key = self.cache_key(system_prompt=system_prompt, user_prompt=user_prompt, temperature=temperature, max_tokens=max_tokens)
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.hits += 1
+            record_cache_hit()
+            return cached
+        self.misses += 1
+        result = await self.provider.acomplete(
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+        self.cache.set(key, result)
+        return result
+
+    def stream(self, *, system_prompt: str, user_prompt: str, temperature: float = 0.2, max_tokens: Optional[int] = None) -> Iterator[str]:
+        key = self.cache_key(system_prompt=system_prompt, user_prompt=user_prompt, temperature=temperature, max_tokens=max_tokens)
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.hits += 1
+            record_cache_hit()
+            yield cached
+            return
+        self.misses += 1
+        chunks = []
+        for chunk in self.provider.stream(
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        ):
+            chunks.append(chunk)
+            yield chunk
+        # Only complete streams are cached
+        self.cache.set(key, "".join(chunks).strip())
+
+    async def astream(self, *, system_prompt: str, user_prompt: str, temperature: float = 0.2, max_tokens: Optional[int] = None) -> AsyncIterator[str]:
+        key = self.cache_key(system_prompt=system_prompt, user_prompt=user_prompt, temperature=temperature, max_tokens=max_tokens)
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.hits += 1
+            record_cache_hit()
+            yield cached
+            return
+        self.misses += 1
+        chunks = []
+        async for chunk in self.provider.astream(
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        ):
+            chunks.append(chunk)
+            yield chunk
+        self.cache.set(key, "".join(chunks).strip())
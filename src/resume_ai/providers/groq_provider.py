@@ -1,39 +1,99 @@
 """Groq API provider implementation."""
 import os
-from typing import Optional
-from openai import OpenAI
+from typing import Any, AsyncIterator, Iterator, Optional
+from openai import AsyncOpenAI, OpenAI
 
-from resume_ai.providers.base import LLMProvider
+from resume_ai.instrumentation import record_usage
+from resume_ai.providers.base import AsyncLLMProvider
+from resume_ai.providers.openai_provider import AsyncClientPool
 
+GROQ_BASE_URL = "https://api.groq.com/openai/v1"
+GROQ_MAX_TOKENS = 2000
 
-class GroqProvider(LLMProvider):
+
+class GroqProvider(AsyncLLMProvider):
     """Provider for Groq API (uses OpenAI-compatible client)."""
-    
-    def __init__(self, api_key: Optional[str] = None, model: str = "llama-3.3-70b-versatile"):
+
+    name = "groq"
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = "llama-3.3-70b-versatile",
+        max_connections: int = 20,
+        max_retries: int = 2,
+    ):
         self.api_key = api_key or os.getenv("GROQ_API_KEY")
         if not self.api_key:
             raise ValueError("GROQ_API_KEY is required")
-        
+
         self.model_name = model
         self.client = OpenAI(
             api_key=self.api_key,
-            base_url="https://api.groq.com/openai/v1"
+            base_url=GROQ_BASE_URL,
+            max_retries=max_retries,
+        )
+        self.async_clients = AsyncClientPool(
+            lambda http_client: AsyncOpenAI(
+                api_key=self.api_key, base_url=GROQ_BASE_URL, http_client=http_client, max_retries=max_retries
+            ),
+            max_connections=max_connections,
+        )
+
+    @property
+    def model(self) -> Optional[str]:
+        return self.model_name
+
+    @property
+    def max_tokens(self) -> Optional[int]:
+        return GROQ_MAX_TOKENS
+
+    async def aclose(self) -> None:
+        await self.async_clients.aclose()
+
+    def _request(self, system_prompt: str, user_prompt: str, temperature: float, max_tokens: Optional[int]) -> dict:
+        return dict(
+            model=self.model_name,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            temperature=temperature,
+            max_tokens=max_tokens or GROQ_MAX_TOKENS,
         )
 
     def complete(self, *, system_prompt: str, user_prompt: str, temperature: float = 0.2, max_tokens: Optional[int] = None) -> str:
         """Call Groq API using OpenAI-compatible interface."""
         try:
-            response = self.client.chat.completions.create(
-                model=self.model_name,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=temperature,
-                max_tokens=max_tokens or 2000,
-            )
-            
+            response = self.client.chat.completions.create(**self._request(system_prompt, user_prompt, temperature, max_tokens))
+            record_usage(getattr(response, "usage", None))
             return response.choices[0].message.content.strip()
-            
         except Exception as e:
-            raise RuntimeError(f"Groq API error: {e}")
+            raise RuntimeError(f"Groq API error: {e}") from e
+
+    async def acomplete(self, *, system_prompt: str, user_prompt: str, temperature: float = 0.2, max_tokens: Optional[int] = None) -> str:
+        """Call Groq API on the shared async connection pool."""
+        try:
+            client: Any = self.async_clients.get()
+            response = await client.chat.completions.create(**self._request(system_prompt, user_prompt, temperature, max_tokens))
+            record_usage(getattr(response, "usage", None))
+            return response.choices[0].message.content.strip()
+        except Exception as e:
+            raise RuntimeError(f"Groq API error: {e}") from e
+
+    def stream(self, *, system_prompt: str, user_prompt: str, temperature: float = 0.2, max_tokens: Optional[int] = None) -> Iterator[str]:
+        try:
+            for chunk in self.client.chat.completions.create(stream=True, **self._request(system_prompt, user_prompt, temperature, max_tokens)):
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except Exception as e:
+            raise RuntimeError(f"Groq API error: {e}") from e
+
+    async def astream(self, *, system_prompt: str, user_prompt: str, temperature: float = 0.2, max_tokens: Optional[int] = None) -> AsyncIterator[str]:
+        try:
+            client: Any = self.async_clients.get()
+            async for chunk in await client.chat.completions.create(stream=True, **self._request(system_prompt, user_prompt, temperature, max_tokens)):
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except Exception as e:
+            raise RuntimeError(f"Groq API error: {e}") from e
@@ -1,21 +1,86 @@
+import asyncio
 import os
-from typing import Optional
-from openai import OpenAI
+import threading
+import weakref
+from typing import Any, AsyncIterator, Callable, Iterator, Optional
+
+import httpx
+from openai import AsyncOpenAI, OpenAI
 
 from resume_ai.config import OpenAISettings
-from resume_ai.providers.base import LLMProvider
+from resume_ai.instrumentation import record_usage
+from resume_ai.providers.base import AsyncLLMProvider
+
+
+class AsyncClientPool:
+    """One pooled async client per running event loop.
+
+    httpx connection pools are bound to the loop that opened them, so the
+    client is shared by every coroutine on a loop but never across loops.
+    ``aclose`` must run on the loop before it shuts down, or its sockets
+    are left open.
+    """
+
+    def __init__(self, factory: Callable[[httpx.AsyncClient], Any], *, max_connections: int = 20):
+        self._factory = factory
+        self._max_connections = max_connections
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
 
+    def get(self) -> Any:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._clients.get(loop)
+            if client is None:
+                http_client = httpx.AsyncClient(
+                    limits=httpx.Limits(
+                        max_connections=self._max_connections,
+                        max_keepalive_connections=self._max_connections,
+                    ),
+                    timeout=httpx.Timeout(120.0, connect=10.0),
+                )
+                client = self._factory(http_client)
+                self._clients[loop] = client
+            return client
 
-class OpenAIProvider(LLMProvider):
-    def __init__(self, settings: Optional[OpenAISettings] = None):
+    async def aclose(self) -> None:
+        """Close the running loop's client, if one was opened."""
+        with self._lock:
+            client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.close()
+
+
+class OpenAIProvider(AsyncLLMProvider):
+    name = "openai"
+
+    def __init__(self, settings: Optional[OpenAISettings] = None, *, max_retries: int = 2):
+        # Pass max_retries=0 under a ResilientProvider, which does the retrying itself
         self.settings = settings or OpenAISettings.from_env()
         api_key = self.settings.api_key or os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise ValueError("OPENAI_API_KEY is required")
-        self.client = OpenAI(api_key=api_key, organization=self.settings.organization)
+        self.client = OpenAI(api_key=api_key, organization=self.settings.organization, max_retries=max_retries)
+        self.async_clients = AsyncClientPool(
+            lambda http_client: AsyncOpenAI(
+                api_key=api_key, organization=self.settings.organization, http_client=http_client, max_retries=max_retries
+            ),
+            max_connections=self.settings.max_connections,
+        )
 
-    def complete(self, *, system_prompt: str, user_prompt: str, temperature: float = 0.2, max_tokens: Optional[int] = None) -> str:
-        response = self.client.chat.completions.create(
+    @property
+    def model(self) -> Optional[str]:
+        return self.settings.model
+
+    @property
+    def max_tokens(self) -> Optional[int]:
+        return self.settings.max_tokens
+
+    async def aclose(self) -> None:
+        await self.async_clients.aclose()
+
+    def _request(self, system_prompt: str, user_prompt: str, temperature: float, max_tokens: Optional[int]) -> dict:
+        return dict(
             model=self.settings.model,
             temperature=temperature,
             max_tokens=max_tokens or self.settings.max_tokens,
@@ -24,7 +89,35 @@ class OpenAIProvider(LLMProvider):
                 {"role": "user", "content": user_prompt},
             ],
         )
+
+    @staticmethod
+    def _content(response: Any) -> str:
+        record_usage(getattr(response, "usage", None))
         message = response.choices[0].message.content
         if not message:
             raise RuntimeError("OpenAI returned empty content")
         return message.strip()
+
+    def complete(self, *, system_prompt: str, user_prompt: str, temperature: float = 0.2, max_tokens: Optional[int] = None) -> str:
+        response = self.client.chat.completions.create(**self._request(system_prompt, user_prompt, temperature, max_tokens))
+        return self._content(response)
+
+    async def acomplete(self, *, system_prompt: str, user_prompt: str, temperature: float = 0.2, max_tokens: Optional[int] = None) -> str:
+        client = self.async_clients.get()
+        response = await client.chat.completions.create(**self._request(system_prompt, user_prompt, temperature, max_tokens))
+        return self._content(response)
+
+    def stream(self, *, system_prompt: str, user_prompt: str, temperature: float = 0.2, max_tokens: Optional[int] = None) -> Iterator[str]:
+        request = self._request(system_prompt, user_prompt, temperature, max_tokens)
+        for chunk in self.client.chat.completions.create(stream=True, stream_options={"include_usage": True}, **request):
+            record_usage(getattr(chunk, "usage", None))
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    async def astream(self, *, system_prompt: str, user_prompt: str, temperature: float = 0.2, max_tokens: Optional[int] = None) -> AsyncIterator[str]:
+        client = self.async_clients.get()
+        request = self._request(system_prompt, user_prompt, temperature, max_tokens)
+        async for chunk in await client.chat.completions.create(stream=True, stream_options={"include_usage": True}, **request):
+            record_usage(getattr(chunk, "usage", None))
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
@@ -0,0 +1,278 @@
+"""Rate limiting, retries and failover across LLM providers."""
+import asyncio
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import AsyncIterator, Iterator, Mapping, Optional, Sequence
+
+from resume_ai.config import RateLimits
+from resume_ai.instrumentation import note_retry
+from resume_ai.prompt_library import estimate_tokens
+from resume_ai.providers.base import LLMProvider
+
+RETRYABLE_ERROR_NAMES = {"APIConnectionError", "APITimeoutError", "RateLimitError", "InternalServerError"}
+
+
+class TokenBucket:
+    """Continuously refilling bucket holding up to one minute of quota.
+
+    ``reserve`` always succeeds and returns how long the caller must wait
+    before using what it reserved, so sync and async callers share one
+    implementation and concurrent callers queue up fairly.
+    """
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, amount: float = 1.0) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Requests larger than the bucket would never fit; cap them at capacity.
+            self._tokens -= min(amount, self.capacity)
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+
+class ProviderLimiter:
+    def __init__(self, limits: RateLimits):
+        self.requests = TokenBucket(limits.requests_per_minute) if limits.requests_per_minute else None
+        self.tokens = TokenBucket(limits.tokens_per_minute) if limits.tokens_per_minute else None
+
+    def reserve(self, token_cost: int) -> float:
+        wait = 0.0
+        if self.requests is not None:
+            wait = max(wait, self.requests.reserve(1))
+        if self.tokens is not None:
+            wait = max(wait, self.tokens.reserve(token_cost))
+        return wait
+
+
+@dataclass
+class RetryPolicy:
+    max_retries: int = 5
+    base_delay: float = 1.0
+    max_delay: float = 30.0
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Full-jitter exponential backoff, never shorter than ``retry_after``.
+
+        ``max_delay`` caps only the backoff: retrying before the server's
+        ``Retry-After`` would just be rate limited again.
+        """
+        backoff = random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+        if retry_after is not None:
+            return max(backoff, retry_after)
+        return backoff
+
+
+def _error_chain(exc: BaseException):
+    seen = set()
+    while exc is not None and id(exc) not in seen:
+        seen.add(id(exc))
+        yield exc
+        exc = exc.__cause__ or exc.__context__
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """True for 408s, 429s, 5xx responses, timeouts and transport errors anywhere in the cause chain."""
+    for err in _error_chain(exc):
+        status = getattr(err, "status_code", None)
+        if isinstance(status, int) and (status in (408, 429) or status >= 500):
+            return True
+        if type(err).__name__ in RETRYABLE_ERROR_NAMES:
+            return True
+    return False
+
+
+def retry_after_seconds(exc: BaseException) -> Optional[float]:
+    for err in _error_chain(exc):
+        response = getattr(err, "response", None)
+        headers = getattr(response, "headers", None)
+        if not headers:
+            continue
+        value = headers.get("retry-after")
+        if value:
+            try:
+                return float(value)
+            except ValueError:
+                return None
+    return None
+
+
+class ResilientProvider(LLMProvider):
+    """Try ``providers`` in order, rate limiting and retrying each one.
+
+    Retryable errors (429, 408, 5xx, timeouts, connection failures) are
+    retried with jittered exponential backoff; once a provider's retries
+    are spent the next provider in the chain is used. Anything else, such
+    as an auth error or a bad request, is raised at once: another attempt
+    would fail the same way. The last error is raised if every provider
+    fails.
+
+    Wrapped providers should be built with SDK retries off
+    (``max_retries=0``) so attempts are not multiplied.
+    """
+
+    def __init__(
+        self,
+        providers: Sequence[LLMProvider],
+        *,
+        rate_limits: Optional[Mapping[str, RateLimits]] = None,
+        retry: Optional[RetryPolicy] = None,
+    ):
+        if not providers:
+            raise ValueError("ResilientProvider needs at least one provider")
+        self.providers = list(providers)
+        self.retry = retry or RetryPolicy()
+        self.limiters = {}
+        for provider in self.providers:
+            limits = (rate_limits or {}).get(provider.name) or RateLimits.from_env(provider.name)
+            self.limiters[provider.name] = ProviderLimiter(limits)
+
+    @property
+    def name(self) -> str:  # type: ignore[override]
+        return self.providers[0].name
+
+    @property
+    def model(self) -> Optional[str]:
+        return self.providers[0].model
+
+    @property
+    def max_tokens(self) -> Optional[int]:
+        # Any provider in the chain may answer, so callers size requests for the smallest cap
+        caps = [p.max_tokens for p in self.providers if p.max_tokens]
+        return min(caps) if caps else None
+
+    async def aclose(self) -> None:
+        for provider in self.providers:
+            await provider.aclose()
+
+    def _token_cost(self, provider: LLMProvider, system_prompt: str, user_prompt: str, max_tokens: Optional[int]) -> int:
+        # Providers reserve their default completion cap when the call sets none
+        return estimate_tokens(system_prompt) + estimate_tokens(user_prompt) + (max_tokens or provider.max_tokens or 0)
+
+    def complete(self, *, system_prompt: str, user_prompt: str, temperature: float = 0.2, max_tokens: Optional[int] = None) -> str:
+        last_error: Optional[BaseException] = None
+        for provider in self.providers:
+            limiter = self.limiters[provider.name]
+            cost = self._token_cost(provider, system_prompt, user_prompt, max_tokens)
+            for attempt in range(self.retry.max_retries + 1):
+                wait = limiter.reserve(cost)
+                if wait:
+                    time.sleep(wait)
+                try:
+                    return provider.complete(
+                        system_prompt=system_prompt,
+                        user_prompt=user_prompt,
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                    )
+                except Exception as e:
+                    if not is_retryable(e):
+                        raise
+                    last_error = e
+                    if attempt == self.retry.max_retries:
+                        break
+                    note_retry()
+                    time.sleep(self.retry.delay(attempt, retry_after_seconds(e)))
+        assert last_error is not None
+        raise last_error
+
+    async def acomplete(self, *, system_prompt: str, user_prompt: str, temperature: float = 0.2, max_tokens: Optional[int] = None) -> str:
+        last_error: Optional[BaseException] = None
+        for provider in self.providers:
+            limiter = self.limiters[provider.name]
+            cost = self._token_cost(provider, system_prompt, user_prompt, max_tokens)
+            for attempt in range(self.retry.max_retries + 1):
+                wait = limiter.reserve(cost)
+                if wait:
+                    await asyncio.sleep(wait)
+                try:
+                    return await provider.acomplete(
+                        system_prompt=system_prompt,
+                        user_prompt=user_prompt,
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                    )
+                except Exception as e:
+                    if not is_retryable(e):
+                        raise
+                    last_error = e
+                    if attempt == self.retry.max_retries:
+                        break
+                    note_retry()
+                    await asyncio.sleep(self.retry.delay(attempt, retry_after_seconds(e)))
+        assert last_error is not None
+        raise last_error
+
+    def stream(self, *, system_prompt: str, user_prompt: str, temperature: float = 0.2, max_tokens: Optional[int] = None) -> Iterator[str]:
+        """Stream with the same retry/failover rules, applied until the first chunk arrives."""
+        last_error: Optional[BaseException] = None
+        for provider in self.providers:
+            limiter = self.limiters[provider.name]
+            cost = self._token_cost(provider, system_prompt, user_prompt, max_tokens)
+            for attempt in range(self.retry.max_retries + 1):
+                wait = limiter.reserve(cost)
+                if wait:
+                    time.sleep(wait)
+                started = False
+                try:
+                    for chunk in provider.stream(
+                        system_prompt=system_prompt,
+                        user_prompt=user_prompt,
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                    ):
+                        started = True
+                        yield chunk
+                    return
+                except Exception as e:
+                    # Output already handed to the caller cannot be retracted
+                    if started or not is_retryable(e):
+                        raise
+                    last_error = e
+                    if attempt == self.retry.max_retries:
+                        break
+                    note_retry()
+                    time.sleep(self.retry.delay(attempt, retry_after_seconds(e)))
+        assert last_error is not None
+        raise last_error
+
+    async def astream(self, *, system_prompt: str, user_prompt: str, temperature: float = 0.2, max_tokens: Optional[int] = None) -> AsyncIterator[str]:
+        last_error: Optional[BaseException] = None
+        for provider in self.providers:
+            limiter = self.limiters[provider.name]
+            cost = self._token_cost(provider, system_prompt, user_prompt, max_tokens)
+            for attempt in range(self.retry.max_retries + 1):
+                wait = limiter.reserve(cost)
+                if wait:
+                    await asyncio.sleep(wait)
+                started = False
+                try:
+                    async for chunk in provider.astream(
+                        system_prompt=system_prompt,
+                        user_prompt=user_prompt,
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                    ):
+                        started = True
+                        yield chunk
+                    return
+                except Exception as e:
+                    if started or not is_retryable(e):
+                        raise
+                    last_error = e
+                    if attempt == self.retry.max_retries:
+                        break
+                    note_retry()
+                    await asyncio.sleep(self.retry.delay(attempt, retry_after_seconds(e)))
+        assert last_error is not None
+        raise last_error
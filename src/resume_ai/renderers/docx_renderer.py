@@ -1,4 +1,6 @@
+import io
 from pathlib import Path
+from typing import Any, BinaryIO, Optional, Union
 
 from resume_ai.models import Resume
 
@@ -9,11 +11,13 @@ except ImportError:
 
 
 class DocxRenderer:
-    def __init__(self):
+    def __init__(self, jinja_env: Any = None):
+        # jinja_env is unused; all renderers share one constructor signature
         if Document is None:
             raise ImportError("python-docx is required for DOCX rendering; install with `pip install python-docx`")
 
-    def render(self, resume: Resume, *, output_path: str) -> None:
+    def render(self, resume: Resume, *, output_path: Union[str, Path, BinaryIO], template_name: Optional[str] = None) -> None:
+        """Write the DOCX to a filesystem path or a binary file-like object."""
         document = Document()
         document.add_heading(resume.contact.full_name, level=0)
 
@@ -35,6 +39,14 @@ class DocxRenderer:
             for edu in resume.education:
                 document.add_paragraph(f"{edu.degree or ''} - {edu.institution}")
 
+        if not isinstance(output_path, (str, Path)):
+            document.save(output_path)
+            return
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
         document.save(str(output_file))
+
+    def render_bytes(self, resume: Resume) -> bytes:
+        buffer = io.BytesIO()
+        self.render(resume, output_path=buffer)
+        return buffer.getvalue()
@@ -0,0 +1,237 @@
+"""Persistent pool of pre-warmed WeasyPrint worker processes."""
+import atexit
+import multiprocessing
+import queue
+import threading
+from concurrent.futures import Future
+from pathlib import Path
+from typing import BinaryIO, Callable, Optional, Union
+
+from resume_ai.config import RenderSettings
+from resume_ai.models import Resume
+
+# Per-process WeasyPrint state, populated by ``warm_pdf_worker``
+_font_config = None
+
+
+def warm_pdf_worker() -> None:
+    """Import WeasyPrint, load fonts and render every bundled template once.
+
+    The first ``write_pdf`` in a process pays for font discovery and CSS
+    setup; doing it here keeps that cost off the first real job. Missing
+    WeasyPrint is not fatal: jobs then fail with the usual ImportError.
+    """
+    global _font_config
+    try:
+        from weasyprint import HTML  # type: ignore
+        from weasyprint.text.fonts import FontConfiguration  # type: ignore
+    except ImportError:
+        return
+    from resume_ai.templating import get_registry
+
+    _font_config = FontConfiguration()
+    registry = get_registry()
+    sample = Resume.model_validate({"contact": {"full_name": "Warm Up"}, "summary": "Warm up", "skills": ["Python"]})
+    for name in registry.names():
+        HTML(string=registry.get(name).render(resume=sample)).write_pdf(font_config=_font_config)
+
+
+def render_pdf_job(resume_json: str, template_name: str) -> bytes:
+    """Render one resume to PDF bytes inside a worker process."""
+    try:
+        from weasyprint import HTML  # type: ignore
+    except ImportError:
+        raise ImportError("weasyprint is required for PDF rendering; install with `pip install '.[pdf]'`") from None
+    from resume_ai.templating import get_registry
+
+    resume = Resume.model_validate_json(resume_json)
+    html_content = get_registry().get(template_name).render(resume=resume)
+    return HTML(string=html_content).write_pdf(font_config=_font_config)
+
+
+def _worker_main(conn, render_fn: Callable[[str, str], bytes], warm: Optional[Callable[[], None]]) -> None:
+    # Runs in a child process; must stay importable at module level.
+    if warm is not None:
+        try:
+            warm()
+        except Exception:
+            pass
+    conn.send(("ready", None))
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            return
+        if job is None:
+            return
+        try:
+            conn.send(("ok", render_fn(*job)))
+        except Exception as e:
+            try:
+                conn.send(("error", e))
+            except Exception:
+                conn.send(("error", RuntimeError(f"{type(e).__name__}: {e}")))
+
+
+class _Worker:
+    def __init__(self, ctx, render_fn, warm):
+        self._ctx = ctx
+        self._render_fn = render_fn
+        self._warm = warm
+        self._spawn()
+
+    def _spawn(self) -> None:
+        self.conn, child_conn = self._ctx.Pipe()
+        self.process = self._ctx.Process(
+            target=_worker_main, args=(child_conn, self._render_fn, self._warm), daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.ready = False
+
+    def run(self, job: tuple[str, str], timeout: Optional[float]) -> bytes:
+        try:
+            if not self.ready:
+                # Warm-up time does not count against the job's timeout
+                self.conn.recv()
+                self.ready = True
+            self.conn.send(job)
+        except (EOFError, OSError):
+            self.restart()
+            raise RuntimeError("PDF worker exited unexpectedly") from None
+        if not self.conn.poll(timeout):
+            self.restart()
+            raise TimeoutError(f"PDF render exceeded {timeout:g}s")
+        try:
+            status, payload = self.conn.recv()
+        except EOFError:
+            self.restart()
+            raise RuntimeError("PDF worker exited unexpectedly") from None
+        if status == "error":
+            raise payload
+        return payload
+
+    def restart(self) -> None:
+        self.kill()
+        self._spawn()
+
+    def kill(self) -> None:
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+    def stop(self) -> None:
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout=5)
+        self.kill()
+
+
+class PDFRenderPool:
+    """Render PDFs on long-lived, pre-warmed worker processes.
+
+    Jobs wait in a bounded queue; ``submit`` blocks when it is full, so a
+    fast producer cannot pile up unbounded work. A job that runs past
+    ``timeout`` fails with ``TimeoutError`` and only its worker is
+    replaced. Results come back as PDF bytes; ``render`` writes them to
+    disk in the calling process.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        *,
+        max_pending: Optional[int] = None,
+        timeout: Optional[float] = 60.0,
+        render_fn: Callable[[str, str], bytes] = render_pdf_job,
+        warm: Optional[Callable[[], None]] = warm_pdf_worker,
+    ):
+        self.workers = max(1, workers or multiprocessing.cpu_count() or 1)
+        self.timeout = timeout
+        self._jobs: queue.Queue = queue.Queue(maxsize=max_pending or self.workers * 4)
+        # spawn keeps WeasyPrint/fontconfig state out of forked copies of this process
+        ctx = multiprocessing.get_context("spawn")
+        self._workers = [_Worker(ctx, render_fn, warm) for _ in range(self.workers)]
+        self._closed = False
+        self._threads = [
+            threading.Thread(target=self._dispatch, args=(worker,), daemon=True, name=f"pdf-worker-{i}")
+            for i, worker in enumerate(self._workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def _dispatch(self, worker: _Worker) -> None:
+        while True:
+            item = self._jobs.get()
+            if item is None:
+                worker.stop()
+                return
+            future, job = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(worker.run(job, self.timeout))
+            except BaseException as e:
+                future.set_exception(e)
+
+    def submit(self, resume: Union[Resume, dict, str], template_name: str = "minimal", *, block_timeout: Optional[float] = None) -> "Future[bytes]":
+        """Queue a render and return a future for its PDF bytes.
+
+        Raises ``queue.Full`` if the queue stays full for ``block_timeout`` seconds.
+        """
+        if self._closed:
+            raise RuntimeError("PDFRenderPool is closed")
+        from resume_ai.pipeline import coerce_resume
+
+        future: Future = Future()
+        self._jobs.put((future, (coerce_resume(resume).model_dump_json(), template_name)), timeout=block_timeout)
+        return future
+
+    def render_bytes(self, resume: Union[Resume, dict, str], template_name: str = "minimal") -> bytes:
+        return self.submit(resume, template_name).result()
+
+    def render(self, resume: Union[Resume, dict, str], *, template_name: str = "minimal", output_path: Union[str, Path, BinaryIO]) -> Union[Path, BinaryIO]:
+        pdf_bytes = self.render_bytes(resume, template_name)
+        if not isinstance(output_path, (str, Path)):
+            output_path.write(pdf_bytes)
+            return output_path
+        output_file = Path(output_path)
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        output_file.write_bytes(pdf_bytes)
+        return output_file
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        for _ in self._threads:
+            self._jobs.put(None)
+        for thread in self._threads:
+            thread.join()
+
+    def __enter__(self) -> "PDFRenderPool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+_pool: Optional[PDFRenderPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_pdf_pool() -> PDFRenderPool:
+    """Process-wide pool sized from ``RenderSettings.from_env()``, closed at exit."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                settings = RenderSettings.from_env()
+                _pool = PDFRenderPool(
+                    settings.pdf_workers, max_pending=settings.pdf_queue_size, timeout=settings.pdf_timeout_seconds
+                )
+                atexit.register(_pool.close)
+    return _pool
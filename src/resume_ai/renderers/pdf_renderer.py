@@ -1,5 +1,6 @@
+import io
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, Union
 
 from resume_ai.models import Resume
 
@@ -10,15 +11,28 @@ except ImportError:
 
 
 class PDFRenderer:
-    def __init__(self, jinja_env: Any):
+    def __init__(self, jinja_env: Any = None):
+        if jinja_env is None:
+            from resume_ai.templating.templates import get_template_env
+
+            jinja_env = get_template_env()
         self.jinja_env = jinja_env
 
-    def render(self, resume: Resume, *, template_name: str, output_path: str) -> None:
+    def render(self, resume: Resume, *, template_name: str, output_path: Union[str, Path, BinaryIO]) -> None:
+        """Write the PDF to a filesystem path or a binary file-like object."""
         if HTML is None:
             raise ImportError("weasyprint is required for PDF rendering; install with `pip install '.[pdf]'`")
 
         template = self.jinja_env.get_template(f"{template_name}.html")
         html_content = template.render(resume=resume)
-        output_file = Path(output_path)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        HTML(string=html_content).write_pdf(target=str(output_file))
+        target = output_path
+        if isinstance(output_path, (str, Path)):
+            output_file = Path(output_path)
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+            target = str(output_file)
+        HTML(string=html_content).write_pdf(target=target)
+
+    def render_bytes(self, resume: Resume, *, template_name: str) -> bytes:
+        buffer = io.BytesIO()
+        self.render(resume, template_name=template_name, output_path=buffer)
+        return buffer.getvalue()
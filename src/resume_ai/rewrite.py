@@ -0,0 +1,133 @@
+"""Concurrent per-section rewriting of structured resume data."""
+import asyncio
+import contextvars
+import copy
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from resume_ai.json_extract import parse_json_object
+from resume_ai.prompt_library import compact_json, section_rewrite_prompt
+from resume_ai.providers.base import LLMProvider
+from resume_ai.streaming import SectionEvent
+
+logger = logging.getLogger("resume_ai.rewrite")
+
+SECTION_REWRITE_SYSTEM_PROMPT = "You improve one resume section without fabrication. Return ONLY valid JSON, no markdown or extra text."
+
+
+@dataclass
+class RewriteUnit:
+    kind: str
+    index: Optional[int]
+    payload: dict[str, Any]
+
+    @property
+    def section(self) -> str:
+        return {"summary": "summary", "experience": "experience", "project": "projects"}[self.kind]
+
+
+def split_units(resume_data: dict) -> list[RewriteUnit]:
+    """Independent rewrite units: the summary, each job and each project.
+
+    Only fields the model may reword are sent back for merging; titles and
+    companies are included purely as context.
+    """
+    units = []
+    if isinstance(resume_data.get("summary"), str) and resume_data["summary"].strip():
+        units.append(RewriteUnit("summary", None, {"summary": resume_data["summary"]}))
+    for i, exp in enumerate(resume_data.get("experience") or []):
+        if isinstance(exp, dict) and exp.get("bullets"):
+            payload = {k: exp.get(k) for k in ("title", "company", "current", "bullets")}
+            units.append(RewriteUnit("experience", i, payload))
+    for i, proj in enumerate(resume_data.get("projects") or []):
+        if isinstance(proj, dict) and (proj.get("bullets") or proj.get("outcome")):
+            payload = {k: proj.get(k) for k in ("name", "role", "bullets", "outcome")}
+            units.append(RewriteUnit("project", i, payload))
+    return units
+
+
+def _merge_unit(resume_data: dict, unit: RewriteUnit, rewritten: Any) -> Any:
+    """Copy only rewritable fields back; return the merged value or ``None`` if unusable."""
+    if not isinstance(rewritten, dict):
+        return None
+    if unit.kind == "summary":
+        if isinstance(rewritten.get("summary"), str) and rewritten["summary"].strip():
+            resume_data["summary"] = rewritten["summary"].strip()
+            return resume_data["summary"]
+        return None
+    target = resume_data[unit.section][unit.index]
+    bullets = rewritten.get("bullets")
+    if isinstance(bullets, list) and all(isinstance(b, str) for b in bullets) and bullets:
+        target["bullets"] = [b.strip() for b in bullets if b.strip()]
+    if unit.kind == "project" and isinstance(rewritten.get("outcome"), str) and target.get("outcome"):
+        target["outcome"] = rewritten["outcome"].strip()
+    return target
+
+
+class SectionRewriter:
+    """Rewrite resume units concurrently with small section-specific prompts.
+
+    Contact data, skills, education and every other section pass through
+    untouched. A unit whose completion does not parse keeps its original
+    text, so one malformed section never sinks the resume; provider errors
+    are raised so retries and fallbacks upstream can handle them.
+    """
+
+    def __init__(self, llm: LLMProvider, *, max_workers: int = 8, compact: bool = True):
+        self.llm = llm
+        self.max_workers = max_workers
+        self.compact = compact
+
+    def _request(self, unit: RewriteUnit) -> dict:
+        return dict(
+            system_prompt=SECTION_REWRITE_SYSTEM_PROMPT,
+            user_prompt=section_rewrite_prompt(unit.kind, compact_json(unit.payload) if self.compact else json.dumps(unit.payload)),
+            temperature=0.1,
+        )
+
+    @staticmethod
+    def _parse(unit: RewriteUnit, completion: str) -> Any:
+        try:
+            return parse_json_object(completion)
+        except ValueError as e:
+            where = unit.section if unit.index is None else f"{unit.section}[{unit.index}]"
+            logger.warning("Keeping the original %s: its rewrite did not parse (%s)", where, e)
+            return None
+
+    def _rewrite_unit(self, unit: RewriteUnit) -> Any:
+        return self._parse(unit, self.llm.complete(**self._request(unit)))
+
+    async def _arewrite_unit(self, unit: RewriteUnit, slots: asyncio.Semaphore) -> tuple[RewriteUnit, Any]:
+        async with slots:
+            completion = await self.llm.acomplete(**self._request(unit))
+        return unit, self._parse(unit, completion)
+
+    def rewrite(self, resume_data: dict, on_section: Optional[Callable[[SectionEvent], None]] = None) -> dict:
+        result = copy.deepcopy(resume_data)
+        units = split_units(result)
+        if not units:
+            return result
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(units))) as pool:
+            # Copy the context so instrumentation sees which stage these calls belong to
+            futures = {pool.submit(contextvars.copy_context().run, self._rewrite_unit, unit): unit for unit in units}
+            for future in as_completed(futures):
+                self._apply(result, futures[future], future.result(), on_section)
+        return result
+
+    async def arewrite(self, resume_data: dict, on_section: Optional[Callable[[SectionEvent], None]] = None) -> dict:
+        result = copy.deepcopy(resume_data)
+        units = split_units(result)
+        # Same concurrency cap as the thread pool in ``rewrite``
+        slots = asyncio.Semaphore(self.max_workers)
+        for next_done in asyncio.as_completed([self._arewrite_unit(unit, slots) for unit in units]):
+            unit, value = await next_done
+            self._apply(result, unit, value, on_section)
+        return result
+
+    def _apply(self, result: dict, unit: RewriteUnit, rewritten: Any, on_section: Optional[Callable[[SectionEvent], None]]) -> None:
+        merged = _merge_unit(result, unit, rewritten)
+        if merged is not None and on_section is not None:
+            on_section(SectionEvent(unit.section, merged, unit.index, stage="rewrite"))
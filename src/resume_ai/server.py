@@ -0,0 +1,325 @@
+"""Async HTTP API for building and rendering resumes, on the standard library only.
+
+Endpoints:
+
+- ``POST /build``: raw resume text (``text/plain``), or
+  ``{"input": <text or resume object>, "wait": bool}`` as JSON. With
+  ``wait`` (the default) the response carries the validated resume;
+  without it, ``202`` and the job id are returned straight away.
+- ``GET /jobs/<id>``: status of a build, plus its resume once done.
+- ``POST /render?format=pdf&template=minimal``: resume JSON in, document out.
+- ``GET /health``.
+
+One ``ResumeProcessor`` (and with it the provider clients and the
+template environment) serves every request. Builds are keyed by the
+hash of their input. Concurrent requests for the same input share a
+single upstream computation, and finished results are kept for status
+lookups and repeat requests.
+"""
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional
+from urllib.parse import parse_qs, urlsplit
+
+from pydantic import ValidationError
+
+from resume_ai.models import Resume
+from resume_ai.pipeline import MEDIA_TYPES, ResumeProcessor, coerce_resume
+from resume_ai.store import input_key
+
+logger = logging.getLogger("resume_ai.server")
+
+MAX_BODY_BYTES = 5 * 1024 * 1024
+REASONS = {
+    200: "OK", 202: "Accepted", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+    413: "Payload Too Large", 500: "Internal Server Error", 501: "Not Implemented",
+}
+
+
+class Singleflight:
+    """Run one task per key; concurrent callers with the same key await that task.
+
+    Callers await a shielded view, so one client going away never cancels
+    work that others are waiting on.
+    """
+
+    def __init__(self):
+        self._tasks: dict[str, asyncio.Task] = {}
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._tasks
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def start(self, key: str, fn: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+        task = self._tasks.get(key)
+        if task is None:
+            task = self._tasks[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda t: self._finished(key, t))
+        return task
+
+    def _finished(self, key: str, task: asyncio.Task) -> None:
+        self._tasks.pop(key, None)
+        # Nobody may be waiting (fire-and-forget builds); mark the error as seen
+        if not task.cancelled():
+            task.exception()
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        return await asyncio.shield(self.start(key, fn))
+
+
+@dataclass
+class BuildJob:
+    key: str
+    status: str = "running"
+    resume: Optional[Resume] = None
+    error: Optional[str] = None
+    created: float = 0.0
+    finished: Optional[float] = None
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {"job": self.key, "status": self.status}
+        if self.resume is not None:
+            out["resume"] = self.resume.model_dump()
+        if self.error is not None:
+            out["error"] = self.error
+        return out
+
+
+class ResumeService:
+    """Coalesced builds and renders on one shared processor."""
+
+    def __init__(self, processor: ResumeProcessor, *, max_jobs: int = 1024):
+        self.processor = processor
+        self.max_jobs = max_jobs
+        self.builds = Singleflight()
+        self.jobs: "OrderedDict[str, BuildJob]" = OrderedDict()
+
+    def submit(self, raw_input: str) -> tuple[BuildJob, asyncio.Task]:
+        """Start building ``raw_input`` unless the same input is running or already built."""
+        key = input_key(raw_input)
+        job = self.jobs.get(key)
+        if job is None or job.status == "failed":
+            job = BuildJob(key, created=time.time())
+            self._remember(job)
+        else:
+            self.jobs.move_to_end(key)
+        if job.status == "done":
+            done = asyncio.get_running_loop().create_future()
+            done.set_result(job.resume)
+            return job, done
+        return job, self.builds.start(key, lambda: self._build(job, raw_input))
+
+    async def build(self, raw_input: str) -> BuildJob:
+        job, task = self.submit(raw_input)
+        try:
+            await asyncio.shield(task)
+        except Exception:
+            pass
+        return job
+
+    async def _build(self, job: BuildJob, raw_input: str) -> Resume:
+        try:
+            job.resume = await self.processor.abuild(raw_input)
+        except Exception as e:
+            job.status, job.error = "failed", f"{type(e).__name__}: {e}"
+            logger.warning("Build %s failed: %s", job.key[:12], job.error)
+            raise
+        finally:
+            job.finished = time.time()
+        job.status = "done"
+        return job.resume
+
+    def _remember(self, job: BuildJob) -> None:
+        self.jobs[job.key] = job
+        self.jobs.move_to_end(job.key)
+        # Forget the oldest finished jobs; running ones stay until they finish
+        for key in [k for k, j in self.jobs.items() if j.status != "running"][: max(0, len(self.jobs) - self.max_jobs)]:
+            del self.jobs[key]
+
+    async def render(self, resume: Any, fmt: str, template_name: Optional[str] = None) -> bytes:
+        # Rendering is CPU-bound; keep it off the event loop
+        return await asyncio.to_thread(self.processor.render_bytes, coerce_resume(resume), fmt, template_name=template_name)
+
+
+@dataclass
+class Request:
+    method: str
+    path: str
+    query: dict[str, list[str]]
+    headers: dict[str, str]
+    body: bytes
+    version: str = "HTTP/1.1"
+
+    def param(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        values = self.query.get(name)
+        return values[0] if values else default
+
+    @property
+    def keep_alive(self) -> bool:
+        connection = self.headers.get("connection", "").lower()
+        return connection != "close" if self.version == "HTTP/1.1" else connection == "keep-alive"
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+Response = tuple[int, str, bytes]
+
+
+def json_response(status: int, payload: Any) -> Response:
+    return status, "application/json", json.dumps(payload).encode("utf-8")
+
+
+async def read_request(reader: asyncio.StreamReader, max_body: int = MAX_BODY_BYTES) -> Optional[Request]:
+    """Read one HTTP/1.x request, or ``None`` when the client closed the connection."""
+    line = await reader.readline()
+    if not line.strip():
+        return None
+    try:
+        method, target, version = line.decode("latin-1").split()
+    except ValueError:
+        raise HTTPError(400, "Malformed request line") from None
+    headers = {}
+    while (header := await reader.readline()) not in (b"\r\n", b"\n", b""):
+        name, _, value = header.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    if "transfer-encoding" in headers:
+        # Chunked bodies are not supported; the body's extent is unknown, so the connection is closed
+        raise HTTPError(501, "Transfer-Encoding is not supported; send a Content-Length")
+    raw_length = headers.get("content-length") or "0"
+    if not (raw_length.isascii() and raw_length.isdigit()):
+        raise HTTPError(400, f"Invalid Content-Length: {raw_length!r}")
+    length = int(raw_length)
+    if length > max_body:
+        raise HTTPError(413, f"Request body is limited to {max_body} bytes")
+    body = await reader.readexactly(length) if length else b""
+    url = urlsplit(target)
+    return Request(method.upper(), url.path, parse_qs(url.query), headers, body, version)
+
+
+class ResumeServer:
+    """Routes HTTP requests to a ``ResumeService``; keeps connections alive between requests."""
+
+    def __init__(self, service: ResumeService):
+        self.service = service
+
+    async def dispatch(self, request: Request) -> Response:
+        parts = [p for p in request.path.split("/") if p]
+        routes = {
+            ("health",): {"GET": self.health},
+            ("build",): {"POST": self.build},
+            ("render",): {"POST": self.render},
+        }
+        if len(parts) == 2 and parts[0] == "jobs":
+            methods = {"GET": lambda r: self.job_status(parts[1])}
+        else:
+            methods = routes.get(tuple(parts))
+        if methods is None:
+            raise HTTPError(404, f"No route for {request.path}")
+        handler = methods.get(request.method)
+        if handler is None:
+            raise HTTPError(405, f"{request.method} is not allowed on {request.path}")
+        return await handler(request)
+
+    async def health(self, request: Request) -> Response:
+        return json_response(200, {"status": "ok", "builds_in_flight": len(self.service.builds)})
+
+    async def build(self, request: Request) -> Response:
+        wait = request.param("wait", "1").lower() not in {"0", "false", "no"}
+        if request.headers.get("content-type", "").split(";")[0].strip() == "application/json":
+            payload = _json_body(request)
+            if not isinstance(payload, dict) or "input" not in payload:
+                raise HTTPError(400, 'Expected a JSON object with an "input" field')
+            raw_input = payload["input"] if isinstance(payload["input"], str) else json.dumps(payload["input"])
+            wait = bool(payload.get("wait", wait))
+        else:
+            try:
+                raw_input = request.body.decode("utf-8")
+            except UnicodeDecodeError:
+                raise HTTPError(400, "Resume text must be UTF-8") from None
+        if not raw_input.strip():
+            raise HTTPError(400, "Empty resume input")
+        if not wait:
+            job, _ = self.service.submit(raw_input)
+            return json_response(200 if job.status == "done" else 202, job.to_dict())
+        job = await self.service.build(raw_input)
+        return json_response(500 if job.status == "failed" else 200, job.to_dict())
+
+    async def job_status(self, key: str) -> Response:
+        job = self.service.jobs.get(key)
+        if job is None:
+            raise HTTPError(404, f"Unknown job {key}")
+        return json_response(200, job.to_dict())
+
+    async def render(self, request: Request) -> Response:
+        fmt = request.param("format", "pdf")
+        if fmt not in MEDIA_TYPES:
+            raise HTTPError(400, f"Unsupported output format: {fmt}")
+        payload = _json_body(request)
+        resume = payload.get("resume", payload) if isinstance(payload, dict) else payload
+        try:
+            body = await self.service.render(resume, fmt, request.param("template"))
+        except ValidationError as e:
+            raise HTTPError(400, f"Invalid resume: {e.error_count()} validation errors") from None
+        return 200, MEDIA_TYPES[fmt], body
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                keep_alive = False
+                try:
+                    request = await read_request(reader)
+                    if request is None:
+                        break
+                    keep_alive = request.keep_alive
+                    response = await self.dispatch(request)
+                except HTTPError as e:
+                    response = json_response(e.status, {"error": str(e)})
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    break
+                except Exception as e:
+                    logger.exception("Unhandled error")
+                    response = json_response(500, {"error": f"{type(e).__name__}: {e}"})
+                status, content_type, body = response
+                writer.write(
+                    f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+                    f"Content-Type: {content_type}\r\nContent-Length: {len(body)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1") + body
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8000) -> asyncio.AbstractServer:
+        return await asyncio.start_server(self.handle, host, port)
+
+
+def _json_body(request: Request) -> Any:
+    try:
+        return json.loads(request.body or b"null")
+    except ValueError as e:
+        raise HTTPError(400, f"Invalid JSON body: {e}") from None
+
+
+async def serve(processor: ResumeProcessor, host: str = "127.0.0.1", port: int = 8000) -> None:
+    """Serve the API until cancelled."""
+    server = await ResumeServer(ResumeService(processor)).start(host, port)
+    logger.info("Serving on %s", ", ".join(str(s.getsockname()) for s in server.sockets))
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await processor.aclose()
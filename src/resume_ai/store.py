@@ -0,0 +1,250 @@
+"""Persistent, searchable store of processed resumes.
+
+Each validated ``Resume`` is kept in a single SQLite file, keyed by the
+hash of the input it was built from. Two kinds of index are kept next to
+it:
+
+- an FTS5 full-text index over names, titles, companies, the summary,
+  bullets and skills, ranked with BM25;
+- an inverted index of exact (case-folded) skills, technologies,
+  companies and titles.
+
+Candidates can then be found across a large archive without running
+anything through the pipeline again.
+"""
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional, Sequence, Union
+
+from resume_ai.config import StoreSettings
+from resume_ai.models import Resume
+
+TERM_KINDS = ("skill", "technology", "company", "title")
+_SPACE_RE = re.compile(r"\s+")
+_FTS_TOKEN_RE = re.compile(r'[^\s"]+')
+
+
+def input_key(raw_input: str) -> str:
+    """Content-addressed key for a pipeline input; surrounding whitespace is ignored."""
+    return hashlib.sha256(raw_input.strip().encode("utf-8")).hexdigest()
+
+
+def normalize_term(term: str) -> str:
+    return _SPACE_RE.sub(" ", term).strip().casefold()
+
+
+def index_terms(resume: Resume) -> set[tuple[str, str]]:
+    """The ``(kind, term)`` pairs a resume is filed under in the inverted index."""
+    raw = [("skill", s) for s in resume.skills]
+    raw += [("technology", t) for exp in resume.experience for t in exp.technologies]
+    raw += [("technology", t) for proj in resume.projects for t in proj.stack]
+    raw += [("company", exp.company) for exp in resume.experience if exp.company]
+    raw += [("title", exp.title) for exp in resume.experience if exp.title]
+    return {(kind, normalize_term(term)) for kind, term in raw if term and term.strip()}
+
+
+def _document(resume: Resume) -> tuple[str, str, str]:
+    """Full-text columns: name, headline (titles and companies) and body."""
+    headline = " ".join(filter(None, (part for exp in resume.experience for part in (exp.title, exp.company))))
+    body = [resume.summary or ""]
+    for exp in resume.experience:
+        body += exp.bullets + exp.technologies
+    for proj in resume.projects:
+        body += [proj.name or "", proj.outcome or ""] + proj.bullets + proj.stack
+    for edu in resume.education:
+        body += [edu.institution or "", edu.degree or "", edu.field or ""]
+    body += resume.skills + [c.name or "" for c in resume.certifications] + resume.achievements
+    return resume.contact.full_name or "", headline, "\n".join(filter(None, body))
+
+
+def fts_query(text: str) -> str:
+    """Turn free text into an FTS5 query: every word must match, ``word*`` is a prefix."""
+    terms = []
+    for token in _FTS_TOKEN_RE.findall(text):
+        prefix = token.endswith("*") and len(token) > 1
+        token = token.rstrip("*")
+        if token:
+            terms.append(f'"{token}"' + ("*" if prefix else ""))
+    return " ".join(terms)
+
+
+@dataclass
+class StoredResume:
+    key: str
+    resume: Resume
+    created: float
+    # BM25 rank of a full-text hit; lower is better, None without a text query
+    rank: Optional[float] = None
+
+
+class ResumeStore:
+    """SQLite-backed resume archive with full-text and term indexes.
+
+    Safe to share between threads; writes for many resumes can be batched
+    into one transaction with ``put_many``.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS resumes ("
+            " id INTEGER PRIMARY KEY, key TEXT NOT NULL UNIQUE, data TEXT NOT NULL, created REAL NOT NULL)"
+        )
+        # Keeps c++ and c# whole
+        self._conn.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS resume_text USING fts5("
+            " name, headline, body, tokenize = \"unicode61 tokenchars '+#'\")"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS resume_terms ("
+            " kind TEXT NOT NULL, term TEXT NOT NULL, resume_id INTEGER NOT NULL,"
+            " PRIMARY KEY (kind, term, resume_id)) WITHOUT ROWID"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS resume_terms_resume ON resume_terms(resume_id)")
+
+    def put(self, key: str, resume: Resume) -> None:
+        self.put_many([(key, resume)])
+
+    def put_many(self, items: Iterable[tuple[str, Resume]]) -> int:
+        """Insert or replace resumes in a single transaction; returns how many were written."""
+        now = time.time()
+        count = 0
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                for key, resume in items:
+                    self._write(key, resume, now)
+                    count += 1
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+        return count
+
+    def _write(self, key: str, resume: Resume, now: float) -> None:
+        resume_id = self._conn.execute(
+            "INSERT INTO resumes (key, data, created) VALUES (?, ?, ?)"
+            " ON CONFLICT(key) DO UPDATE SET data = excluded.data, created = excluded.created RETURNING id",
+            (key, resume.model_dump_json(), now),
+        ).fetchone()[0]
+        self._unindex(resume_id)
+        self._conn.execute(
+            "INSERT INTO resume_text (rowid, name, headline, body) VALUES (?, ?, ?, ?)", (resume_id, *_document(resume))
+        )
+        self._conn.executemany(
+            "INSERT INTO resume_terms (kind, term, resume_id) VALUES (?, ?, ?)",
+            [(kind, term, resume_id) for kind, term in index_terms(resume)],
+        )
+
+    def _unindex(self, resume_id: int) -> None:
+        self._conn.execute("DELETE FROM resume_text WHERE rowid = ?", (resume_id,))
+        self._conn.execute("DELETE FROM resume_terms WHERE resume_id = ?", (resume_id,))
+
+    def get(self, key: str) -> Optional[StoredResume]:
+        with self._lock:
+            row = self._conn.execute("SELECT key, data, created FROM resumes WHERE key = ?", (key,)).fetchone()
+        return self._stored(row) if row else None
+
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            row = self._conn.execute("SELECT id FROM resumes WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return False
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._unindex(row[0])
+            self._conn.execute("DELETE FROM resumes WHERE id = ?", row)
+            self._conn.execute("COMMIT")
+            return True
+
+    def search(
+        self,
+        text: Optional[str] = None,
+        *,
+        skills: Sequence[str] = (),
+        technologies: Sequence[str] = (),
+        companies: Sequence[str] = (),
+        titles: Sequence[str] = (),
+        limit: int = 20,
+    ) -> list[StoredResume]:
+        """Resumes matching every given criterion.
+
+        ``text`` is a full-text query (all words must appear; ``word*``
+        matches a prefix) and results are ranked by relevance. Without
+        it, the newest resumes come first. Term filters match whole
+        skills, technologies, companies or titles, case-insensitively.
+        """
+        filters = [
+            (kind, normalize_term(term))
+            for kind, terms in zip(TERM_KINDS, (skills, technologies, companies, titles))
+            for term in terms
+        ]
+        match = fts_query(text or "")
+        where, params = [], []
+        if filters:
+            # Each filter is one index lookup; INTERSECT keeps resumes listed under all of them
+            subquery = " INTERSECT ".join(["SELECT resume_id FROM resume_terms WHERE kind = ? AND term = ?"] * len(filters))
+            where.append(f"r.id IN ({subquery})")
+            params += [value for pair in filters for value in pair]
+        if match:
+            sql = (
+                "SELECT r.key, r.data, r.created, bm25(resume_text) AS rank"
+                " FROM resume_text JOIN resumes r ON r.id = resume_text.rowid"
+            )
+            where.insert(0, "resume_text MATCH ?")
+            params.insert(0, match)
+            order = "rank"
+        else:
+            sql = "SELECT r.key, r.data, r.created, NULL FROM resumes r"
+            order = "r.id DESC"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += f" ORDER BY {order} LIMIT ?"
+        with self._lock:
+            rows = self._conn.execute(sql, (*params, limit)).fetchall()
+        return [self._stored(row) for row in rows]
+
+    def term_counts(self, kind: str, *, limit: int = 50) -> list[tuple[str, int]]:
+        """Most common terms of one kind across the store, e.g. the skills on file."""
+        if kind not in TERM_KINDS:
+            raise ValueError(f"Unknown term kind: {kind}")
+        with self._lock:
+            return self._conn.execute(
+                "SELECT term, COUNT(*) AS n FROM resume_terms WHERE kind = ? GROUP BY term ORDER BY n DESC, term LIMIT ?",
+                (kind, limit),
+            ).fetchall()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM resumes WHERE key = ?", (key,)).fetchone() is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM resumes").fetchone()[0]
+
+    @staticmethod
+    def _stored(row: tuple) -> StoredResume:
+        key, data, created, *rank = row
+        return StoredResume(key, Resume.model_validate_json(data), created, rank[0] if rank else None)
+
+
+def store_from_settings(settings: Optional[StoreSettings] = None, *, enabled: Optional[bool] = None) -> Optional[ResumeStore]:
+    """Open the configured resume store, or ``None`` when storing is disabled.
+
+    ``enabled``, when given, overrides the setting (e.g. an explicit ``--store``).
+    """
+    settings = settings or StoreSettings.from_env()
+    return ResumeStore(settings.path) if (settings.enabled if enabled is None else enabled) else None
@@ -0,0 +1,141 @@
+"""Incremental parsing of streamed resume JSON into per-section events."""
+import json
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional
+
+WHITESPACE = " \t\r\n"
+
+
+@dataclass
+class SectionEvent:
+    """A top-level ``Resume`` section (``index is None``) or one item of a list section."""
+
+    section: str
+    value: Any
+    index: Optional[int] = None
+    stage: str = ""
+
+
+class SectionStreamParser:
+    """Emit each top-level section of a JSON object as soon as it closes.
+
+    Chunks are scanned once, in order; elements of top-level arrays (each
+    experience entry, each skill, ...) are emitted individually before the
+    whole array is. Text before the first ``{`` (prose, code fences) is
+    ignored. Malformed fragments are skipped rather than raised, leaving
+    error reporting to the final full parse.
+    """
+
+    def __init__(self, stage: str = ""):
+        self.stage = stage
+        self.buffer = ""
+        self.done = False
+        self._pos = 0
+        self._started = False
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._expect_value = False
+        self._key: Optional[str] = None
+        self._key_start = 0
+        self._value_start: Optional[int] = None
+        self._value_scalar = False
+        self._array_open = False
+        self._item_start: Optional[int] = None
+        self._item_scalar = False
+        self._item_index = 0
+
+    def feed(self, chunk: str) -> list[SectionEvent]:
+        self.buffer += chunk
+        events: list[SectionEvent] = []
+        buf = self.buffer
+        for i in range(self._pos, len(buf)):
+            c = buf[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif c == "\\":
+                    self._escape = True
+                elif c == '"':
+                    self._in_string = False
+                    if self._depth == 1 and not self._expect_value:
+                        self._key = _loads(buf[self._key_start:i + 1])
+                continue
+            if not self._started:
+                if c == "{":
+                    self._started = True
+                    self._depth = 1
+                continue
+            if self.done:
+                break
+            if c in WHITESPACE:
+                continue
+            if c in ",}]":
+                # Scalars end at the next separator or closing bracket
+                if self._depth == 2 and self._array_open and self._item_start is not None and self._item_scalar:
+                    self._emit_item(events, buf[self._item_start:i])
+                if self._depth == 1 and self._value_start is not None and self._value_scalar:
+                    self._emit_section(events, buf[self._value_start:i])
+                if c == ",":
+                    continue
+                self._depth -= 1
+                if self._depth == 2 and self._array_open and self._item_start is not None:
+                    self._emit_item(events, buf[self._item_start:i + 1])
+                elif self._depth == 1 and self._value_start is not None:
+                    self._emit_section(events, buf[self._value_start:i + 1])
+                elif self._depth == 0:
+                    self.done = True
+                continue
+            if c == ":" and self._depth == 1:
+                self._expect_value = True
+                continue
+            if self._depth == 1 and self._expect_value and self._value_start is None:
+                self._value_start = i
+                self._value_scalar = c not in "{["
+                self._array_open = c == "["
+                self._item_index = 0
+            elif self._depth == 1 and c == '"':
+                self._key_start = i
+            elif self._depth == 2 and self._array_open and self._item_start is None:
+                self._item_start = i
+                self._item_scalar = c not in "{["
+            if c == '"':
+                self._in_string = True
+            elif c in "{[":
+                self._depth += 1
+        self._pos = len(buf)
+        return events
+
+    def _emit_item(self, events: list[SectionEvent], raw: str) -> None:
+        self._item_start = None
+        ok, value = _try_loads(raw)
+        if ok and self._key is not None:
+            events.append(SectionEvent(self._key, value, self._item_index, self.stage))
+        self._item_index += 1
+
+    def _emit_section(self, events: list[SectionEvent], raw: str) -> None:
+        self._value_start = None
+        self._expect_value = False
+        self._array_open = False
+        ok, value = _try_loads(raw)
+        if ok and self._key is not None:
+            events.append(SectionEvent(self._key, value, None, self.stage))
+
+
+def iter_sections(chunks: Iterable[str], stage: str = ""):
+    """Yield ``SectionEvent``s from an iterable of text chunks."""
+    parser = SectionStreamParser(stage)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+
+
+def _try_loads(raw: str) -> tuple[bool, Any]:
+    try:
+        return True, json.loads(raw)
+    except ValueError:
+        return False, None
+
+
+def _loads(raw: str) -> Optional[str]:
+    ok, value = _try_loads(raw)
+    return value if ok and isinstance(value, str) else None
@@ -0,0 +1,106 @@
+"""Process-wide registry of compiled resume templates."""
+import re
+import threading
+from pathlib import Path
+from typing import Optional
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template, select_autoescape
+
+from resume_ai.config import TemplateSettings
+from resume_ai.models import TemplateMetadata
+
+TEMPLATES_DIR = Path(__file__).parent / "templates"
+TEMPLATE_DESCRIPTIONS = {
+    "minimal": "Clean single-column layout with plain section headings.",
+    "corporate": "Serif layout with ruled header for traditional industries.",
+    "moderate": "Balanced layout between minimal and corporate styling.",
+}
+_SECTION_RE = re.compile(r"\bresume\.(\w+)")
+
+
+class TemplateRegistry:
+    """Shared Jinja environment with every bundled template compiled once.
+
+    Compiled bytecode is persisted to ``settings.cache_dir`` so later
+    processes skip parsing too. Safe to use from multiple threads.
+    """
+
+    def __init__(self, templates_dir: Path = TEMPLATES_DIR, settings: Optional[TemplateSettings] = None):
+        self.templates_dir = Path(templates_dir)
+        self.settings = settings or TemplateSettings.from_env()
+        self._env: Optional[Environment] = None
+        self._metadata: dict[str, TemplateMetadata] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def env(self) -> Environment:
+        return self._ensure_env()
+
+    def _ensure_env(self) -> Environment:
+        """Build the environment (and template metadata) on first use."""
+        if self._env is None:
+            with self._lock:
+                if self._env is None:
+                    self._env = self._build_env()
+        return self._env
+
+    def _build_env(self) -> Environment:
+        bytecode_cache = None
+        if self.settings.cache_dir:
+            cache_dir = Path(self.settings.cache_dir).expanduser()
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            bytecode_cache = FileSystemBytecodeCache(str(cache_dir))
+        env = Environment(
+            loader=FileSystemLoader(str(self.templates_dir)),
+            autoescape=select_autoescape(["html", "xml"]),
+            bytecode_cache=bytecode_cache,
+            auto_reload=self.settings.auto_reload,
+        )
+        for name in self._template_files():
+            env.get_template(f"{name}.html")
+            self._metadata[name] = self._describe(name)
+        return env
+
+    def _template_files(self) -> list[str]:
+        return sorted(path.stem for path in self.templates_dir.glob("*.html"))
+
+    def _describe(self, name: str) -> TemplateMetadata:
+        source = (self.templates_dir / f"{name}.html").read_text(encoding="utf-8")
+        sections = list(dict.fromkeys(_SECTION_RE.findall(source)))
+        return TemplateMetadata(
+            name=name,
+            description=TEMPLATE_DESCRIPTIONS.get(name, f"{name.title()} template"),
+            sections=sections,
+        )
+
+    def names(self) -> list[str]:
+        self._ensure_env()
+        return list(self._metadata)
+
+    def get(self, name: str) -> Template:
+        return self.env.get_template(f"{name}.html")
+
+    def metadata(self, name: Optional[str] = None):
+        """Metadata for one template, or for all of them when ``name`` is omitted."""
+        self._ensure_env()
+        if name is None:
+            return list(self._metadata.values())
+        if name not in self._metadata:
+            raise KeyError(f"Unknown template: {name}")
+        return self._metadata[name]
+
+
+_registry: Optional[TemplateRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_registry() -> TemplateRegistry:
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = TemplateRegistry()
+    return _registry
+
+
+__all__ = ["TemplateMetadata", "TemplateRegistry", "get_registry"]
@@ -1,9 +1,5 @@
-from pathlib import Path
-from jinja2 import Environment, FileSystemLoader, select_autoescape
-
-
 def get_template_env():
-    templates_dir = Path(__file__).parent
-    loader = FileSystemLoader(str(templates_dir))
-    env = Environment(loader=loader, autoescape=select_autoescape(["html", "xml"]))
-    return env
+    """Shared, precompiled environment from the process-wide template registry."""
+    from resume_ai.templating import get_registry
+
+    return get_registry().env
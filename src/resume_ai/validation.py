@@ -0,0 +1,124 @@
+"""Validate LLM output straight into ``Resume``.
+
+Well-formed output, the usual case, is parsed and validated in a single
+pydantic-core pass from the completion text, with no intermediate dict.
+When that pass fails, its errors are returned as per-field
+``FieldIssue`` records. The same input then goes through a lenient
+validator compiled once from ``Resume``'s own core schema: every field
+falls back to its default when its value does not fit, every list drops
+the items that do not, and numbers are accepted where strings are
+expected. Only the bad fields are lost, and nothing is patched up in
+Python.
+"""
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Union
+
+from pydantic import ValidationError
+from pydantic_core import SchemaValidator
+
+from resume_ai.json_extract import find_json_object, parse_json_object
+from resume_ai.models import Resume
+
+logger = logging.getLogger("resume_ai.validation")
+
+
+@dataclass(frozen=True)
+class FieldIssue:
+    """A value that was replaced by its default, or dropped from its list."""
+
+    loc: tuple[Union[str, int], ...]
+    message: str
+    value: Any
+
+    def __str__(self) -> str:
+        return f"{'.'.join(map(str, self.loc))}: {self.message} (got {self.value!r})"
+
+
+def _lenient(schema: Any) -> Any:
+    """Copy of a core schema that defaults fields and omits list items on error.
+
+    Models become typed dicts: pydantic-core always reuses a model class's
+    own (strict) validator, so the lenient pass produces plain data that
+    is then built into the real classes.
+    """
+    if isinstance(schema, list):
+        return [_lenient(item) for item in schema]
+    if not isinstance(schema, dict):
+        return schema
+    out = {key: _lenient(value) for key, value in schema.items()}
+    kind = out.get("type")
+    if kind == "model":
+        fields = {
+            name: {"type": "typed-dict-field", "schema": field["schema"], "required": False}
+            for name, field in out["schema"]["fields"].items()
+        }
+        config = {**out.get("config", {}), "coerce_numbers_to_str": True}
+        return {"type": "typed-dict", "fields": fields, "config": config}
+    if kind == "model-field":
+        inner = out["schema"]
+        if inner.get("type") != "default":
+            # A required field (Resume.contact): fall back to an empty object
+            empty = {"default_factory": dict} if inner.get("type") == "typed-dict" else {"default": None}
+            inner = {"type": "default", "schema": inner, **empty}
+        out["schema"] = {**inner, "on_error": "default"}
+    elif kind == "list":
+        out["items_schema"] = {"type": "default", "schema": out["items_schema"], "on_error": "omit"}
+    return out
+
+
+@lru_cache(maxsize=None)
+def lenient_validator() -> SchemaValidator:
+    """The cached lenient validator for ``Resume`` data (compiled on first use)."""
+    return SchemaValidator(_lenient(Resume.__pydantic_core_schema__))
+
+
+def _recover(data: Any, error: ValidationError, *, json: bool) -> tuple[Resume, list[FieldIssue]]:
+    issues = [FieldIssue(tuple(e["loc"]), e["msg"], e.get("input")) for e in error.errors(include_url=False)]
+    for issue in issues:
+        logger.info("Dropped resume field %s", issue)
+    validator = lenient_validator()
+    cleaned = validator.validate_json(data) if json else validator.validate_python(data if isinstance(data, dict) else {})
+    return Resume.model_validate(cleaned), issues
+
+
+def validate_resume(data: Any) -> tuple[Resume, list[FieldIssue]]:
+    """Validate resume data; fields that do not fit fall back to their defaults and are reported."""
+    try:
+        return Resume.model_validate(data), []
+    except ValidationError as e:
+        return _recover(data, e, json=False)
+
+
+def validate_resume_json(text: Union[str, bytes]) -> tuple[Resume, list[FieldIssue]]:
+    """Parse and validate a JSON document without building an intermediate dict.
+
+    Raises ``ValueError`` when ``text`` is not valid JSON.
+    """
+    try:
+        return Resume.model_validate_json(text), []
+    except ValidationError as e:
+        if any(err["type"] == "json_invalid" for err in e.errors()):
+            raise ValueError(str(e)) from None
+        return _recover(text, e, json=True)
+
+
+def validate_completion(completion: str) -> tuple[Resume, list[FieldIssue]]:
+    """Validate the JSON object in an LLM completion.
+
+    A well-formed object (the usual case) is validated straight from the
+    text. Malformed output goes through the local repairs in
+    ``parse_json_object`` first, which raise ``JSONExtractionError`` when
+    they are not enough.
+    """
+    text = completion.strip()
+    # Bare JSON, which is what the prompts ask for, skips the scan for the object's span
+    span = (0, len(text), True) if text[:1] == "{" and text[-1:] == "}" else find_json_object(text)
+    if span is not None and span[2]:
+        try:
+            return validate_resume_json(text[span[0]:span[1]])
+        except ValueError:
+            # Not valid JSON after all; fall through to the local repairs
+            pass
+    return validate_resume(parse_json_object(text))
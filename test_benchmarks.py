@@ -0,0 +1,38 @@
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent / "benchmarks"))
+
+from fake_provider import FakeProvider
+from fused_vs_two_pass import run_mode
+from run import compare, run
+
+
+def test_fake_provider_echoes_rewrite_input_and_counts_calls():
+    provider = FakeProvider(responses={"sys-x": "recorded"})
+    assert provider.complete(system_prompt="s", user_prompt='INPUT JSON:\n{"summary": "hi"}\nReturn it') == '{"summary": "hi"}'
+    assert json.loads(provider.complete(system_prompt="s", user_prompt="raw text"))["contact"]["full_name"]
+    assert provider.complete(system_prompt="sys-x", user_prompt="anything") == "recorded"
+    assert "".join(provider.stream(system_prompt="sys-x", user_prompt="")) == "recorded"
+    assert provider.calls == 4
+
+
+def test_benchmark_report_is_machine_readable_and_flags_regressions():
+    report = run(iterations=2, only=["model_validate", "build_json", "pdf_render"])
+    json.dumps(report)
+    assert set(report["results"]) == {"model_validate", "build_json", "pdf_render"}
+    assert report["results"]["model_validate"]["median_ms"] >= 0
+    assert report["results"]["build_json"]["llm_calls_per_op"] >= 1
+
+    baseline = {"results": {"build_json": {"median_ms": report["results"]["build_json"]["median_ms"] / 10}}}
+    assert compare(report, baseline, tolerance=0.25)[0].startswith("build_json")
+    assert compare(report, report, tolerance=0.25) == []
+
+
+def test_fused_benchmark_compares_different_flows():
+    raw_text = (Path(__file__).parent / "samples" / "sample_plain.txt").read_text(encoding="utf-8")
+    two_pass, _ = run_mode(FakeProvider(), raw_text, fused=False, repeats=1)
+    fused, _ = run_mode(FakeProvider(), raw_text, fused=True, repeats=1)
+    assert two_pass["llm_calls_per_resume"] > fused["llm_calls_per_resume"]
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Tests for the LLM completion cache."""
+
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from resume_ai.cache import MemoryCompletionCache, SQLiteCompletionCache
+from resume_ai.providers.base import LLMProvider
+from resume_ai.providers.cached_provider import CachedProvider
+
+
+class CountingProvider(LLMProvider):
+    name = "counting"
+
+    def __init__(self):
+        self.calls = 0
+
+    def complete(self, *, system_prompt, user_prompt, temperature=0.2, max_tokens=None):
+        self.calls += 1
+        return f"{system_prompt}|{user_prompt}|{temperature}"
+
+
+def test_cached_provider_reuses_identical_requests():
+    inner = CountingProvider()
+    llm = CachedProvider(inner, MemoryCompletionCache())
+    first = llm.complete(system_prompt="s", user_prompt="u", temperature=0.1)
+    second = llm.complete(system_prompt="s", user_prompt="u", temperature=0.1)
+    llm.complete(system_prompt="s", user_prompt="u", temperature=0.2)
+    assert first == second
+    assert inner.calls == 2
+    assert (llm.hits, llm.misses) == (1, 2)
+
+
+class CappedProvider(CountingProvider):
+    def __init__(self, model, max_tokens):
+        super().__init__()
+        self.settings = (model, max_tokens)
+
+    @property
+    def model(self):
+        return self.settings[0]
+
+    @property
+    def max_tokens(self):
+        return self.settings[1]
+
+
+def test_cache_key_uses_effective_max_tokens_and_model():
+    inner = CappedProvider("small", 1200)
+    llm = CachedProvider(inner)
+    key = llm.cache_key(system_prompt="s", user_prompt="u", temperature=0.1, max_tokens=None)
+    assert key == llm.cache_key(system_prompt="s", user_prompt="u", temperature=0.1, max_tokens=1200)
+    inner.settings = ("small", 4000)
+    assert key != llm.cache_key(system_prompt="s", user_prompt="u", temperature=0.1, max_tokens=None)
+    inner.settings = ("large", 1200)
+    assert key != llm.cache_key(system_prompt="s", user_prompt="u", temperature=0.1, max_tokens=None)
+
+
+def test_memory_cache_lru_and_ttl():
+    cache = MemoryCompletionCache(max_entries=2, ttl=0.05)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    cache.get("a")
+    cache.set("c", "3")
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    time.sleep(0.06)
+    assert cache.get("a") is None
+
+
+def test_sqlite_cache_persists_and_caps_size(tmp_path):
+    path = tmp_path / "cache.sqlite3"
+    cache = SQLiteCompletionCache(path, max_entries=3, max_bytes=None)
+    for i in range(5):
+        cache.set(f"k{i}", f"v{i}")
+    assert len(cache) == 3
+    cache.close()
+
+    reopened = SQLiteCompletionCache(path, max_entries=3, max_bytes=None)
+    assert reopened.get("k4") == "v4"
+    assert reopened.get("k0") is None
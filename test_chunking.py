@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""Tests for map-reduce extraction of long resumes."""
+
+import asyncio
+import json
+import re
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from resume_ai.chunking import merge_extractions, split_into_chunks
+from resume_ai.pipeline import ResumeProcessor
+from resume_ai.prompt_library import estimate_tokens
+from resume_ai.providers.base import LLMProvider
+
+JOB_RE = re.compile(r"^(Engineer \d+), (Corp \d+)$", re.MULTILINE)
+
+
+def long_resume(jobs: int = 12, bullets: int = 8) -> str:
+    lines = ["Jane Doe", "jane@example.com | 555-000-1111", "", "Summary", "Backend engineer.", "", "Experience"]
+    for job in range(jobs):
+        lines.append(f"Engineer {job}, Corp {job}")
+        lines.extend(f"- Shipped feature {job}.{b} for a large number of customers" for b in range(bullets))
+        lines.append("")
+    lines += ["Education", "B.S. Computer Science, State University", "", "Skills", "Python, SQL, Go"]
+    return "\n".join(lines)
+
+
+class ChunkEchoProvider(LLMProvider):
+    """Extract only the jobs visible in each chunk; echo rewrite inputs back."""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.prompts: list[str] = []
+        self._lock = threading.Lock()
+
+    def complete(self, *, system_prompt, user_prompt, temperature=0.2, max_tokens=None):
+        time.sleep(self.latency)
+        with self._lock:
+            self.prompts.append(user_prompt)
+        marker = re.search(r"INPUT JSON:\s*(\{.*\})", user_prompt, re.DOTALL)
+        if marker:
+            return marker.group(1)
+        data = {
+            "contact": {"full_name": "Jane Doe"} if "Jane Doe" in user_prompt else {},
+            "experience": [
+                {"title": title, "company": company, "bullets": [f"Worked at {company}"]}
+                for title, company in JOB_RE.findall(user_prompt)
+            ],
+            "skills": ["Python", "SQL"] if "Skills" in user_prompt else ["python"],
+        }
+        return json.dumps(data)
+
+    async def acomplete(self, *, system_prompt, user_prompt, temperature=0.2, max_tokens=None):
+        await asyncio.sleep(self.latency)
+        return self.complete(system_prompt=system_prompt, user_prompt=user_prompt)
+
+
+def test_short_input_is_one_chunk():
+    text = "Jane Doe\n\nExperience\nEngineer 0, Corp 0\n- Did things"
+    assert split_into_chunks(text, 2000) == [text]
+
+
+def test_chunks_respect_budget_and_section_boundaries():
+    text = long_resume()
+    chunks = split_into_chunks(text, 200)
+    assert len(chunks) > 3
+    assert all(estimate_tokens(c) <= 200 for c in chunks)
+    assert chunks[0].startswith("Jane Doe")
+    # No job is cut away from its bullets, and split sections repeat their header
+    for chunk in chunks:
+        for title, _ in JOB_RE.findall(chunk):
+            number = title.split()[1]
+            assert f"- Shipped feature {number}.0 " in chunk
+        if JOB_RE.search(chunk):
+            assert "Experience" in chunk.splitlines()[:3] or chunk.startswith("Jane Doe")
+    assert sum(len(JOB_RE.findall(c)) for c in chunks) == 12
+
+
+def test_merge_dedupes_entries_and_lists():
+    merged = merge_extractions([
+        {"contact": {"full_name": "Jane Doe", "links": ["a"]}, "experience": [{"title": "Engineer", "company": "Acme", "bullets": ["One"]}], "skills": ["Python"]},
+        {"contact": {"full_name": "Other", "email": "j@x.io", "links": ["a", "b"]}, "summary": "Hi",
+         "experience": [{"title": "engineer", "company": "ACME", "location": "Remote", "bullets": ["one", "Two"]}],
+         "education": [{"institution": "State", "degree": "BS"}], "skills": ["python", "Go"]},
+    ])
+    assert merged["contact"] == {"full_name": "Jane Doe", "links": ["a", "b"], "email": "j@x.io"}
+    assert merged["summary"] == "Hi"
+    assert merged["experience"] == [{"title": "Engineer", "company": "Acme", "bullets": ["One", "Two"], "location": "Remote"}]
+    assert merged["skills"] == ["Python", "Go"]
+
+
+def test_long_input_is_extracted_concurrently_and_merged():
+    provider = ChunkEchoProvider(latency=0.2)
+    processor = ResumeProcessor(provider, local_parse=False, chunk_tokens=200)
+    started = time.perf_counter()
+    data = processor.extract(long_resume())
+    elapsed = time.perf_counter() - started
+    extraction_calls = len(provider.prompts)
+    assert extraction_calls > 3
+    assert elapsed < 0.2 * extraction_calls / 2
+    assert [e["title"] for e in data["experience"]] == [f"Engineer {i}" for i in range(12)]
+    assert data["contact"]["full_name"] == "Jane Doe"
+    assert [s.lower() for s in data["skills"]] == ["python", "sql"]
+
+    resume = processor.process(long_resume())
+    assert len(resume.experience) == 12
+
+
+def test_async_long_input_matches_sync():
+    processor = ResumeProcessor(ChunkEchoProvider(), local_parse=False, chunk_tokens=200)
+    assert asyncio.run(processor.aextract(long_resume())) == processor.extract(long_resume())
+
+
+def test_chunking_disabled_makes_one_call():
+    provider = ChunkEchoProvider()
+    ResumeProcessor(provider, local_parse=False, chunk_tokens=None).extract(long_resume())
+    assert len(provider.prompts) == 1
+
+
+class CappedProvider(ChunkEchoProvider):
+    """Cuts every completion off at ``max_tokens``, as a real API would."""
+
+    def __init__(self, max_tokens: int):
+        super().__init__()
+        self.cap = max_tokens
+
+    @property
+    def max_tokens(self):
+        return self.cap
+
+    def complete(self, *, system_prompt, user_prompt, temperature=0.2, max_tokens=None):
+        completion = super().complete(system_prompt=system_prompt, user_prompt=user_prompt)
+        return completion[: (max_tokens or self.cap) * 4]
+
+
+def test_chunk_size_follows_provider_max_tokens(caplog):
+    # Well under the default chunk size, but its extraction overflows a 200-token completion
+    text = long_resume()
+    assert estimate_tokens(text) < 2000
+    provider = CappedProvider(max_tokens=200)
+    processor = ResumeProcessor(provider, local_parse=False)
+    assert processor.chunk_tokens == 66
+    with caplog.at_level("WARNING", logger="resume_ai.json_extract"):
+        data = processor.extract(text)
+    assert len(provider.prompts) > 1 and not caplog.records
+    assert [e["title"] for e in data["experience"]] == [f"Engineer {i}" for i in range(12)]
+
+    # One unchunked call loses the jobs past the cut-off, and says so
+    with caplog.at_level("WARNING", logger="resume_ai.json_extract"):
+        truncated = ResumeProcessor(CappedProvider(max_tokens=200), local_parse=False, chunk_tokens=None).extract(text)
+    assert len(truncated["experience"]) < 12
+    assert "cut off" in caplog.text
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""Tests for CLI cold-start import cost."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+# Add src to path
+SRC = Path(__file__).parent / "src"
+sys.path.insert(0, str(SRC))
+
+# Loaded only once a provider or renderer is actually used
+HEAVY_MODULES = {"openai", "httpx", "weasyprint", "docx", "jinja2", "numpy"}
+# Generous ceiling for cumulative import time of the CLI module; catches regressions, not noise
+IMPORT_BUDGET_US = int(os.getenv("RESUME_AI_IMPORT_BUDGET_US", "1500000"))
+
+
+def _importtime(*args):
+    env = dict(os.environ, PYTHONPATH=str(SRC))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *args], capture_output=True, text=True, env=env, check=True
+    )
+    modules = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def test_cli_help_does_not_import_heavy_dependencies():
+    modules = _importtime("-m", "resume_ai.cli", "--help")
+    assert not {name.split(".")[0] for name in modules} & HEAVY_MODULES
+
+
+def test_cli_cold_import_within_budget():
+    modules = _importtime("-c", "import resume_ai.cli")
+    assert modules["resume_ai.cli"] < IMPORT_BUDGET_US
+
+
+def test_registry_resolves_builtins_lazily():
+    from resume_ai.plugins import get_renderer, providers, renderers
+
+    assert {"openai", "groq"} <= set(providers.names())
+    assert {"pdf", "docx"} <= set(renderers.names())
+    assert type(get_renderer("docx")).__name__ == "DocxRenderer"
+    try:
+        get_renderer("odt")
+    except ValueError as e:
+        assert "odt" in str(e)
+    else:
+        raise AssertionError("unknown format should raise ValueError")
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Tests for stage timing, token usage and retry reporting."""
+
+import asyncio
+import io
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from resume_ai import instrumentation
+from resume_ai.cache import MemoryCompletionCache
+from resume_ai.instrumentation import BuildRecorder, PrometheusExporter, instrument, profiled, record_usage
+from resume_ai.pipeline import ResumeProcessor
+from resume_ai.providers.base import LLMProvider
+from resume_ai.providers.cached_provider import CachedProvider
+from resume_ai.providers.resilient_provider import ResilientProvider, RetryPolicy
+
+RESUME_JSON = json.dumps({
+    "contact": {"full_name": "Jane Doe", "email": "jane@example.com"},
+    "summary": "Engineer",
+    "experience": [{"title": "Engineer", "company": "Acme", "bullets": ["Built APIs"]}],
+})
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+
+class UsageProvider(LLMProvider):
+    name = "usage"
+
+    def __init__(self, failures=0):
+        self.failures = failures
+
+    def complete(self, *, system_prompt, user_prompt, temperature=0.2, max_tokens=None):
+        if self.failures:
+            self.failures -= 1
+            raise RateLimitError("slow down")
+        record_usage(SimpleNamespace(prompt_tokens=120, completion_tokens=80))
+        return RESUME_JSON
+
+
+def test_build_report_records_stages_usage_and_retries():
+    llm = ResilientProvider([UsageProvider(failures=1)], retry=RetryPolicy(max_retries=2, base_delay=0.0))
+    processor = ResumeProcessor(llm)
+    resume, report = processor.build_with_report("Jane Doe\nEngineer at Acme, built APIs")
+
+    assert resume.contact.full_name == "Jane Doe"
+    stages = report.stage_seconds()
+    assert {"build", "rewrite", "validate"} <= set(stages)
+    assert all(seconds >= 0 for seconds in stages.values())
+    assert report.calls and all(c.provider == "usage" for c in report.calls)
+    assert report.prompt_tokens == 120 * len(report.calls)
+    assert not any(c.estimated_tokens for c in report.calls)
+    assert report.retries == 1
+    assert json.loads(json.dumps(report.to_dict()))["llm_calls"] == len(report.calls)
+
+
+def test_cache_hits_and_async_calls_reach_prometheus_exporter():
+    llm = CachedProvider(UsageProvider(), MemoryCompletionCache())
+    processor = ResumeProcessor(llm)
+    exporter = PrometheusExporter()
+    recorder = BuildRecorder()
+    with instrument(exporter, recorder):
+        processor.process(RESUME_JSON)
+        asyncio.run(processor.aprocess(RESUME_JSON))
+
+    assert [c.cached for c in recorder.report.calls] == [False, True]
+    text = exporter.render()
+    assert 'resume_ai_llm_calls_total{provider="usage",model=""} 2' in text
+    assert 'resume_ai_llm_cache_hits_total{provider="usage",model=""} 1' in text
+    assert 'resume_ai_llm_tokens_total{provider="usage",model="",kind="completion"} 80' in text
+    assert "# TYPE resume_ai_stage_seconds_total counter" in text
+
+
+class ObservedProvider(UsageProvider):
+    """Notes, per call, whether instrumentation opened a call record and stage for it."""
+
+    def __init__(self):
+        super().__init__()
+        self.observed = []
+
+    def complete(self, **kwargs):
+        self.observed.append((instrumentation._active_call.get() is not None, bool(instrumentation._stage_stack.get())))
+        return super().complete(**kwargs)
+
+
+def test_no_sinks_records_nothing_and_profiler_reports():
+    provider = ObservedProvider()
+    processor = ResumeProcessor(provider)
+    out = io.StringIO()
+    with profiled(out, top=5):
+        processor.process(RESUME_JSON)
+    # Without a sink, calls and stages skip their records entirely
+    assert provider.observed == [(False, False)]
+    assert "cProfile" in out.getvalue() and "tracemalloc" in out.getvalue()
+
+    recorder = BuildRecorder()
+    with instrument(recorder):
+        processor.process(RESUME_JSON)
+    assert provider.observed[1:] == [(True, True)]
+    assert len(recorder.report.calls) == 1
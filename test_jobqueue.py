@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""Tests for the durable SQLite job queue."""
+
+import json
+import re
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from resume_ai.jobqueue import JobQueue, LeaseLost, _Heartbeat, run_queue, run_worker
+from resume_ai.pipeline import EXTRACTION_SYSTEM_PROMPT, ResumeProcessor
+from resume_ai.providers.base import LLMProvider
+
+
+class StagedProvider(LLMProvider):
+    """Extracts a fixed resume; echoes rewrite input back, or fails the rewrite on demand."""
+
+    def __init__(self, fail_rewrite: bool = False):
+        self.fail_rewrite = fail_rewrite
+        self.calls = {"extract": 0, "rewrite": 0}
+
+    def complete(self, *, system_prompt, user_prompt, temperature=0.2, max_tokens=None):
+        if system_prompt == EXTRACTION_SYSTEM_PROMPT:
+            self.calls["extract"] += 1
+            name = re.search(r"Candidate \d+", user_prompt).group()
+            return json.dumps({"contact": {"full_name": name}, "skills": ["Python"]})
+        self.calls["rewrite"] += 1
+        if self.fail_rewrite:
+            raise RuntimeError("rate limited")
+        return user_prompt[user_prompt.index("{"):user_prompt.rindex("}") + 1]
+
+
+def make_processor(provider=None):
+    return ResumeProcessor(provider or StagedProvider(), local_parse=False)
+
+
+def inputs(tmp_path, count=2):
+    folder = tmp_path / "in"
+    folder.mkdir(exist_ok=True)
+    paths = []
+    for i in range(count):
+        path = folder / f"candidate{i}.txt"
+        path.write_text(f"Resume text\nCandidate {i}", encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def test_rerun_skips_finished_stages(tmp_path):
+    db, out = tmp_path / "jobs.sqlite3", tmp_path / "out"
+    queue = JobQueue(db, max_attempts=1)
+    keys = queue.enqueue(inputs(tmp_path))
+
+    flaky = StagedProvider(fail_rewrite=True)
+    assert run_worker(db, lambda: make_processor(flaky), output_dir=out, formats=["docx"], max_attempts=1) == 0
+    assert flaky.calls == {"extract": 2, "rewrite": 2}
+    failed = queue.jobs(keys)
+    assert [(j.state, j.stage) for j in failed] == [("failed", "extracted")] * 2
+    assert failed[0].error == "rewrite: rate limited" and failed[0].extracted["contact"]["full_name"] == "Candidate 0"
+
+    # Re-enqueueing the same files reuses the jobs; only the rewrite and render run again
+    assert queue.enqueue(inputs(tmp_path)) == keys
+    healthy = StagedProvider()
+    assert run_worker(db, lambda: make_processor(healthy), output_dir=out, formats=["docx"]) == 2
+    assert healthy.calls == {"extract": 0, "rewrite": 2}
+    done = queue.jobs(keys)
+    assert [(j.state, j.stage) for j in done] == [("done", "rendered")] * 2
+    assert Path(done[1].outputs["docx"]).exists()
+    assert json.loads((out / "candidate1.json").read_text())["contact"]["full_name"] == "Candidate 1"
+
+    # Finished jobs are never redone
+    again = StagedProvider()
+    queue.enqueue(inputs(tmp_path))
+    assert run_worker(db, lambda: make_processor(again), output_dir=out, formats=["docx"]) == 0
+    assert again.calls == {"extract": 0, "rewrite": 0}
+    assert queue.counts() == {"pending": 0, "leased": 0, "done": 2, "failed": 0}
+
+
+def test_leases_are_exclusive_and_expire(tmp_path):
+    queue = JobQueue(tmp_path / "jobs.sqlite3", lease_seconds=0.2, max_attempts=2)
+    [key] = queue.enqueue([("a.txt", "text")])
+    job = queue.lease("w1")
+    assert job.key == key and job.attempts == 1
+    assert queue.lease("w2") is None
+    assert queue.heartbeat(key, "w1") and not queue.heartbeat(key, "w2")
+
+    time.sleep(0.3)
+    taken = queue.lease("w2")
+    assert taken.key == key and taken.attempts == 2
+    assert not queue.heartbeat(key, "w1")
+    with pytest.raises(LeaseLost):
+        queue.save_extracted(key, "w1", {})
+
+    # A job whose worker keeps dying is failed once its attempts run out
+    time.sleep(0.3)
+    assert queue.lease("w3") is None
+    assert queue.get(key).state == "failed" and "lease expired" in queue.get(key).error
+
+
+def test_worker_processes_drain_the_queue(tmp_path):
+    db, out = tmp_path / "jobs.sqlite3", tmp_path / "out"
+    queue = JobQueue(db)
+    keys = queue.enqueue(inputs(tmp_path, count=6))
+    counts = run_queue(db, make_processor, output_dir=out, formats=["docx"], processes=3)
+    assert counts == {"pending": 0, "leased": 0, "done": 6, "failed": 0}
+    assert all(job.attempts == 1 for job in queue.jobs(keys))
+    assert sorted(p.name for p in out.glob("*.docx")) == [f"candidate{i}.docx" for i in range(6)]
+
+
+def test_failed_jobs_back_off_before_retrying(tmp_path):
+    queue = JobQueue(tmp_path / "jobs.sqlite3", max_attempts=3, retry_backoff=0.2)
+    [key] = queue.enqueue([("a.txt", "text")])
+    assert queue.fail(key, queue.lease("w1").worker, "extract: rate limited")
+    assert queue.lease("w1") is None
+    assert 0.1 < queue.next_retry() - time.time() <= 0.2
+
+    time.sleep(0.25)
+    job = queue.lease("w1")
+    assert job.key == key and job.attempts == 2
+    # The second retry waits twice as long
+    queue.fail(key, "w1", "extract: rate limited")
+    assert 0.3 < queue.next_retry() - time.time() <= 0.4
+
+
+def test_worker_waits_out_the_backoff(tmp_path):
+    db, out = tmp_path / "jobs.sqlite3", tmp_path / "out"
+    JobQueue(db).enqueue(inputs(tmp_path, count=1))
+    provider = StagedProvider(fail_rewrite=True)
+    original = provider.complete
+
+    def recovering(**kwargs):
+        # Fails the first rewrite only
+        provider.fail_rewrite = provider.calls["rewrite"] == 0
+        return original(**kwargs)
+
+    provider.complete = recovering
+    started = time.perf_counter()
+    assert run_worker(db, lambda: make_processor(provider), output_dir=out, formats=["docx"], retry_backoff=0.2) == 1
+    assert time.perf_counter() - started >= 0.2
+    assert provider.calls == {"extract": 1, "rewrite": 2}
+
+
+def test_heartbeat_database_errors_mark_the_lease_lost(tmp_path, caplog):
+    queue = JobQueue(tmp_path / "jobs.sqlite3")
+    queue.enqueue([("a.txt", "text")])
+    job = queue.lease("w1")
+
+    def locked(key, worker):
+        raise sqlite3.OperationalError("database is locked")
+
+    queue.heartbeat = locked
+    with caplog.at_level("WARNING", logger="resume_ai.jobqueue"):
+        with _Heartbeat(queue, job, 0.01) as heartbeat:
+            time.sleep(0.05)
+    assert heartbeat.lost and "database is locked" in caplog.text
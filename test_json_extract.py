@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""Tests for locating and repairing JSON in LLM completions."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from resume_ai.json_extract import JSONExtractionError, find_json_object, parse_json_object
+
+
+@pytest.mark.parametrize(
+    "completion, expected",
+    [
+        ('```json\n{"skills": ["Go"]}\n```\nLet me know if you need {anything} else.', {"skills": ["Go"]}),
+        ('{"skills": ["Go", "Rust",],}', {"skills": ["Go", "Rust"]}),
+        ('{"summary": “Ships fast”}', {"summary": "Ships fast"}),
+        ('{"summary": "Line one\nline two"}', {"summary": "Line one\nline two"}),
+        ('{"current": True, "gpa": None}', {"current": True, "gpa": None}),
+        ('{"skills": ["Go", "Ru', {"skills": ["Go", "Ru"]}),
+        ('{"experience": [{"title": "Dev", "bullets": ["Built', {"experience": [{"title": "Dev", "bullets": ["Built"]}]}),
+        ('{"summary": "ok", "skills":', {"summary": "ok", "skills": None}),
+    ],
+)
+def test_parse_and_repair(completion, expected):
+    assert parse_json_object(completion) == expected
+
+
+def test_first_balanced_object_wins():
+    text = 'prefix {"a": "}"} and later {"b": 2}'
+    start, end, complete = find_json_object(text)
+    assert complete and text[start:end] == '{"a": "}"}'
+
+
+def test_unrepairable_section_is_reported_alone():
+    with pytest.raises(JSONExtractionError) as info:
+        parse_json_object('{"summary": "ok", "experience": [{"title": "x" "company": "y"}], "skills": ["a"]}')
+    assert info.value.partial == {"summary": "ok", "skills": ["a"]}
+    assert list(info.value.broken) == ["experience"]
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""Tests for the rule-based plain-text extractor."""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from resume_ai.local_parser import LocalExtractor, normalize_date
+from resume_ai.models import Resume
+
+SAMPLE = (Path(__file__).parent / "samples" / "sample_plain.txt").read_text(encoding="utf-8")
+
+
+def test_structured_sample_parses_with_full_confidence():
+    result = LocalExtractor().extract(SAMPLE)
+    assert result.structured
+    assert result.low_confidence(0.8) == []
+    resume = Resume.model_validate(result.data)
+    assert resume.contact.full_name == "John Doe"
+    assert resume.contact.email == "john@example.com"
+    assert resume.contact.location == "Anytown, USA"
+    job = resume.experience[0]
+    assert (job.title, job.company, job.start_date, job.end_date) == ("Intern", "Acme Corp", "2024-06-01", "2024-08-01")
+    assert len(job.bullets) == 2
+    assert resume.education[0].institution == "State University"
+    assert resume.skills == ["Python", "FastAPI", "React", "SQL", "Git", "Docker"]
+
+
+def test_prose_entries_are_flagged_for_llm_fallback():
+    text = "Jane Roe\njane@example.com\n\nExperience:\n- Dev at Foo (2020-2022): built things, shipped features\n\nSkills:\nGo, Rust"
+    result = LocalExtractor().extract(text)
+    assert result.low_confidence(0.8) == ["experience"]
+    assert "Dev at Foo" in result.text_for(["experience"])
+
+
+def test_unstructured_text_is_not_handled_locally():
+    assert not LocalExtractor().extract("I worked at a bakery and then learned Python.").structured
+
+
+def test_normalize_date():
+    assert normalize_date("Sept 2021") == "2021-09-01"
+    assert normalize_date("03/2020") == "2020-03-01"
+    assert normalize_date("Present") is None
+    assert normalize_date("2019") == "2019"
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Tests for local job-description matching."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from resume_ai import matching
+from resume_ai.matching import JobIndex, ResumeIndex, extract_terms, score, score_many
+from resume_ai.models import Resume
+
+RESUME = Resume.model_validate({
+    "contact": {"full_name": "Ann"},
+    "experience": [{
+        "title": "Backend Engineer",
+        "company": "Acme",
+        "bullets": [
+            "Organized the office holiday party",
+            "Built Python microservices on PostgreSQL serving machine learning models",
+            "Cut Kubernetes deploy times by 40%",
+        ],
+        "technologies": ["Python", "PostgreSQL"],
+    }],
+    "projects": [{"name": "Tool", "bullets": ["Wrote a node.js CLI"], "stack": ["Node.js"]}],
+    "skills": ["Python", "Machine Learning", "Kubernetes"],
+})
+
+JOBS = {
+    "backend": "Backend engineer with strong Python and PostgreSQL. Kubernetes a plus. Machine learning experience.",
+    "frontend": "Frontend developer: React, TypeScript, CSS. Figma familiarity preferred.",
+    "data": "Data engineer building Spark and Airflow pipelines in Scala. Python nice to have.",
+}
+
+
+def test_terms_keep_tech_tokens_and_bigrams():
+    terms = extract_terms("Experience with Node.js, C++ and machine learning")
+    assert {"node.js", "c++", "machine", "learning", "machine learning"} <= set(terms)
+    assert "experience" not in terms and "with" not in terms
+
+
+def test_ranks_postings_and_reports_keywords():
+    matches = score(RESUME, JOBS)
+    assert [m.job_id for m in matches][0] == "backend"
+    assert matches[-1].job_id == "frontend" and matches[-1].score == 0.0
+
+    backend = next(m for m in matches if m.job_id == "backend")
+    assert {"python", "postgresql", "kubernetes", "machine learning"} <= set(backend.matched)
+    assert "python" not in backend.missing
+    assert 0 < backend.coverage < 1
+    frontend = next(m for m in matches if m.job_id == "frontend")
+    assert frontend.coverage == 0.0 and "react" in frontend.missing
+
+
+def test_bullets_are_ordered_by_relevance():
+    [backend, _, _] = score_many([RESUME], JOBS)[0]
+    assert backend.bullet_order[0].text.startswith("Built Python microservices")
+    assert backend.bullet_order[-1].text in ("Organized the office holiday party", "Wrote a node.js CLI")
+    assert {(b.section, b.entry, b.index) for b in backend.bullet_order} == {
+        ("experience", 0, 0), ("experience", 0, 1), ("experience", 0, 2), ("projects", 0, 0),
+    }
+
+
+def test_indexes_are_reusable_across_batches():
+    index, jobs = ResumeIndex(RESUME), JobIndex(list(JOBS.values()))
+    first = score_many([index, RESUME], jobs)
+    assert [m.job_id for m in first[0]] == [0, 1, 2]
+    assert first[0] == first[1] == score_many([RESUME], list(JOBS.values()))[0]
+
+
+def test_empty_resume_scores_zero():
+    [match] = score(Resume.model_validate({"contact": {}}), ["Python developer"])
+    assert match.score == 0.0 and match.coverage == 0.0 and match.bullet_order == []
+
+
+def test_numpy_and_python_paths_agree():
+    pytest.importorskip("numpy")
+    other = Resume.model_validate({"contact": {}, "skills": ["React", "CSS"], "experience": [{"bullets": ["Built React apps"]}]})
+    fast = score_many([RESUME, other], JOBS, use_numpy=True)
+    slow = score_many([RESUME, other], JOBS, use_numpy=False)
+    for a, b in zip(sum(fast, []), sum(slow, [])):
+        assert (a.job_id, a.matched, a.missing) == (b.job_id, b.matched, b.missing)
+        assert a.score == pytest.approx(b.score) and a.coverage == pytest.approx(b.coverage)
+
+
+def test_forcing_numpy_without_it_raises(monkeypatch):
+    monkeypatch.setattr(matching, "np", None)
+    with pytest.raises(ImportError):
+        score_many([RESUME], JOBS, use_numpy=True)
+    assert score_many([RESUME], JOBS) == score_many([RESUME], JOBS, use_numpy=False)
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""Tests for the schema-driven resume JSON normalizer."""
+
+import json
+import random
+import re
+import sys
+from pathlib import Path
+from typing import Any, Optional
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from resume_ai.normalize import normalize_many, normalize_resume
+
+SAMPLE = json.loads((Path(__file__).parent / "samples" / "sample_structured.json").read_text(encoding="utf-8"))
+
+
+def legacy_normalize(data):
+    """The hand-written normalizer normalize_resume replaced, kept as the reference."""
+    defaults = {
+        "contact": {"full_name": None, "email": None, "phone": None, "location": None, "links": []},
+        "summary": None,
+        "experience": [],
+        "projects": [],
+        "education": [],
+        "skills": [],
+        "certifications": [],
+        "achievements": [],
+        "extracurricular": [],
+        "languages": [],
+        "interests": [],
+    }
+
+    def sentence_bullets(text: str) -> list[str]:
+        # Split by sentence-ish boundaries and remove empties
+        parts = re.split(r"(?<=[.!?])\s+", text.strip())
+        return [p.strip() for p in parts if p.strip()]
+
+    normalized = defaults.copy()
+
+    # Contact
+    contact = data.get("contact", {}) if isinstance(data, dict) else {}
+    contact_links = contact.get("links", []) or []
+
+    # Handle links as dict (convert to list of values) or list
+    if isinstance(contact_links, dict):
+        contact_links = list(contact_links.values())
+    elif not isinstance(contact_links, list):
+        contact_links = []
+
+    normalized_links = []
+    for link in contact_links:
+        if isinstance(link, dict):
+            val = link.get("value") or link.get("url") or link.get("link") or link.get("href")
+            if val:
+                normalized_links.append(str(val))
+        elif isinstance(link, str):
+            if link.strip():
+                normalized_links.append(link.strip())
+        else:
+            # fallback to string cast
+            normalized_links.append(str(link))
+    contact_links = normalized_links
+
+    normalized["contact"] = {
+        "full_name": contact.get("full_name") or contact.get("name"),
+        "email": contact.get("email"),
+        "phone": contact.get("phone"),
+        "location": contact.get("location"),
+        "links": contact_links,
+    }
+
+    def as_str(val: Any) -> Optional[str]:
+        if val is None:
+            return None
+        return str(val)
+
+    # Experience
+    exp_list = []
+    experiences = data.get("experience", []) if isinstance(data, dict) else []
+    if not isinstance(experiences, list):
+        experiences = []
+
+    for exp in experiences:
+        if not isinstance(exp, dict):
+            continue
+        description = exp.get("description") or ""
+        bullets = exp.get("bullets") or sentence_bullets(description) if description else []
+        bullets = [b for b in bullets if isinstance(b, str) and b.strip()]
+
+        exp_list.append({
+            "title": exp.get("title") or exp.get("job_title"),
+            "company": exp.get("company"),
+            "location": exp.get("location"),
+            "start_date": as_str(exp.get("start_date")),
+            "end_date": as_str(exp.get("end_date")),
+            "current": exp.get("current", False) is True,
+            "bullets": bullets,
+            "technologies": [t for t in (exp.get("technologies", []) or []) if isinstance(t, str) and t.strip()],
+            "employment_type": exp.get("employment_type"),
+        })
+    normalized["experience"] = exp_list
+
+    # Education
+    edu_list = []
+    for edu in data.get("education", []) if isinstance(data, dict) else []:
+        end_date = edu.get("end_date") or edu.get("graduation_year")
+        end_date = as_str(end_date)
+        edu_list.append({
+            "institution": edu.get("institution"),
+            "degree": edu.get("degree"),
+            "field": edu.get("field"),
+            "start_date": as_str(edu.get("start_date")),
+            "end_date": end_date,
+            "gpa": edu.get("gpa"),
+        })
+    normalized["education"] = edu_list
+
+    # Projects
+    proj_list = []
+    projects = data.get("projects", []) if isinstance(data, dict) else []
+    if not isinstance(projects, list):
+        projects = []
+
+    for proj in projects:
+        if not isinstance(proj, dict):
+            continue
+        description = proj.get("description") or ""
+        bullets = proj.get("bullets") or sentence_bullets(description) if description else []
+        bullets = [b for b in bullets if isinstance(b, str) and b.strip()]
+
+        proj_list.append({
+            "name": proj.get("name"),
+            "role": proj.get("role"),
+            "bullets": bullets,
+            "stack": [s for s in (proj.get("stack", []) or []) if isinstance(s, str) and s.strip()],
+            "link": proj.get("link"),
+            "outcome": proj.get("outcome"),
+        })
+    normalized["projects"] = proj_list
+
+    normalized["skills"] = [s for s in (data.get("skills", []) if isinstance(data, dict) else []) if isinstance(s, str) and s.strip()]
+    normalized["certifications"] = [c for c in (data.get("certifications", []) if isinstance(data, dict) else []) if isinstance(c, dict)]
+    normalized["achievements"] = [a for a in (data.get("achievements", []) if isinstance(data, dict) else []) if isinstance(a, str) and a.strip()]
+    normalized["extracurricular"] = [e for e in (data.get("extracurricular", []) if isinstance(data, dict) else []) if isinstance(e, str) and e.strip()]
+    if not normalized["extracurricular"] and isinstance(data, dict):
+        alt_vol = data.get("volunteering") or data.get("volunteer") or []
+        if isinstance(alt_vol, list):
+            normalized["extracurricular"] = [v for v in alt_vol if isinstance(v, str) and v.strip()]
+    normalized["languages"] = [lang for lang in (data.get("languages", []) if isinstance(data, dict) else []) if isinstance(lang, str) and lang.strip()]
+    normalized["interests"] = [i for i in (data.get("interests", []) if isinstance(data, dict) else []) if isinstance(i, str) and i.strip()]
+
+    return normalized
+
+
+QUIRKY = [
+    {},
+    [],
+    "not a resume",
+    {"summary": "Dropped on the floor", "contact": {"name": "Ann", "links": {"gh": "github.com/ann", "x": None}}},
+    {"contact": {"full_name": "", "name": "Fallback", "links": [{"url": "a"}, {"href": ""}, "  b  ", "", 7, None]}},
+    {"contact": {"links": "not-a-list"}},
+    {"experience": [{"job_title": "Dev", "bullets": ["kept?"]}, "junk", {"description": "One. Two!  Three?", "current": "yes"}]},
+    {"experience": [{"description": "Has text", "bullets": "abc", "technologies": "Go", "start_date": 2020}]},
+    {"experience": {"not": "a list"}, "projects": "nope"},
+    {"projects": [{"name": "P", "description": "x", "bullets": [" ", "ok", 3], "stack": None}]},
+    {"education": [{"graduation_year": 2019, "gpa": 3.9}, {"end_date": "", "graduation_year": None}]},
+    {"skills": ["Python", " ", 3, "SQL"], "certifications": [{"name": "AWS"}, "CKA"], "achievements": ("a", "")},
+    {"extracurricular": [], "volunteering": ["Food bank", ""], "volunteer": ["ignored"]},
+    {"extracurricular": [" "], "volunteer": "not a list"},
+    {"languages": "EN", "interests": {"chess": 1}},
+]
+
+BROKEN = [
+    {"contact": None},
+    {"contact": "ann@example.com"},
+    {"education": None},
+    {"education": ["MIT"]},
+    {"skills": None},
+    {"experience": [{"description": ["not", "text"]}]},
+]
+
+
+def _random_record(rng: random.Random) -> dict:
+    record = json.loads(json.dumps(SAMPLE))
+    for exp in record.get("experience", []):
+        if rng.random() < 0.5:
+            exp["description"] = " ".join(exp.pop("bullets", []))
+        if rng.random() < 0.3:
+            exp["job_title"] = exp.pop("title", None)
+        exp["current"] = rng.choice([True, False, "true", None])
+    if rng.random() < 0.3:
+        record["volunteering"] = record.pop("extracurricular", []) + [""]
+    if rng.random() < 0.3:
+        record["contact"]["links"] = {"site": "example.com", "gh": {"url": "github.com/x"}}
+    return record
+
+
+@pytest.mark.parametrize("data", [SAMPLE, *QUIRKY])
+def test_matches_hand_written_normalizer(data):
+    assert normalize_resume(data) == legacy_normalize(data)
+
+
+@pytest.mark.parametrize("data", BROKEN)
+def test_fails_the_same_way_on_malformed_input(data):
+    with pytest.raises(Exception) as legacy:
+        legacy_normalize(data)
+    with pytest.raises(type(legacy.value)):
+        normalize_resume(data)
+
+
+def test_bulk_matches_record_by_record():
+    rng = random.Random(7)
+    records = [_random_record(rng) for _ in range(200)]
+    assert list(normalize_many(iter(records))) == [legacy_normalize(r) for r in records]
+
+
+def test_outputs_are_independent():
+    first, second = normalize_resume({}), normalize_resume({})
+    first["skills"].append("x")
+    first["contact"]["links"].append("y")
+    assert second["skills"] == [] and second["contact"]["links"] == []
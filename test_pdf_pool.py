@@ -0,0 +1,38 @@
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from resume_ai.renderers.pdf_pool import PDFRenderPool
+
+
+def _fake_render(resume_json: str, template_name: str) -> bytes:
+    if template_name == "slow":
+        time.sleep(30)
+    if template_name == "broken":
+        raise ValueError("bad template")
+    return f"%PDF {template_name} {resume_json}".encode()
+
+
+RESUME = {"contact": {"full_name": "Jane Doe"}}
+
+
+def test_pool_renders_in_workers_and_writes_files(tmp_path):
+    with PDFRenderPool(2, render_fn=_fake_render, warm=None) as pool:
+        futures = [pool.submit(RESUME, "minimal") for _ in range(6)]
+        assert all(f.result(timeout=30).startswith(b"%PDF minimal") for f in futures)
+        out = pool.render(RESUME, template_name="corporate", output_path=tmp_path / "nested" / "r.pdf")
+    assert out.read_bytes().startswith(b"%PDF corporate")
+    assert b"Jane Doe" in out.read_bytes()
+
+
+def test_pool_timeout_replaces_only_the_stuck_worker():
+    with PDFRenderPool(1, timeout=1.0, render_fn=_fake_render, warm=None) as pool:
+        with pytest.raises(TimeoutError):
+            pool.render_bytes(RESUME, "slow")
+        with pytest.raises(ValueError, match="bad template"):
+            pool.render_bytes(RESUME, "broken")
+        assert pool.render_bytes(RESUME, "minimal").startswith(b"%PDF")
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Quick test to validate the resume pipeline."""
 
+import asyncio
 import sys
 import json
 from pathlib import Path
@@ -9,7 +10,8 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from resume_ai.models import Resume
-from resume_ai.providers.openai_provider import OpenAIProvider
+from resume_ai.providers.base import AsyncLLMProvider
+from resume_ai.providers.openai_provider import AsyncClientPool, OpenAIProvider
 from resume_ai.config import OpenAISettings
 from resume_ai.pipeline import ResumeProcessor
 
@@ -65,6 +67,50 @@ def test_pipeline():
         return False
 
 
+class FakeClient:
+    def __init__(self, http_client):
+        self.http_client = http_client
+
+    async def close(self):
+        await self.http_client.aclose()
+
+    @property
+    def is_closed(self):
+        return self.http_client.is_closed
+
+
+class PooledEchoProvider(AsyncLLMProvider):
+    """Opens a pooled client on whichever loop runs it, then echoes the prompt."""
+
+    def __init__(self):
+        self.async_clients = AsyncClientPool(FakeClient)
+        self.opened = []
+
+    async def acomplete(self, *, system_prompt, user_prompt, temperature=0.2, max_tokens=None):
+        self.opened.append(self.async_clients.get())
+        return user_prompt
+
+    async def aclose(self):
+        await self.async_clients.aclose()
+
+
+def test_async_clients_close_with_their_loop():
+    provider = PooledEchoProvider()
+    # complete() runs its own loop and closes that loop's client before returning
+    assert provider.complete(system_prompt="s", user_prompt="u") == "u"
+    assert provider.complete(system_prompt="s", user_prompt="v") == "v"
+    assert [client.is_closed for client in provider.opened] == [True, True]
+
+    openai = OpenAIProvider(OpenAISettings(api_key="test"))
+
+    async def main():
+        client = openai.async_clients.get()
+        await ResumeProcessor(openai).aclose()
+        return client
+
+    assert asyncio.run(main()).is_closed()
+
+
 if __name__ == "__main__":
     success = test_pipeline()
     sys.exit(0 if success else 1)
@@ -0,0 +1,56 @@
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from resume_ai.models import Resume
+from resume_ai.prompt_library import (
+    COMPACT_RESUME_SCHEMA,
+    RESUME_SCHEMA,
+    compact_json,
+    compact_text,
+    extraction_prompt,
+    prompt_token_report,
+    restore_defaults,
+)
+
+SAMPLE = json.loads((Path(__file__).parent / "samples" / "sample_structured.json").read_text(encoding="utf-8"))
+
+
+def test_compaction_round_trips_through_resume_defaults():
+    data = {
+        "contact": {"full_name": "Jane Doe", "email": None, "links": []},
+        "summary": "",
+        "experience": [{"title": "Engineer", "company": "Acme", "current": False, "bullets": ["Built APIs"], "technologies": ["Python", "python", "SQL"]}],
+        "skills": ["Python", "SQL", "Python "],
+        "certifications": [],
+    }
+    compact = compact_json(data)
+    assert " " not in compact.replace("Jane Doe", "").replace("Built APIs", "")
+    parsed = json.loads(compact)
+    assert parsed["skills"] == ["Python", "SQL"]
+    assert parsed["experience"][0]["technologies"] == ["Python", "SQL"]
+    assert "current" not in parsed["experience"][0] and "summary" not in parsed
+
+    restored = restore_defaults(parsed)
+    assert restored["experience"][0]["current"] is False
+    assert restored["experience"][0]["location"] is None
+    assert restored["contact"]["links"] == [] and restored["certifications"] == []
+    assert Resume.model_validate(restored).experience[0].company == "Acme"
+
+
+def test_full_sample_is_lossless_and_smaller():
+    restored = Resume.model_validate(restore_defaults(json.loads(compact_json(SAMPLE))))
+    assert restored == Resume.model_validate(SAMPLE)
+    report = prompt_token_report(SAMPLE, "Jane   Smith\n\n\n\nEngineer  ")
+    assert report["rewrite_compact"] < report["rewrite_verbose"]
+    assert report["extraction_compact"] < report["extraction_verbose"]
+
+
+def test_compact_extraction_prompt():
+    assert json.loads(COMPACT_RESUME_SCHEMA).keys() == json.loads(RESUME_SCHEMA).keys()
+    assert "or null" not in COMPACT_RESUME_SCHEMA
+    assert compact_text("  Jane   Smith \n\n\n\n Engineer\t\tat Acme ") == "Jane Smith\n\nEngineer at Acme"
+    assert RESUME_SCHEMA in extraction_prompt("x", compact=False)
+    assert COMPACT_RESUME_SCHEMA in extraction_prompt("x")
@@ -0,0 +1,26 @@
+import io
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from resume_ai.pipeline import MEDIA_TYPES, render_resume, render_resume_bytes
+
+RESUME = {
+    "contact": {"full_name": "Jane Doe"},
+    "summary": "Backend engineer",
+    "experience": [{"title": "Engineer", "company": "Acme", "bullets": ["Built APIs"]}],
+}
+
+
+def test_docx_renders_to_bytes_and_streams(tmp_path):
+    data = render_resume_bytes(RESUME, "docx")
+    assert data[:2] == b"PK"  # DOCX is a zip container
+
+    stream = io.BytesIO()
+    assert render_resume(RESUME, "docx", stream) is stream
+    assert stream.getvalue()[:2] == b"PK"
+
+    written = render_resume(RESUME, "docx", str(tmp_path / "out" / "r.docx"))
+    assert written == tmp_path / "out" / "r.docx" and written.read_bytes()[:2] == b"PK"
+    assert "docx" in MEDIA_TYPES and "pdf" in MEDIA_TYPES
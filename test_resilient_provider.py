@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Tests for retry, rate limiting and failover across providers."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from resume_ai.config import RateLimits
+from resume_ai.providers.base import LLMProvider
+from resume_ai.providers.resilient_provider import ResilientProvider, RetryPolicy, TokenBucket
+
+
+class StatusError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+class FlakyProvider(LLMProvider):
+    def __init__(self, name, failures):
+        self.name = name
+        self.failures = list(failures)
+        self.calls = 0
+
+    def complete(self, *, system_prompt, user_prompt, temperature=0.2, max_tokens=None):
+        self.calls += 1
+        if self.failures:
+            raise self.failures.pop(0)
+        return self.name
+
+
+NO_WAIT = RetryPolicy(max_retries=2, base_delay=0.0)
+
+
+def test_retries_rate_limits_then_succeeds():
+    primary = FlakyProvider("primary", [StatusError(429), StatusError(503)])
+    llm = ResilientProvider([primary], retry=NO_WAIT)
+    assert llm.complete(system_prompt="s", user_prompt="u") == "primary"
+    assert primary.calls == 3
+
+
+def test_fails_over_once_retries_are_spent():
+    primary = FlakyProvider("primary", [StatusError(503)] * 3)
+    backup = FlakyProvider("backup", [])
+    llm = ResilientProvider([primary, backup], retry=NO_WAIT)
+    assert asyncio.run(llm.acomplete(system_prompt="s", user_prompt="u")) == "backup"
+    assert primary.calls == 3
+
+
+def test_non_retryable_error_is_raised_without_retry_or_failover():
+    primary = FlakyProvider("primary", [RuntimeError("wrapped")])
+    primary.failures[0].__cause__ = StatusError(401)
+    backup = FlakyProvider("backup", [])
+    llm = ResilientProvider([primary, backup], retry=NO_WAIT)
+    with pytest.raises(RuntimeError, match="wrapped"):
+        asyncio.run(llm.acomplete(system_prompt="s", user_prompt="u"))
+    assert (primary.calls, backup.calls) == (1, 0)
+
+
+def test_token_cost_reserves_the_provider_default_cap():
+    class CappedProvider(FlakyProvider):
+        max_tokens = 1200
+
+    llm = ResilientProvider([CappedProvider("capped", [])], retry=NO_WAIT)
+    provider = llm.providers[0]
+    assert llm._token_cost(provider, "ssss", "uuuu", None) == 1202
+    assert llm._token_cost(provider, "ssss", "uuuu", 100) == 102
+
+
+def test_raises_last_error_when_chain_exhausted():
+    primary = FlakyProvider("primary", [StatusError(500)] * 3)
+    llm = ResilientProvider([primary], retry=NO_WAIT, rate_limits={"primary": RateLimits()})
+    try:
+        llm.complete(system_prompt="s", user_prompt="u")
+    except StatusError as e:
+        assert e.status_code == 500
+    else:
+        raise AssertionError("expected StatusError")
+
+
+def test_token_bucket_reports_wait_once_empty():
+    bucket = TokenBucket(per_minute=60)
+    assert bucket.reserve(60) == 0.0
+    assert 0.9 < bucket.reserve(1) <= 1.0
+
+
+def test_retry_after_is_honoured_beyond_max_delay():
+    policy = RetryPolicy(base_delay=1.0, max_delay=30.0)
+    assert policy.delay(0, retry_after=90.0) == 90.0
+    assert all(policy.delay(10) <= 30.0 for _ in range(20))
+    assert policy.delay(0, retry_after=2.0) == 2.0
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Tests for concurrent per-section rewriting."""
+
+import asyncio
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from resume_ai.providers.base import LLMProvider
+from resume_ai.rewrite import SectionRewriter, split_units
+
+SAMPLE = json.loads((Path(__file__).parent / "samples" / "sample_structured.json").read_text(encoding="utf-8"))
+
+
+class ShoutingProvider(LLMProvider):
+    """Echo the unit back with upper-cased text and an attempted fabrication."""
+
+    def complete(self, *, system_prompt, user_prompt, temperature=0.2, max_tokens=None):
+        time.sleep(0.2)
+        unit = json.loads(re.search(r"INPUT JSON:\s*(\{.*\})", user_prompt, re.DOTALL).group(1))
+        if "summary" in unit:
+            return json.dumps({"summary": unit["summary"].upper()})
+        unit["bullets"] = [b.upper() for b in unit["bullets"]]
+        unit["company"] = "Invented Corp"
+        return "```json\n" + json.dumps(unit) + "\n```"
+
+
+def test_split_units_skips_contact_and_skills():
+    kinds = [(u.kind, u.index) for u in split_units(SAMPLE)]
+    assert kinds == [("summary", None), ("experience", 0), ("project", 0)]
+
+
+def test_rewrite_runs_units_concurrently_and_keeps_facts():
+    rewriter = SectionRewriter(ShoutingProvider())
+    started = time.perf_counter()
+    result = rewriter.rewrite(SAMPLE)
+    assert time.perf_counter() - started < 0.5
+    assert result["summary"] == SAMPLE["summary"].upper()
+    assert result["experience"][0]["bullets"] == [b.upper() for b in SAMPLE["experience"][0]["bullets"]]
+    assert result["experience"][0]["company"] == "Insight Labs"
+    assert result["contact"] == SAMPLE["contact"]
+    assert result["skills"] == SAMPLE["skills"]
+    assert SAMPLE["summary"] != result["summary"]
+
+
+def test_async_rewrite_matches_sync():
+    rewriter = SectionRewriter(ShoutingProvider())
+    assert asyncio.run(rewriter.arewrite(SAMPLE)) == rewriter.rewrite(SAMPLE)
+
+
+class FlakyProvider(LLMProvider):
+    """Answers the summary with prose, fails jobs upstream, echoes projects; tracks async concurrency."""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+
+    def complete(self, *, system_prompt, user_prompt, temperature=0.2, max_tokens=None):
+        unit = json.loads(re.search(r"INPUT JSON:\s*(\{.*\})", user_prompt, re.DOTALL).group(1))
+        if "summary" in unit:
+            return "Sorry, I cannot help with that."
+        if "company" in unit:
+            raise RuntimeError("upstream down")
+        return json.dumps(unit)
+
+    async def acomplete(self, **kwargs):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(0.01)
+            return self.complete(**kwargs)
+        finally:
+            self.active -= 1
+
+
+def test_unparseable_unit_is_kept_and_provider_errors_propagate(caplog):
+    no_jobs = {**SAMPLE, "experience": []}
+    with caplog.at_level("WARNING", logger="resume_ai.rewrite"):
+        result = SectionRewriter(FlakyProvider()).rewrite(no_jobs)
+    assert result["summary"] == SAMPLE["summary"]
+    assert "summary" in caplog.text
+    with pytest.raises(RuntimeError, match="upstream down"):
+        SectionRewriter(FlakyProvider()).rewrite(SAMPLE)
+    with pytest.raises(RuntimeError, match="upstream down"):
+        asyncio.run(SectionRewriter(FlakyProvider()).arewrite(SAMPLE))
+
+
+def test_async_rewrite_respects_max_workers():
+    provider = FlakyProvider()
+    many = {**SAMPLE, "experience": [], "projects": SAMPLE["projects"] * 6}
+    asyncio.run(SectionRewriter(provider, max_workers=2).arewrite(many))
+    assert provider.peak == 2
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""Tests for the HTTP service mode."""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from resume_ai.pipeline import ResumeProcessor
+from resume_ai.providers.base import LLMProvider
+from resume_ai.providers.bounded_provider import BoundedProvider
+from resume_ai.server import ResumeServer, ResumeService, Singleflight
+from resume_ai.store import input_key
+
+RESUME = {"contact": {"full_name": "Ann Lee"}, "summary": "Engineer", "skills": ["Python"]}
+
+
+class SlowEchoProvider(LLMProvider):
+    """Echoes the rewrite input after a delay, tracking concurrency."""
+
+    def __init__(self, latency: float = 0.1, fail: bool = False):
+        self.latency = latency
+        self.fail = fail
+        self.calls = 0
+        self.active = 0
+        self.peak = 0
+
+    def complete(self, **kwargs):
+        raise NotImplementedError
+
+    async def acomplete(self, *, system_prompt, user_prompt, temperature=0.2, max_tokens=None):
+        self.calls += 1
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.active -= 1
+        if self.fail:
+            raise RuntimeError("upstream down")
+        return user_prompt[user_prompt.index("{"):user_prompt.rindex("}") + 1]
+
+
+async def request(port, method, path, body=b"", content_type="application/json"):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: test\r\nContent-Type: {content_type}\r\n"
+        f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode() + body
+    )
+    await writer.drain()
+    raw = await reader.read()
+    writer.close()
+    head, _, payload = raw.partition(b"\r\n\r\n")
+    status = int(head.split()[1])
+    headers = dict(line.split(": ", 1) for line in head.decode().split("\r\n")[1:])
+    return status, headers, payload
+
+
+def with_server(provider, scenario):
+    async def main():
+        server = await ResumeServer(ResumeService(ResumeProcessor(provider))).start("127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            return await scenario(port)
+
+    return asyncio.run(main())
+
+
+def test_identical_builds_share_one_upstream_call():
+    provider = SlowEchoProvider()
+    body = json.dumps({"input": RESUME}).encode()
+
+    async def scenario(port):
+        return await asyncio.gather(*(request(port, "POST", "/build", body) for _ in range(5)))
+
+    responses = with_server(provider, scenario)
+    assert provider.calls == 1
+    payloads = [json.loads(payload) for _, _, payload in responses]
+    assert {status for status, _, _ in responses} == {200}
+    assert {p["job"] for p in payloads} == {input_key(json.dumps(RESUME))}
+    assert all(p["status"] == "done" and p["resume"]["contact"]["full_name"] == "Ann Lee" for p in payloads)
+
+
+def test_background_build_and_job_status():
+    provider = SlowEchoProvider()
+
+    async def scenario(port):
+        status, _, payload = await request(port, "POST", "/build?wait=0", json.dumps(RESUME).encode(), "text/plain")
+        job = json.loads(payload)
+        assert status == 202 and job["status"] == "running"
+        await asyncio.sleep(0.3)
+        status, _, payload = await request(port, "GET", f"/jobs/{job['job']}")
+        assert status == 200 and json.loads(payload)["status"] == "done"
+        # A repeat of a finished build is answered without another call
+        status, _, _ = await request(port, "POST", "/build", json.dumps(RESUME).encode(), "text/plain")
+        assert status == 200
+        return await request(port, "GET", "/jobs/unknown")
+
+    status, _, _ = with_server(provider, scenario)
+    assert status == 404 and provider.calls == 1
+
+
+def test_failed_build_reports_error():
+    async def scenario(port):
+        return await request(port, "POST", "/build", json.dumps({"input": "Plain text resume"}).encode())
+
+    status, _, payload = with_server(SlowEchoProvider(latency=0, fail=True), scenario)
+    assert status == 500 and json.loads(payload)["status"] == "failed"
+    assert "upstream down" in json.loads(payload)["error"]
+
+
+def test_render_from_json():
+    async def scenario(port):
+        ok = await request(port, "POST", "/render?format=docx", json.dumps(RESUME).encode())
+        bad = await request(port, "POST", "/render?format=docx", b'{"contact": 5}')
+        unknown = await request(port, "POST", "/render?format=xls", json.dumps(RESUME).encode())
+        wrong_method = await request(port, "GET", "/render")
+        return ok, bad, unknown, wrong_method
+
+    ok, bad, unknown, wrong_method = with_server(SlowEchoProvider(), scenario)
+    assert ok[0] == 200 and ok[2][:2] == b"PK"
+    assert ok[1]["Content-Type"].endswith("wordprocessingml.document")
+    assert (bad[0], unknown[0], wrong_method[0]) == (400, 400, 405)
+
+
+def test_bounded_provider_caps_concurrency():
+    upstream = SlowEchoProvider(latency=0.05)
+    provider = BoundedProvider(upstream, max_in_flight=2)
+
+    async def scenario(port):
+        bodies = [json.dumps({"input": {**RESUME, "summary": f"v{i}"}}).encode() for i in range(6)]
+        return await asyncio.gather(*(request(port, "POST", "/build", body) for body in bodies))
+
+    responses = with_server(provider, scenario)
+    assert [status for status, _, _ in responses] == [200] * 6
+    assert upstream.calls == 6 and upstream.peak == 2 and provider.in_flight == 0
+
+
+def test_singleflight_survives_cancelled_waiter():
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "result"
+
+    async def main():
+        flight = Singleflight()
+        first = asyncio.ensure_future(flight.do("k", work))
+        second = asyncio.ensure_future(flight.do("k", work))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second, "k" in flight
+
+    assert asyncio.run(main()) == ("result", False)
+    assert calls == [1]
+
+
+async def raw_request(port, head: bytes, body: bytes = b""):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(head + b"\r\n\r\n" + body)
+    await writer.drain()
+    raw = await reader.read()
+    writer.close()
+    head, _, payload = raw.partition(b"\r\n\r\n")
+    return int(head.split()[1]), head.decode(), payload
+
+
+def test_malformed_requests_are_rejected():
+    provider = SlowEchoProvider()
+
+    async def scenario(port):
+        start = b"POST /build HTTP/1.1\r\nHost: test\r\nContent-Type: text/plain\r\n"
+        return await asyncio.gather(
+            raw_request(port, start + b"Content-Length: -1"),
+            raw_request(port, start + b"Content-Length: ten"),
+            raw_request(port, start + b"Transfer-Encoding: chunked", b"5\r\nhello\r\n0\r\n\r\n"),
+            raw_request(port, start + b"Content-Length: 2\r\nConnection: close", b"\xff\xfe"),
+        )
+
+    negative, garbage, chunked, latin1 = with_server(provider, scenario)
+    assert (negative[0], garbage[0], chunked[0], latin1[0]) == (400, 400, 501, 400)
+    # Without a trustworthy body length the connection cannot be reused
+    assert "Connection: close" in chunked[1]
+    assert "UTF-8" in json.loads(latin1[2])["error"]
+    assert provider.calls == 0
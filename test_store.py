@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Tests for the persistent resume store."""
+
+import asyncio
+import json
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from resume_ai.config import StoreSettings
+from resume_ai.models import Resume
+from resume_ai.pipeline import ResumeProcessor
+from resume_ai.providers.base import LLMProvider
+from resume_ai.store import ResumeStore, fts_query, index_terms, input_key, store_from_settings
+
+
+def make_resume(name, title, company, skills, tech=(), bullets=()):
+    return Resume.model_validate({
+        "contact": {"full_name": name},
+        "experience": [{"title": title, "company": company, "technologies": list(tech), "bullets": list(bullets)}],
+        "skills": list(skills),
+    })
+
+
+ANN = make_resume("Ann Lee", "Backend Engineer", "Acme", ["Python", "Machine Learning"], ["PostgreSQL"],
+                  ["Scaled the billing service to 10k requests per second"])
+BOB = make_resume("Bob Ray", "Frontend Developer", "Globex", ["React", "CSS"], ["TypeScript"],
+                  ["Rebuilt the checkout flow in React"])
+CID = make_resume("Cid Moe", "Data Engineer", "Acme", ["Python", "Spark"], ["C++"],
+                  ["Wrote Spark pipelines for billing analytics"])
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ResumeStore(tmp_path / "resumes.sqlite3")
+    store.put_many([("ann", ANN), ("bob", BOB), ("cid", CID)])
+    yield store
+    store.close()
+
+
+def names(hits):
+    return [hit.resume.contact.full_name for hit in hits]
+
+
+def test_roundtrip_and_replace(store):
+    assert len(store) == 3 and "ann" in store and "zed" not in store
+    assert store.get("ann").resume == ANN
+    store.put("ann", BOB)
+    assert len(store) == 3 and store.get("ann").resume == BOB
+    assert names(store.search(companies=["acme"])) == ["Cid Moe"]
+    assert store.delete("ann") and not store.delete("ann")
+    assert store.get("ann") is None and names(store.search("checkout")) == ["Bob Ray"]
+
+
+def test_term_filters_intersect_case_insensitively(store):
+    assert sorted(names(store.search(skills=["python"]))) == ["Ann Lee", "Cid Moe"]
+    assert names(store.search(skills=["PYTHON"], companies=["Acme"], titles=["data engineer"])) == ["Cid Moe"]
+    assert names(store.search(technologies=["c++"])) == ["Cid Moe"]
+    assert names(store.search(skills=["python", "react"])) == []
+    # Newest first without a text query
+    assert names(store.search()) == ["Cid Moe", "Bob Ray", "Ann Lee"]
+    assert store.term_counts("company") == [("acme", 2), ("globex", 1)]
+
+
+def test_full_text_ranks_and_combines_with_filters(store):
+    assert sorted(names(store.search("billing"))) == ["Ann Lee", "Cid Moe"]
+    assert names(store.search("billing", skills=["spark"])) == ["Cid Moe"]
+    assert set(names(store.search("engin*"))) == {"Ann Lee", "Cid Moe"}
+    assert names(store.search("Globex")) == ["Bob Ray"]
+    # Query syntax in user input is treated as plain words
+    assert names(store.search('react" (checkout -')) == ["Bob Ray"]
+    assert all(hit.rank is not None for hit in store.search("billing"))
+
+
+def test_helpers():
+    assert fts_query('C++ "quoted" pyth*') == '"C++" "quoted" "pyth"*'
+    assert ("technology", "postgresql") in index_terms(ANN) and ("title", "backend engineer") in index_terms(ANN)
+    assert input_key("  text\n") == input_key("text") != input_key("other")
+
+
+class EchoProvider(LLMProvider):
+    def complete(self, *, system_prompt, user_prompt, temperature=0.2, max_tokens=None):
+        return user_prompt[user_prompt.index("{"):user_prompt.rindex("}") + 1]
+
+    async def acomplete(self, **kwargs):
+        return self.complete(**kwargs)
+
+
+def test_build_saves_under_input_hash(tmp_path):
+    store = ResumeStore(tmp_path / "resumes.sqlite3")
+    processor = ResumeProcessor(EchoProvider(), store=store)
+    raw = json.dumps({"contact": {"name": "Ann Lee"}, "skills": ["Go"]})
+    resume = processor.build(raw)
+    assert store.get(input_key(raw)).resume == resume
+    resume = asyncio.run(processor.abuild(raw + "\n"))
+    assert len(store) == 1 and names(store.search(skills=["go"])) == ["Ann Lee"]
+
+
+def test_concurrent_writers(tmp_path):
+    store = ResumeStore(tmp_path / "resumes.sqlite3")
+
+    def write(n):
+        for i in range(20):
+            store.put(f"{n}-{i}", ANN)
+
+    threads = [threading.Thread(target=write, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(store) == 80 and len(store.search(skills=["python"], limit=100)) == 80
+
+
+def test_store_is_opt_in(tmp_path, monkeypatch):
+    path = tmp_path / "resumes.sqlite3"
+    monkeypatch.delenv("RESUME_AI_STORE", raising=False)
+    monkeypatch.setenv("RESUME_AI_STORE_PATH", str(path))
+    assert store_from_settings() is None and not path.exists()
+    # An explicit --store wins over the environment, and --no-store the other way round
+    explicit = store_from_settings(enabled=True)
+    assert explicit.path == path
+    explicit.close()
+    monkeypatch.setenv("RESUME_AI_STORE", "1")
+    assert StoreSettings.from_env().enabled
+    assert store_from_settings(enabled=False) is None
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""Tests for incremental section parsing of streamed JSON."""
+
+import json
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from resume_ai.streaming import SectionStreamParser, iter_sections
+
+SAMPLE = (Path(__file__).parent / "samples" / "sample_structured.json").read_text(encoding="utf-8")
+
+
+def test_sections_emitted_regardless_of_chunk_size():
+    text = "Here you go:\n```json\n" + SAMPLE + "\n```"
+    expected = json.loads(SAMPLE)
+    for size in (1, 5, 64, len(text)):
+        chunks = [text[i:i + size] for i in range(0, len(text), size)]
+        events = list(iter_sections(chunks))
+        sections = {e.section: e.value for e in events if e.index is None}
+        assert sections == expected
+        skills = [e.value for e in events if e.section == "skills" and e.index is not None]
+        assert skills == expected["skills"]
+
+
+def test_section_available_before_stream_finishes():
+    parser = SectionStreamParser(stage="rewrite")
+    events = parser.feed('{"summary": "Builds, ships } and [tests]", "experience": [{"title": "Dev"}, ')
+    assert [(e.section, e.index) for e in events] == [("summary", None), ("experience", 0)]
+    assert events[0].value == "Builds, ships } and [tests]"
+    assert events[0].stage == "rewrite"
+    assert not parser.done
+    parser.feed('{"title": "Lead"}]}')
+    assert parser.done
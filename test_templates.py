@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""Tests for the shared template registry."""
+
+import sys
+import threading
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+import resume_ai.templating
+from resume_ai.config import TemplateSettings
+from resume_ai.models import Resume
+from resume_ai.templating import TemplateRegistry, get_registry
+from resume_ai.templating.templates import get_template_env
+
+
+def test_registry_env_is_shared_across_threads(tmp_path, monkeypatch):
+    # A fresh global registry whose bytecode cache stays out of the real ~/.cache
+    cache_dir = tmp_path / "jinja"
+    monkeypatch.setenv("RESUME_AI_TEMPLATE_CACHE_DIR", str(cache_dir))
+    monkeypatch.setattr(resume_ai.templating, "_registry", None)
+    envs = []
+    threads = [threading.Thread(target=lambda: envs.append(get_template_env())) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert all(env is get_registry().env for env in envs)
+    assert not get_registry().env.auto_reload or get_registry().settings.auto_reload
+    assert get_registry().settings.cache_dir == str(cache_dir) and any(cache_dir.iterdir())
+
+
+def test_registry_precompiles_and_persists_bytecode(tmp_path):
+    cache_dir = tmp_path / "jinja"
+    registry = TemplateRegistry(settings=TemplateSettings(cache_dir=str(cache_dir)))
+    assert {"minimal", "corporate"} <= set(registry.names())
+    assert any(cache_dir.iterdir())
+
+    meta = registry.metadata("corporate")
+    assert meta.name == "corporate"
+    assert "experience" in meta.sections and "contact" in meta.sections
+
+    html = registry.get("minimal").render(resume=Resume.model_validate({"contact": {"full_name": "Jane Doe"}}))
+    assert "Jane Doe" in html
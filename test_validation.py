@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Tests for lenient one-pass resume validation."""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from resume_ai.json_extract import JSONExtractionError
+from resume_ai.models import Resume
+from resume_ai.pipeline import ResumeProcessor
+from resume_ai.providers.base import LLMProvider
+from resume_ai.validation import validate_completion, validate_resume, validate_resume_json
+
+SAMPLE_JSON = (Path(__file__).parent / "samples" / "sample_structured.json").read_text(encoding="utf-8")
+
+MESSY = {
+    "contact": None,
+    "summary": 42,
+    "experience": [
+        {"title": "Engineer", "company": {"name": "Acme"}, "start_date": 2020, "current": None, "technologies": ["Go", None]},
+        "not an entry",
+    ],
+    "education": {"institution": "State"},
+    "skills": ["Python", 3],
+    "certifications": ["AWS", {"name": "CKA", "issuer": ["CNCF"]}],
+    "languages": None,
+}
+
+
+def test_clean_completion_validates_without_issues():
+    resume, issues = validate_completion("Here you go:\n```json\n" + SAMPLE_JSON + "\n```")
+    assert issues == []
+    assert resume == Resume.model_validate_json(SAMPLE_JSON)
+
+
+def test_only_bad_fields_are_dropped_and_reported():
+    resume, issues = validate_resume(MESSY)
+    assert type(resume) is Resume
+    assert resume.contact.full_name is None
+    assert resume.summary == "42"
+    [job] = resume.experience
+    assert (job.title, job.company, job.start_date, job.current) == ("Engineer", None, "2020", False)
+    assert job.technologies == ["Go"]
+    assert resume.education == [] and resume.languages == []
+    assert resume.skills == ["Python", "3"]
+    assert [(c.name, c.issuer) for c in resume.certifications] == [("CKA", None)]
+
+    locs = {issue.loc for issue in issues}
+    assert {("contact",), ("experience", 0, "company"), ("experience", 1), ("certifications", 0)} <= locs
+    assert validate_resume_json(json.dumps(MESSY))[0] == resume
+
+
+def test_repairable_and_broken_completions():
+    resume, _ = validate_completion('{"contact": {"full_name": "Ann"}, "skills": ["Go",],}')
+    assert resume.contact.full_name == "Ann" and resume.skills == ["Go"]
+    with pytest.raises(JSONExtractionError):
+        validate_completion('{"contact": {"full_name": "Ann"}, "experience": [{"title": "x" "y"}], "skills": ["Go"]}')
+
+
+class MessyRewriteProvider(LLMProvider):
+    def __init__(self):
+        self.calls = 0
+
+    def complete(self, *, system_prompt, user_prompt, temperature=0.2, max_tokens=None):
+        self.calls += 1
+        return json.dumps(MESSY)
+
+
+def test_processor_builds_from_messy_output_in_one_call():
+    provider = MessyRewriteProvider()
+    resume = ResumeProcessor(provider).process(json.dumps({"contact": {"full_name": "Ann"}, "summary": "Hi"}))
+    assert provider.calls == 1
+    assert resume.experience[0].title == "Engineer"
+    assert resume.skills == ["Python", "3"]